@@ -0,0 +1,104 @@
+"""Compare payload sizes of the terminated, front-coded and candidate-bitmap encodings.
+
+Run from the repository root::
+
+    python benchmarks/encoding_sizes.py [--results-dir results]
+"""
+from __future__ import annotations
+
+import argparse
+import re
+import sys
+import time
+from datetime import date
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from nytbee_solver.archive import parse_results_file
+from nytbee_solver.encoding import (
+    decode_candidate_bitmap,
+    decode_front_coded,
+    decode_terminated,
+    encode_candidate_bitmap,
+    encode_front_coded,
+    get_dictionary_tag,
+)
+from nytbee_solver.solver import solve_spelling_bee
+
+_DATE_RE = re.compile(r"^Date: (\d{4}-\d{2}-\d{2})$", re.MULTILINE)
+
+
+def _load_payloads(results_dir: Path) -> list[tuple[str, str, str, str]]:
+    payloads = []
+    for encoded_path in sorted(results_dir.glob("*.encoded.txt")):
+        stem = encoded_path.name[: -len(".encoded.txt")]
+        hint_path = results_dir / f"{stem}.txt"
+        if not hint_path.exists():
+            continue
+        text = hint_path.read_text(encoding="utf-8")
+        date_match = _DATE_RE.search(text)
+        puzzle_date = date.fromisoformat(date_match.group(1)) if date_match else date.min
+        puzzle = parse_results_file(text, puzzle_date)
+        payload = encoded_path.read_text(encoding="utf-8").strip()
+        payloads.append((encoded_path.name, payload, puzzle.letters, puzzle.required))
+    return payloads
+
+
+def _time_decode(decoder, payloads: list[tuple], repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for payload in payloads:
+            decoder(*payload)
+    return (time.perf_counter() - start) / repeat
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--results-dir", type=Path, default=ROOT / "results")
+    parser.add_argument("--wordlist", type=Path, default=ROOT / "nytbee_dict.txt")
+    parser.add_argument("--repeat", type=int, default=5, help="Decode timing repetitions.")
+    parser.add_argument("--verbose", action="store_true", help="Print per-file sizes.")
+    args = parser.parse_args()
+
+    tag = get_dictionary_tag(args.wordlist)
+    terminated = []
+    front_coded = []
+    bitmaps = []
+    for name, payload, letters, required in _load_payloads(args.results_dir):
+        words = decode_terminated(payload, letters, required)
+        candidates = solve_spelling_bee(letters, args.wordlist)[0]
+        compact = encode_front_coded(words, letters, required)
+        bitmap = encode_candidate_bitmap(words, letters, required, candidates, tag)
+        if decode_front_coded(compact, letters, required) != words:
+            raise SystemExit(f"{name}: front-coded round trip failed")
+        if decode_candidate_bitmap(bitmap, letters, required, candidates, tag) != words:
+            raise SystemExit(f"{name}: candidate-bitmap round trip failed")
+        terminated.append((payload, letters, required))
+        front_coded.append((compact, letters, required))
+        bitmaps.append((bitmap, letters, required, candidates, tag))
+        if args.verbose:
+            print(f"{name:28} {len(payload):6d} {len(compact):6d} {len(bitmap):6d} bytes")
+
+    if not terminated:
+        raise SystemExit(f"No encoded results found in {args.results_dir}")
+    total_old = sum(len(entry[0]) for entry in terminated)
+    print(f"files:             {len(terminated)}")
+    for label, decoder, payloads in (
+        ("terminated", decode_terminated, terminated),
+        ("front-coded", decode_front_coded, front_coded),
+        ("candidate-bitmap", decode_candidate_bitmap, bitmaps),
+    ):
+        total = sum(len(entry[0]) for entry in payloads)
+        elapsed = _time_decode(decoder, payloads, args.repeat)
+        print(
+            f"{label + ':':18} {total:6d} bytes ({100 * total / total_old:5.1f}%), "
+            f"decode {1000 * elapsed:.2f} ms for all files"
+        )
+
+
+if __name__ == "__main__":
+    main()
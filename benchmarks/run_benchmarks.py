@@ -0,0 +1,292 @@
+"""Offline benchmark suite for the solver, encoder and scraper hot paths.
+
+Run from the repository root::
+
+    python benchmarks/run_benchmarks.py --output benchmark.json
+    python benchmarks/run_benchmarks.py --compare benchmark.json
+
+Each benchmark reports the best and median time per operation over several
+repeats. ``--compare`` exits non-zero when a benchmark's median is slower than
+the baseline by more than ``--threshold``.
+"""
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import platform
+import plistlib
+import random
+import statistics
+import sys
+import time
+import timeit
+from contextlib import redirect_stdout
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Callable, Optional
+from unittest.mock import patch
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from nytbee_scrapper import scraper
+from nytbee_solver import encoding, solver, streaming
+from nytbee_solver.archive import parse_results_file
+from nytbee_solver.hints import HintSummary
+
+WORDLIST = ROOT / "nytbee_dict.txt"
+WEBARCHIVE = ROOT / "Spelling Bee Answers.webarchive"
+RESULTS_DIR = ROOT / "results"
+DEFAULT_THRESHOLD = 1.25
+
+BENCHMARKS: dict[str, Callable[[], Callable[[], object]]] = {}
+
+
+def benchmark(name: str):
+    """Register a setup function returning the callable to time.
+
+    A callable with a ``bytes`` attribute also reports throughput in MB/s.
+    """
+
+    def register(setup: Callable[[], Callable[[], object]]):
+        BENCHMARKS[name] = setup
+        return setup
+
+    return register
+
+
+def _random_letter_sets(count: int, seed: int = 7) -> list[str]:
+    rng = random.Random(seed)
+    return ["".join(rng.sample("abcdefghijklmnopqrstuvwxyz", 7)) for _ in range(count)]
+
+
+def _archive_puzzles() -> list[tuple[list[str], str, str]]:
+    puzzles = []
+    for hint_path in sorted(RESULTS_DIR.glob("????-??-??.txt")):
+        puzzle = parse_results_file(
+            hint_path.read_text(encoding="utf-8"), date.fromisoformat(hint_path.stem)
+        )
+        puzzles.append((puzzle.words, puzzle.letters, puzzle.required))
+    return puzzles
+
+
+def _webarchive_html() -> str:
+    with WEBARCHIVE.open("rb") as handle:
+        return plistlib.load(handle)["WebMainResource"]["WebResourceData"].decode("utf-8")
+
+
+@benchmark("load_words")
+def _bench_load_words() -> Callable[[], object]:
+    return lambda: solver.load_words(WORDLIST)
+
+
+@benchmark("word_store_cold")
+def _bench_word_store_cold() -> Callable[[], object]:
+    def run() -> object:
+        solver._WORD_STORES.clear()
+        return solver.get_word_store(WORDLIST)
+
+    return run
+
+
+@benchmark("solve_spelling_bee_x100")
+def _bench_solve() -> Callable[[], object]:
+    letter_sets = _random_letter_sets(100)
+    solver.get_word_store(WORDLIST)
+    return lambda: [solver.solve_spelling_bee(letters, WORDLIST) for letters in letter_sets]
+
+
+@benchmark("solve_many_x100")
+def _bench_solve_many() -> Callable[[], object]:
+    letter_sets = _random_letter_sets(100)
+    solver.get_word_store(WORDLIST)
+    return lambda: solver.solve_many(letter_sets, WORDLIST)
+
+
+@benchmark("encode_terminated_archive")
+def _bench_encode() -> Callable[[], object]:
+    puzzles = _archive_puzzles()
+    return lambda: encoding.encode_many(puzzles)
+
+
+@benchmark("decode_terminated_archive")
+def _bench_decode() -> Callable[[], object]:
+    payloads = [
+        (encoding.encode_terminated(words, letters, required), letters, required)
+        for words, letters, required in _archive_puzzles()
+    ]
+    return lambda: encoding.decode_many(payloads)
+
+
+@benchmark("decode_front_coded_archive")
+def _bench_decode_front_coded() -> Callable[[], object]:
+    payloads = [
+        (encoding.encode_front_coded(words, letters, required), letters, required)
+        for words, letters, required in _archive_puzzles()
+    ]
+    return lambda: [encoding.decode_front_coded(*payload) for payload in payloads]
+
+
+@benchmark("extract_answer_list_webarchive")
+def _bench_extract() -> Callable[[], object]:
+    html = _webarchive_html()
+    return lambda: scraper.extract_answer_list(html)
+
+
+@benchmark("extract_answer_list_stream_webarchive")
+def _bench_extract_stream() -> Callable[[], object]:
+    data = _webarchive_html().encode("utf-8")
+    return lambda: scraper.extract_answer_list_from_stream(io.BytesIO(data))
+
+
+@benchmark("print_hint_page")
+def _bench_print_hint_page() -> Callable[[], object]:
+    words, pangrams, letters, required = solver.solve_spelling_bee("mafirng", WORDLIST)
+
+    def run() -> object:
+        with redirect_stdout(io.StringIO()):
+            solver.print_hint_page(words, pangrams, letters, required)
+
+    return run
+
+
+@benchmark("hint_summary_json")
+def _bench_hint_summary_json() -> Callable[[], object]:
+    solution = solver.solve_spelling_bee("mafirng", WORDLIST)
+    return lambda: HintSummary.from_solution(*solution).to_json()
+
+
+@benchmark("solve_streaming_wordlist")
+def _bench_solve_streaming() -> Callable[[], object]:
+    def run() -> object:
+        return streaming.solve_streaming("mafirng", WORDLIST)
+
+    run.bytes = WORDLIST.stat().st_size  # type: ignore[attr-defined]
+    return run
+
+
+@benchmark("collect_word_counts_30_days")
+def _bench_collect_word_counts() -> Callable[[], object]:
+    html = _webarchive_html()
+    start = date.today() - timedelta(days=60)
+
+    def run() -> object:
+        with patch.object(scraper, "fetch_html", return_value=html):
+            return scraper.collect_word_counts(start, 30)
+
+    return run
+
+
+def run_benchmarks(
+    names: list[str], repeat: int = 5, min_time: float = 0.2
+) -> dict[str, dict[str, float]]:
+    """Time each named benchmark and return per-operation statistics in seconds."""
+    results = {}
+    for name in names:
+        function = BENCHMARKS[name]()
+        timer = timeit.Timer(function)
+        number, _ = timer.autorange()
+        number = max(1, int(number * min_time / 0.2))
+        samples = [elapsed / number for elapsed in timer.repeat(repeat=repeat, number=number)]
+        results[name] = {
+            "best": min(samples),
+            "median": statistics.median(samples),
+            "stdev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+            "loops": number,
+            "repeat": repeat,
+        }
+        if hasattr(function, "bytes"):
+            results[name]["mb_per_second"] = function.bytes / 1e6 / results[name]["median"]
+    return results
+
+
+def compare(
+    results: dict[str, dict[str, float]],
+    baseline: dict[str, dict[str, float]],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> list[str]:
+    """Return the names of benchmarks whose median regressed past ``threshold``."""
+    regressions = []
+    for name, stats in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            continue
+        if stats["median"] > previous["median"] * threshold:
+            regressions.append(name)
+    return regressions
+
+
+def _format_seconds(seconds: float) -> str:
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:8.2f} {unit}"
+    return f"{seconds / 1e-9:8.2f} ns"
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", type=Path, default=None, help="Write results as JSON.")
+    parser.add_argument(
+        "--compare", type=Path, default=None, help="Baseline JSON written by --output."
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Slowdown ratio counted as a regression (default: %(default)s).",
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="Timing repeats per benchmark.")
+    parser.add_argument(
+        "--min-time",
+        type=float,
+        default=0.2,
+        help="Approximate seconds spent in each repeat (default: %(default)s).",
+    )
+    parser.add_argument(
+        "--filter", default=None, help="Only run benchmarks whose name contains this text."
+    )
+    parser.add_argument("--list", action="store_true", help="List benchmark names and exit.")
+    args = parser.parse_args(argv)
+
+    names = [name for name in BENCHMARKS if args.filter is None or args.filter in name]
+    if args.list:
+        print("\n".join(names))
+        return 0
+
+    results = run_benchmarks(names, repeat=args.repeat, min_time=args.min_time)
+    baseline = {}
+    if args.compare is not None:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))["benchmarks"]
+
+    for name, stats in results.items():
+        line = (
+            f"{name:40} {_format_seconds(stats['median'])}"
+            f"  (best {_format_seconds(stats['best'])})"
+        )
+        if "mb_per_second" in stats:
+            line += f"  {stats['mb_per_second']:.1f} MB/s"
+        if name in baseline:
+            line += f"  x{stats['median'] / baseline[name]['median']:.2f} vs baseline"
+        print(line)
+
+    if args.output is not None:
+        report = {
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "benchmarks": results,
+        }
+        args.output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+
+    regressions = compare(results, baseline, args.threshold)
+    if regressions:
+        print(f"Regressed beyond x{args.threshold}: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
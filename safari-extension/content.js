@@ -1,19 +1,33 @@
 /**
- * Load the bundled wordlist from the extension package.
- * @returns {Promise<Set<string>>} Set of words.
+ * Bitmask of the letters a-z used by a word, or -1 for any other character.
+ * @param {Iterable<string>} letters
+ * @returns {number}
  */
-async function loadWordList() {
-  const wordListUrl = chrome.runtime.getURL("wordlist/nytbee_dict.txt");
-  const response = await fetch(wordListUrl);
+function letterMask(letters) {
+  let mask = 0;
+  for (const character of letters) {
+    const index = character.charCodeAt(0) - 97;
+    if (index < 0 || index > 25) {
+      return -1;
+    }
+    mask |= 1 << index;
+  }
+  return mask;
+}
+
+/**
+ * Load the bundled index shard holding every word that contains `letter`.
+ * Shards are built by `python -m nytbee_solver.extension_index`.
+ * @param {string} letter
+ * @returns {Promise<Array<[number, string]>>} Letter masks with space-separated words.
+ */
+async function loadWordGroups(letter) {
+  const shardUrl = chrome.runtime.getURL(`wordlist/index/${letter}.json`);
+  const response = await fetch(shardUrl);
   if (!response.ok) {
-    throw new Error(`Failed to load wordlist: ${response.status}`);
+    throw new Error(`Failed to load wordlist shard: ${response.status}`);
   }
-  const text = await response.text();
-  const words = text
-    .split(/\r?\n/)
-    .map((line) => line.trim().toLowerCase())
-    .filter((line) => line.length > 0);
-  return new Set(words);
+  return response.json();
 }
 
 /**
@@ -42,41 +56,32 @@ function extractPuzzleLetters() {
 }
 
 /**
- * Filter the word list to valid Spelling Bee answers.
- * @param {Iterable<string>} words
+ * Filter the center letter's shard to valid Spelling Bee answers.
+ * @param {Array<[number, string]>} groups
  * @param {{center: string, outer: string[]}} letters
  * @returns {{valid: string[], pangrams: string[]}}
  */
-function findValidWords(words, letters) {
-  const allowed = new Set([letters.center, ...letters.outer]);
+function findValidWords(groups, letters) {
+  const allowed = letterMask([letters.center, ...letters.outer]);
   const valid = [];
   const pangrams = [];
+  if (allowed < 0) {
+    return { valid, pangrams };
+  }
 
-  for (const word of words) {
-    if (word.length < 4) {
-      continue;
-    }
-    if (!word.includes(letters.center)) {
-      continue;
-    }
-
-    let usesOnlyAllowed = true;
-    for (const character of word) {
-      if (!allowed.has(character)) {
-        usesOnlyAllowed = false;
-        break;
-      }
-    }
-    if (!usesOnlyAllowed) {
+  for (const [mask, words] of groups) {
+    if ((mask & ~allowed) !== 0) {
       continue;
     }
-
-    valid.push(word);
-    if ([...allowed].every((character) => word.includes(character))) {
-      pangrams.push(word);
+    const group = words.split(" ");
+    valid.push(...group);
+    if (mask === allowed) {
+      pangrams.push(...group);
     }
   }
 
+  valid.sort();
+  pangrams.sort();
   return { valid, pangrams };
 }
 
@@ -105,14 +110,14 @@ chrome.runtime.onMessage.addListener((message, _sender, sendResponse) => {
   }
 
   (async () => {
-    const wordList = await loadWordList();
     const letters = extractPuzzleLetters();
 
     if (!letters.center) {
       throw new Error("Unable to detect puzzle letters.");
     }
 
-    const results = findValidWords(wordList, letters);
+    const wordGroups = await loadWordGroups(letters.center);
+    const results = findValidWords(wordGroups, letters);
 
     if (message?.payload?.action === "fill") {
       submitWords(results.valid);
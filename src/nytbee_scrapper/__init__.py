@@ -1,21 +1,43 @@
-from .scraper import (
-    BASE_URL,
-    DEFAULT_URL,
-    USER_AGENT,
-    MainAnswerListParser,
-    collect_word_counts,
-    extract_answer_list,
-    fetch_html,
-    normalize_answer,
-)
+from importlib import import_module
+from typing import Any
 
-__all__ = [
-    "BASE_URL",
-    "DEFAULT_URL",
-    "USER_AGENT",
-    "MainAnswerListParser",
-    "collect_word_counts",
-    "extract_answer_list",
-    "fetch_html",
-    "normalize_answer",
-]
+# Submodules are imported on first attribute access so that importing the
+# package (or one light submodule) does not load the HTML parser, HTTP client
+# and SQLite bindings up front.
+_EXPORTS = {
+    "AnswerListScanner": ".scraper",
+    "BASE_URL": ".scraper",
+    "DEFAULT_URL": ".scraper",
+    "HttpClient": ".client",
+    "HttpResponse": ".client",
+    "USER_AGENT": ".client",
+    "MainAnswerListParser": ".scraper",
+    "RateLimiter": ".scraper",
+    "ResponseCache": ".cache",
+    "ScrapeStore": ".store",
+    "WordCountShard": ".shards",
+    "build_shards": ".shards",
+    "collect_word_counts": ".scraper",
+    "extract_answer_list": ".scraper",
+    "extract_answer_list_from_stream": ".scraper",
+    "fetch_html": ".scraper",
+    "get_default_client": ".client",
+    "load_totals": ".shards",
+    "merge_shards": ".shards",
+    "normalize_answer": ".scraper",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
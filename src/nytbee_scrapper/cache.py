@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import NamedTuple, Optional
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+NEGATIVE_STATUSES = {404, 410}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    url TEXT PRIMARY KEY,
+    status INTEGER NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    content_type TEXT,
+    body BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    fetched_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at);
+"""
+
+
+def get_default_cache_dir() -> Path:
+    return Path.home() / ".cache" / "nytbee_scrapper"
+
+
+class CacheEntry(NamedTuple):
+    url: str
+    status: int
+    etag: Optional[str]
+    last_modified: Optional[str]
+    content_type: Optional[str]
+    body: bytes
+    fetched_at: float
+
+    @property
+    def is_negative(self) -> bool:
+        return self.status in NEGATIVE_STATUSES
+
+    def age(self, now: Optional[float] = None) -> float:
+        return (time.time() if now is None else now) - self.fetched_at
+
+
+class ResponseCache:
+    """SQLite-backed store of fetched pages with validators and LRU eviction."""
+
+    def __init__(self, path: Path, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(str(path), check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.executescript(_SCHEMA)
+
+    @classmethod
+    def open_default(cls, max_bytes: int = DEFAULT_MAX_BYTES) -> "ResponseCache":
+        """Open the cache in the default per-user cache directory."""
+        return cls(get_default_cache_dir() / "responses.sqlite3", max_bytes=max_bytes)
+
+    def __enter__(self) -> "ResponseCache":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._connection.execute("SELECT COUNT(*) FROM responses").fetchone()
+        return count
+
+    def __contains__(self, url: object) -> bool:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT 1 FROM responses WHERE url = ?", (url,)
+            ).fetchone()
+        return row is not None
+
+    @property
+    def total_bytes(self) -> int:
+        with self._lock:
+            (total,) = self._connection.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+        return total
+
+    def fetched_at(self, url: str) -> Optional[float]:
+        """Return when ``url`` was last fetched or revalidated, if it is cached."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT fetched_at FROM responses WHERE url = ?", (url,)
+            ).fetchone()
+        return None if row is None else row[0]
+
+    def get(self, url: str) -> Optional[CacheEntry]:
+        """Return the cached response for ``url`` and mark it as recently used."""
+        with self._lock, self._connection:
+            row = self._connection.execute(
+                "SELECT status, etag, last_modified, content_type, body, fetched_at "
+                "FROM responses WHERE url = ?",
+                (url,),
+            ).fetchone()
+            if row is None:
+                return None
+            self._connection.execute(
+                "UPDATE responses SET accessed_at = ? WHERE url = ?", (time.time(), url)
+            )
+        status, etag, last_modified, content_type, body, fetched_at = row
+        return CacheEntry(
+            url, status, etag, last_modified, content_type, zlib.decompress(body), fetched_at
+        )
+
+    def put(
+        self,
+        url: str,
+        status: int,
+        body: bytes,
+        *,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        content_type: Optional[str] = None,
+    ) -> None:
+        """Store a response, evicting least recently used entries over the size cap."""
+        compressed = zlib.compress(body)
+        now = time.time()
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(url, status, etag, last_modified, content_type, body, size, fetched_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    url,
+                    status,
+                    etag,
+                    last_modified,
+                    content_type,
+                    compressed,
+                    len(compressed) + len(url),
+                    now,
+                    now,
+                ),
+            )
+            self._evict()
+
+    def refresh(
+        self, url: str, *, etag: Optional[str] = None, last_modified: Optional[str] = None
+    ) -> None:
+        """Record a successful revalidation of a cached response."""
+        now = time.time()
+        with self._lock, self._connection:
+            self._connection.execute(
+                "UPDATE responses SET fetched_at = ?, accessed_at = ?, "
+                "etag = COALESCE(?, etag), last_modified = COALESCE(?, last_modified) "
+                "WHERE url = ?",
+                (now, now, etag, last_modified, url),
+            )
+
+    def delete(self, url: str) -> None:
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM responses WHERE url = ?", (url,))
+
+    def _evict(self) -> None:
+        (total,) = self._connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+        if total <= self.max_bytes:
+            return
+        rows = self._connection.execute(
+            "SELECT url, size FROM responses ORDER BY accessed_at ASC"
+        ).fetchall()
+        evicted = []
+        for url, size in rows:
+            if total <= self.max_bytes:
+                break
+            evicted.append((url,))
+            total -= size
+        self._connection.executemany("DELETE FROM responses WHERE url = ?", evicted)
@@ -1,14 +1,31 @@
 from __future__ import annotations
 
 import argparse
+from contextlib import ExitStack
 from datetime import date
+import math
+from pathlib import Path
 import sys
 
-from .scraper import collect_word_counts
+
+def _positive_int(value: str) -> int:
+    number = int(value)
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value}")
+    return number
+
+
+def _positive_float(value: str) -> float:
+    number = float(value)
+    if not (number > 0 and math.isfinite(number)):
+        raise argparse.ArgumentTypeError(f"must be a positive number, got {value}")
+    return number
 
 
 def build_parser() -> argparse.ArgumentParser:
     """Build the argument parser for the scraper CLI."""
+    from .metrics import add_metrics_arguments
+
     parser = argparse.ArgumentParser(
         description="Scrape NYTBee answer lists and summarize word counts."
     )
@@ -18,6 +35,47 @@ def build_parser() -> argparse.ArgumentParser:
         default=30,
         help="Number of days to scrape, counting backwards from today (default: 30).",
     )
+    parser.add_argument(
+        "--workers",
+        type=_positive_int,
+        default=1,
+        help="Number of pages to fetch in parallel (default: 1).",
+    )
+    parser.add_argument(
+        "--rate-limit",
+        type=_positive_float,
+        default=None,
+        metavar="REQUESTS_PER_SECOND",
+        help="Maximum number of page requests started per second (default: unlimited).",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=None,
+        help="Directory for the HTTP response cache (default: ~/.cache/nytbee_scrapper).",
+    )
+    parser.add_argument(
+        "--cache-size",
+        type=_positive_float,
+        default=None,
+        metavar="MB",
+        help="Maximum size of the response cache in megabytes (default: 256).",
+    )
+    parser.add_argument(
+        "--store",
+        type=Path,
+        default=None,
+        help=(
+            "SQLite checkpoint file recording each scraped day. Days already stored "
+            "are not fetched again, so interrupted scrapes resume where they stopped."
+        ),
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Fetch every page from the network without reading or writing the cache.",
+    )
+    add_metrics_arguments(parser)
     return parser
 
 
@@ -26,6 +84,12 @@ def main() -> None:
     parser = build_parser()
     args = parser.parse_args()
 
+    from .cache import DEFAULT_MAX_BYTES, ResponseCache, get_default_cache_dir
+    from .client import HttpClient
+    from .metrics import metrics_from_args, report_metrics, use_metrics
+    from .scraper import collect_word_counts
+    from .store import ScrapeStore
+
     def render_progress(target_date: date, current: int, total: int) -> None:
         """Render the progress bar for the current scrape day."""
         if total <= 0:
@@ -42,11 +106,31 @@ def main() -> None:
         if current == total:
             sys.stdout.write("\n")
 
-    word_counts, scraped_urls, failed_urls = collect_word_counts(
-        starting_date=date.today(),
-        days_to_collect=args.days,
-        progress_callback=render_progress,
-    )
+    metrics = metrics_from_args(args)
+    with ExitStack() as stack:
+        stack.enter_context(use_metrics(metrics))
+        cache = None
+        if not args.no_cache:
+            cache_dir = args.cache_dir or get_default_cache_dir()
+            max_bytes = DEFAULT_MAX_BYTES
+            if args.cache_size is not None:
+                max_bytes = int(args.cache_size * 1024 * 1024)
+            cache = stack.enter_context(
+                ResponseCache(cache_dir / "responses.sqlite3", max_bytes=max_bytes)
+            )
+        store = stack.enter_context(ScrapeStore(args.store)) if args.store else None
+        client = stack.enter_context(
+            HttpClient(max_connections_per_host=args.workers, cache=cache)
+        )
+        word_counts, scraped_urls, failed_urls = collect_word_counts(
+            starting_date=date.today(),
+            days_to_collect=args.days,
+            progress_callback=render_progress,
+            max_workers=args.workers,
+            max_requests_per_second=args.rate_limit,
+            client=client,
+            store=store,
+        )
 
     print(f"Scraped {len(scraped_urls)} days.")
     print(f"Collected {len(word_counts)} unique words.")
@@ -54,6 +138,7 @@ def main() -> None:
         print("Failed URLs:")
         for url, error in failed_urls:
             print(f"- {url}: {error}")
+    report_metrics(metrics, args)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,291 @@
+from __future__ import annotations
+
+import gzip
+import http.client
+import io
+import threading
+import time
+import zlib
+from typing import TYPE_CHECKING, Mapping, NamedTuple, Optional
+from urllib.error import HTTPError, URLError
+from urllib.parse import urljoin, urlsplit
+
+from .metrics import get_metrics
+
+if TYPE_CHECKING:
+    from .cache import CacheEntry, ResponseCache
+
+USER_AGENT = "Mozilla/5.0 (compatible; NYTBeeScraper/1.0)"
+ACCEPT_ENCODING = "gzip, deflate"
+_REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+# Errors raised when a pooled keep-alive connection was closed by the server.
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.CannotSendRequest,
+    http.client.BadStatusLine,
+    BrokenPipeError,
+    ConnectionResetError,
+)
+
+
+class HttpResponse(NamedTuple):
+    url: str
+    status: int
+    headers: http.client.HTTPMessage
+    body: bytes
+    from_cache: bool = False
+    # Bytes received over the wire, before any content decoding.
+    transfer_size: int = 0
+
+    def text(self) -> str:
+        """Decode the body using the response charset, falling back to UTF-8."""
+        charset = self.headers.get_content_charset() or "utf-8"
+        return self.body.decode(charset, errors="replace")
+
+
+def decode_body(body: bytes, content_encoding: Optional[str]) -> bytes:
+    """Undo gzip or deflate content encoding."""
+    encoding = (content_encoding or "").strip().lower()
+    if encoding in {"gzip", "x-gzip"}:
+        return gzip.decompress(body)
+    if encoding == "deflate":
+        try:
+            return zlib.decompress(body)
+        except zlib.error:
+            # Some servers send raw deflate streams without the zlib header.
+            return zlib.decompress(body, -zlib.MAX_WBITS)
+    return body
+
+
+def _raise_for_status(url: str, status: int, headers: http.client.HTTPMessage, body: bytes) -> None:
+    if status >= 400:
+        raise HTTPError(
+            url, status, http.client.responses.get(status, ""), headers, io.BytesIO(body)
+        )
+
+
+class HttpClient:
+    """Keep-alive HTTP client with a per-host connection pool and compressed transfers.
+
+    With a ``cache``, responses are stored with their validators. Requests made with
+    ``revalidate=False``, or whose entry was fetched at or after ``fresh_after``, are
+    answered from the cache without touching the network; otherwise entries older
+    than ``cache_ttl`` seconds are revalidated with a conditional request. 404/410
+    responses are cached too and re-raised until they are ``cache_ttl`` old.
+    """
+
+    def __init__(
+        self,
+        *,
+        timeout: float = 20,
+        user_agent: str = USER_AGENT,
+        max_connections_per_host: int = 8,
+        max_redirects: int = 5,
+        cache: Optional[ResponseCache] = None,
+        cache_ttl: float = 600,
+    ) -> None:
+        self.timeout = timeout
+        self.user_agent = user_agent
+        self.max_connections_per_host = max_connections_per_host
+        self.max_redirects = max_redirects
+        self.cache = cache
+        self.cache_ttl = cache_ttl
+        self._idle: dict[tuple[str, str, int], list[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def __enter__(self) -> "HttpClient":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close every pooled connection."""
+        with self._lock:
+            idle, self._idle = self._idle, {}
+            self._closed = True
+        for connections in idle.values():
+            for connection in connections:
+                connection.close()
+
+    def _acquire(
+        self, key: tuple[str, str, int], timeout: float
+    ) -> tuple[http.client.HTTPConnection, bool]:
+        with self._lock:
+            connections = self._idle.get(key)
+            if connections:
+                connection = connections.pop()
+                connection.timeout = timeout
+                if connection.sock is not None:
+                    connection.sock.settimeout(timeout)
+                return connection, True
+        scheme, host, port = key
+        connection_class = (
+            http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        )
+        return connection_class(host, port, timeout=timeout), False
+
+    def _release(self, key: tuple[str, str, int], connection: http.client.HTTPConnection) -> None:
+        with self._lock:
+            if not self._closed:
+                connections = self._idle.setdefault(key, [])
+                if len(connections) < self.max_connections_per_host:
+                    connections.append(connection)
+                    return
+        connection.close()
+
+    def _request_once(
+        self, url: str, headers: Mapping[str, str], timeout: float
+    ) -> HttpResponse:
+        parts = urlsplit(url)
+        scheme = parts.scheme.lower()
+        if scheme not in {"http", "https"} or not parts.hostname:
+            raise URLError(f"unsupported URL: {url}")
+        port = parts.port or (443 if scheme == "https" else 80)
+        key = (scheme, parts.hostname, port)
+        target = parts.path or "/"
+        if parts.query:
+            target += f"?{parts.query}"
+        request_headers = {
+            "User-Agent": self.user_agent,
+            "Accept-Encoding": ACCEPT_ENCODING,
+            "Connection": "keep-alive",
+            **headers,
+        }
+
+        while True:
+            connection, reused = self._acquire(key, timeout)
+            try:
+                connection.request("GET", target, headers=request_headers)
+                response = connection.getresponse()
+                body = response.read()
+            except _STALE_CONNECTION_ERRORS as exc:
+                connection.close()
+                if reused:
+                    continue
+                raise URLError(exc) from exc
+            except (OSError, http.client.HTTPException) as exc:
+                connection.close()
+                raise URLError(exc) from exc
+            break
+
+        if response.will_close:
+            connection.close()
+        else:
+            self._release(key, connection)
+        transfer_size = len(body)
+        try:
+            body = decode_body(body, response.headers.get("Content-Encoding"))
+        except (OSError, zlib.error) as exc:
+            raise URLError(f"could not decode response from {url}: {exc}") from exc
+        return HttpResponse(
+            url, response.status, response.headers, body, transfer_size=transfer_size
+        )
+
+    def _request(
+        self, url: str, headers: Mapping[str, str], timeout: float
+    ) -> HttpResponse:
+        for _ in range(self.max_redirects + 1):
+            response = self._request_once(url, headers, timeout)
+            location = response.headers.get("Location")
+            if response.status in _REDIRECT_STATUSES and location:
+                url = urljoin(url, location)
+                continue
+            _raise_for_status(url, response.status, response.headers, response.body)
+            return response
+        raise URLError(f"too many redirects fetching {url}")
+
+    @staticmethod
+    def _cached_response(entry: CacheEntry) -> HttpResponse:
+        headers = http.client.HTTPMessage()
+        if entry.content_type:
+            headers["Content-Type"] = entry.content_type
+        _raise_for_status(entry.url, entry.status, headers, entry.body)
+        return HttpResponse(entry.url, entry.status, headers, entry.body, from_cache=True)
+
+    def get(
+        self,
+        url: str,
+        *,
+        timeout: Optional[float] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        revalidate: bool = True,
+        fresh_after: Optional[float] = None,
+    ) -> HttpResponse:
+        """Fetch ``url``, following redirects and raising ``HTTPError`` for error statuses."""
+        effective_timeout = self.timeout if timeout is None else timeout
+        request_headers = dict(headers or {})
+        metrics = get_metrics()
+        cached = self.cache.get(url) if self.cache is not None else None
+        if cached is not None:
+            final = fresh_after is not None and cached.fetched_at >= fresh_after
+            if not revalidate or final or cached.age() < self.cache_ttl:
+                metrics.record_fetch(url, 0.0, len(cached.body), cached.status, True)
+                return self._cached_response(cached)
+            if not cached.is_negative:
+                if cached.etag:
+                    request_headers["If-None-Match"] = cached.etag
+                if cached.last_modified:
+                    request_headers["If-Modified-Since"] = cached.last_modified
+
+        start = time.perf_counter()
+        try:
+            response = self._request(url, request_headers, effective_timeout)
+        except (HTTPError, URLError) as exc:
+            metrics.increment("fetch_errors_total")
+            if isinstance(exc, HTTPError) and self.cache is not None:
+                from .cache import NEGATIVE_STATUSES
+
+                if exc.code in NEGATIVE_STATUSES:
+                    self.cache.put(url, exc.code, b"")
+            raise
+        metrics.record_fetch(
+            url, time.perf_counter() - start, response.transfer_size, response.status, False
+        )
+
+        if self.cache is None:
+            return response
+        if response.status == 304 and cached is not None and not cached.is_negative:
+            self.cache.refresh(
+                url,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+            )
+            return self._cached_response(cached)
+        if response.status == 200:
+            self.cache.put(
+                url,
+                response.status,
+                response.body,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+                content_type=response.headers.get("Content-Type"),
+            )
+        return response
+
+    def fetch_html(
+        self,
+        url: str,
+        timeout: Optional[float] = None,
+        *,
+        revalidate: bool = True,
+        fresh_after: Optional[float] = None,
+    ) -> str:
+        """Fetch HTML content from a URL over a pooled connection."""
+        return self.get(
+            url, timeout=timeout, revalidate=revalidate, fresh_after=fresh_after
+        ).text()
+
+
+_default_client: Optional[HttpClient] = None
+_default_client_lock = threading.Lock()
+
+
+def get_default_client() -> HttpClient:
+    """Return the process-wide client shared by module-level helpers."""
+    global _default_client
+    with _default_client_lock:
+        if _default_client is None:
+            _default_client = HttpClient()
+        return _default_client
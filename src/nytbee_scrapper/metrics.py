@@ -0,0 +1,274 @@
+from __future__ import annotations
+
+import argparse
+import bisect
+import json
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Optional, Sequence, TextIO
+
+SECONDS_BUCKETS = (0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+BYTES_BUCKETS = (1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+PROMETHEUS_PREFIX = "nytbee"
+
+
+def _prometheus_value(value: float) -> str:
+    # Integers stay exact; floats use the shortest repr that round-trips.
+    return str(value) if isinstance(value, int) else repr(float(value))
+
+
+class Histogram:
+    """Cumulative-bucket histogram in the Prometheus style."""
+
+    def __init__(self, buckets: Sequence[float]) -> None:
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def merge(self, other: "Histogram") -> None:
+        if other.buckets != self.buckets:
+            raise ValueError("Cannot merge histograms with different buckets.")
+        self.counts = [mine + theirs for mine, theirs in zip(self.counts, other.counts)]
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+
+    def as_dict(self) -> dict[str, object]:
+        cumulative = 0
+        buckets = {}
+        for bound, count in zip([*self.buckets, float("inf")], self.counts):
+            cumulative += count
+            buckets["+Inf" if bound == float("inf") else _prometheus_value(bound)] = cumulative
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "mean": self.total / self.count if self.count else 0.0,
+            "max": self.max,
+            "buckets": buckets,
+        }
+
+
+class Metrics:
+    """Thread-safe counters, histograms and per-URL fetch records for one run."""
+
+    enabled = True
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.counters: dict[str, float] = {}
+        self.histograms: dict[str, Histogram] = {}
+        self.fetches: list[dict[str, object]] = []
+        self.started_at = time.time()
+
+    def __getstate__(self) -> dict[str, object]:
+        state = dict(self.__dict__)
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict[str, object]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def increment(self, name: str, amount: float = 1) -> None:
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def observe(
+        self, name: str, value: float, buckets: Sequence[float] = SECONDS_BUCKETS
+    ) -> None:
+        with self._lock:
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = Histogram(buckets)
+            histogram.observe(value)
+
+    @contextmanager
+    def timer(self, name: str) -> Iterator[None]:
+        """Observe the wall time of the ``with`` block in the ``name`` histogram."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start)
+
+    def record_fetch(
+        self, url: str, seconds: float, size: int, status: Optional[int], from_cache: bool
+    ) -> None:
+        """Record one page fetch in the latency and size histograms."""
+        with self._lock:
+            self.fetches.append(
+                {
+                    "url": url,
+                    "seconds": seconds,
+                    "bytes": size,
+                    "status": status,
+                    "from_cache": from_cache,
+                }
+            )
+        if from_cache:
+            self.increment("fetch_cache_hits_total")
+            return
+        self.increment("fetch_requests_total")
+        self.increment("fetch_bytes_total", size)
+        self.observe("fetch_seconds", seconds)
+        self.observe("fetch_bytes", size, BYTES_BUCKETS)
+
+    def merge(self, other: "Metrics") -> None:
+        """Fold another run's measurements (e.g. from a worker process) into this one."""
+        with self._lock:
+            for name, value in other.counters.items():
+                self.counters[name] = self.counters.get(name, 0) + value
+            for name, histogram in other.histograms.items():
+                mine = self.histograms.get(name)
+                if mine is None:
+                    mine = self.histograms[name] = Histogram(histogram.buckets)
+                mine.merge(histogram)
+            self.fetches.extend(other.fetches)
+
+    def as_dict(self) -> dict[str, object]:
+        with self._lock:
+            return {
+                "started_at": self.started_at,
+                "elapsed_seconds": time.time() - self.started_at,
+                "counters": dict(sorted(self.counters.items())),
+                "histograms": {
+                    name: histogram.as_dict()
+                    for name, histogram in sorted(self.histograms.items())
+                },
+                "fetches": list(self.fetches),
+            }
+
+    def write_json(self, stream: TextIO) -> None:
+        json.dump(self.as_dict(), stream, indent=2)
+        stream.write("\n")
+
+    def write_prometheus(self, stream: TextIO, prefix: str = PROMETHEUS_PREFIX) -> None:
+        """Write counters and histograms in the Prometheus text exposition format."""
+        data = self.as_dict()
+        for name, value in data["counters"].items():  # type: ignore[union-attr]
+            metric = f"{prefix}_{name}"
+            stream.write(f"# TYPE {metric} counter\n{metric} {_prometheus_value(value)}\n")
+        for name, histogram in data["histograms"].items():  # type: ignore[union-attr]
+            metric = f"{prefix}_{name}"
+            stream.write(f"# TYPE {metric} histogram\n")
+            for bound, count in histogram["buckets"].items():
+                stream.write(f'{metric}_bucket{{le="{bound}"}} {count}\n')
+            stream.write(f"{metric}_sum {_prometheus_value(histogram['sum'])}\n")
+            stream.write(f"{metric}_count {histogram['count']}\n")
+
+    def write_summary(self, stream: TextIO) -> None:
+        """Write a short human-readable table of histogram totals and counters."""
+        data = self.as_dict()
+        stream.write(f"{'stage':28} {'count':>7} {'total':>10} {'mean':>10} {'max':>10}\n")
+        for name, histogram in data["histograms"].items():  # type: ignore[union-attr]
+            if not name.endswith("_seconds"):
+                continue
+            stream.write(
+                f"{name:28} {histogram['count']:7d} {histogram['sum']:9.3f}s "
+                f"{1000 * histogram['mean']:8.2f}ms {1000 * histogram['max']:8.2f}ms\n"
+            )
+        for name, value in data["counters"].items():  # type: ignore[union-attr]
+            stream.write(f"{name:28} {value:7g}\n")
+
+    def write(self, path: Path, output_format: Optional[str] = None) -> None:
+        """Write to ``path`` as JSON, or as a Prometheus textfile for ``.prom`` paths."""
+        output_format = output_format or ("prometheus" if path.suffix == ".prom" else "json")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_name(path.name + ".tmp")
+        with temp_path.open("w", encoding="utf-8") as stream:
+            if output_format == "prometheus":
+                self.write_prometheus(stream)
+            else:
+                self.write_json(stream)
+        temp_path.replace(path)
+
+
+class _NullMetrics(Metrics):
+    """Recorder used when instrumentation is off; every call is a no-op."""
+
+    enabled = False
+
+    def increment(self, name: str, amount: float = 1) -> None:
+        pass
+
+    def observe(
+        self, name: str, value: float, buckets: Sequence[float] = SECONDS_BUCKETS
+    ) -> None:
+        pass
+
+    @contextmanager
+    def timer(self, name: str) -> Iterator[None]:
+        yield
+
+    def record_fetch(
+        self, url: str, seconds: float, size: int, status: Optional[int], from_cache: bool
+    ) -> None:
+        pass
+
+
+NULL_METRICS: Metrics = _NullMetrics()
+_active: Metrics = NULL_METRICS
+
+
+def get_metrics() -> Metrics:
+    """Return the recorder instrumented code should report to (a no-op by default)."""
+    return _active
+
+
+@contextmanager
+def use_metrics(metrics: Metrics) -> Iterator[Metrics]:
+    """Route instrumentation to ``metrics`` for the duration of the ``with`` block."""
+    global _active
+    previous = _active
+    _active = metrics
+    try:
+        yield metrics
+    finally:
+        _active = previous
+
+
+def add_metrics_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the ``--profile`` / ``--metrics-out`` options shared by the CLIs."""
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Print per-stage timings and counters to stderr when finished.",
+    )
+    parser.add_argument(
+        "--metrics-out",
+        type=Path,
+        default=None,
+        help="Write timings, counters and histograms to this file (.prom for Prometheus).",
+    )
+    parser.add_argument(
+        "--metrics-format",
+        choices=("json", "prometheus"),
+        default=None,
+        help="Format of --metrics-out (default: from the file suffix, else JSON).",
+    )
+
+
+def metrics_from_args(args: argparse.Namespace) -> Metrics:
+    """Return a live recorder when profiling was requested, else the no-op one."""
+    return Metrics() if args.profile or args.metrics_out is not None else NULL_METRICS
+
+
+def report_metrics(metrics: Metrics, args: argparse.Namespace) -> None:
+    """Emit ``metrics`` as requested by the options from ``add_metrics_arguments``."""
+    if not metrics.enabled:
+        return
+    if args.metrics_out is not None:
+        metrics.write(args.metrics_out, args.metrics_format)
+    if args.profile:
+        metrics.write_summary(sys.stderr)
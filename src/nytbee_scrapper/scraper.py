@@ -1,15 +1,24 @@
 from __future__ import annotations
 
-from datetime import date, timedelta
+import codecs
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from html import unescape
 from html.parser import HTMLParser
 import re
-from typing import Callable, Optional
+import threading
+import time
+from typing import TYPE_CHECKING, BinaryIO, Callable, Iterable, Iterator, Optional, Union
 from urllib.error import HTTPError, URLError
-from urllib.request import Request, urlopen
+
+from .client import USER_AGENT, HttpClient, get_default_client
+from .metrics import get_metrics
+
+if TYPE_CHECKING:
+    from .store import ScrapeStore
 
 BASE_URL = "https://nytbee.com/Bee_{date}.html"
 DEFAULT_URL = "https://nytbee.com/Bee_20260130.html"
-USER_AGENT = "Mozilla/5.0 (compatible; NYTBeeScraper/1.0)"
 
 
 class MainAnswerListParser(HTMLParser):
@@ -69,19 +78,242 @@ class MainAnswerListParser(HTMLParser):
         self._li_stack[-1].append(data)
 
 
-def fetch_html(url: str, timeout: int = 20, user_agent: str = USER_AGENT) -> str:
-    """Fetch HTML content from a URL."""
-    request = Request(url, headers={"User-Agent": user_agent})
-    with urlopen(request, timeout=timeout) as response:
-        charset = response.headers.get_content_charset() or "utf-8"
-        return response.read().decode(charset, errors="replace")
+def fetch_html(
+    url: str,
+    timeout: int = 20,
+    user_agent: str = USER_AGENT,
+    *,
+    client: Optional[HttpClient] = None,
+) -> str:
+    """Fetch HTML content from a URL, reusing pooled keep-alive connections."""
+    client = client or get_default_client()
+    return client.get(url, timeout=timeout, headers={"User-Agent": user_agent}).text()
+
+
+class RateLimiter:
+    """Space out calls so at most ``rate`` start per second across threads."""
+
+    def __init__(self, rate: float) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self._interval = 1.0 / rate
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        """Block until the caller may start its next request."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(self._next_slot, now)
+            self._next_slot = slot + self._interval
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+
+
+_TOKEN_RE = re.compile(
+    r"<!--.*?-->"
+    r"|<!(?!--)[^>]*>"
+    r"|<\?[^>]*>"
+    r"|</(?P<end>[a-zA-Z][^\t\n\r\f />]*)[^>]*>"
+    r"|<(?P<start>[a-zA-Z][^\t\n\r\f />\x00]*)(?P<attrs>(?:[^>\"']|\"[^\"]*\"|'[^']*')*)>",
+    re.DOTALL,
+)
+_ATTR_RE = re.compile(
+    r"([^\s/>\"'=][^\s/>=]*)(?:\s*=\s*(\"[^\"]*\"|'[^']*'|[^\s>]*))?"
+)
+_RAW_TEXT_END = {
+    "script": re.compile(r"</script(?=[\t\n\r\f />])", re.IGNORECASE),
+    "style": re.compile(r"</style(?=[\t\n\r\f />])", re.IGNORECASE),
+}
+_TARGET_ID = "main-answer-list"
+
+
+def _attribute(attrs: str, name: str) -> Optional[str]:
+    for match in _ATTR_RE.finditer(attrs):
+        if match.group(1).lower() == name:
+            value = match.group(2) or ""
+            if value[:1] in {"\"", "'"}:
+                value = value[1:-1]
+            return unescape(value)
+    return None
+
+
+class AnswerListScanner:
+    """Incrementally extract ``div#main-answer-list`` items, stopping once it closes.
+
+    Produces the same items as :class:`MainAnswerListParser` but only tokenizes
+    tags up to the end of the answer list and never materializes attribute dicts
+    for tags outside it. Feed text in chunks; :attr:`done` turns true as soon as
+    the list has been closed.
+    """
+
+    def __init__(self) -> None:
+        self._buffer = ""
+        self._position = 0
+        self._raw_text_end: Optional[re.Pattern[str]] = None
+        self._in_target = False
+        self._div_depth = 0
+        self._ul_depth = 0
+        self._skip_depth = 0
+        self._li_stack: list[list[str]] = []
+        self._items: list[str] = []
+        self.done = False
+
+    @property
+    def items(self) -> list[str]:
+        return self._items
+
+    def feed(self, text: str) -> bool:
+        """Consume more of the document and return whether the list has closed."""
+        if self.done:
+            return True
+        self._buffer = self._buffer[self._position :] + text
+        self._position = 0
+        self._scan(final=False)
+        return self.done
+
+    def close(self) -> list[str]:
+        """Process any buffered input and return the extracted items."""
+        if not self.done:
+            self._scan(final=True)
+        return self._items
+
+    def _handle_data(self, data: str) -> None:
+        if self._in_target and self._li_stack and not self._skip_depth:
+            self._li_stack[-1].append(unescape(data))
+
+    def _handle_start(self, tag: str, attrs: str) -> None:
+        if tag in _RAW_TEXT_END:
+            if self._in_target:
+                self._skip_depth += 1
+            return
+        if tag == "div":
+            if self._in_target:
+                self._div_depth += 1
+            elif _TARGET_ID in attrs and _attribute(attrs, "id") == _TARGET_ID:
+                self._in_target = True
+                self._div_depth = 1
+            return
+        if not self._in_target:
+            return
+        if tag == "ul":
+            self._ul_depth += 1
+        elif tag == "li" and self._ul_depth:
+            self._li_stack.append([])
+
+    def _handle_end(self, tag: str) -> None:
+        if not self._in_target:
+            return
+        if tag in _RAW_TEXT_END and self._skip_depth:
+            self._skip_depth -= 1
+        elif tag == "li" and self._li_stack:
+            text = "".join(self._li_stack.pop()).strip()
+            if text:
+                self._items.append(text)
+        elif tag == "ul" and self._ul_depth:
+            self._ul_depth -= 1
+        elif tag == "div":
+            self._div_depth -= 1
+            if not self._div_depth:
+                self.done = True
+
+    def _scan(self, final: bool) -> None:
+        buffer = self._buffer
+        position = self._position
+        length = len(buffer)
+        while position < length and not self.done:
+            if self._raw_text_end is not None:
+                match = self._raw_text_end.search(buffer, position)
+                if match is None:
+                    # Keep enough of the tail to recognise a split closing tag.
+                    if final:
+                        position = length
+                    else:
+                        position = max(position, length - len("</script "))
+                    break
+                position = match.start()
+                self._raw_text_end = None
+                continue
+
+            tag_open = buffer.find("<", position)
+            if tag_open == -1:
+                if not final:
+                    break
+                self._handle_data(buffer[position:])
+                position = length
+                break
+            token = _TOKEN_RE.match(buffer, tag_open)
+            if token is None:
+                following = buffer[tag_open + 1 : tag_open + 2]
+                if not final and (not following or following.isalpha() or following in "!?/"):
+                    # Possibly a tag split across chunks; wait for more input.
+                    if tag_open > position:
+                        self._handle_data(buffer[position:tag_open])
+                    position = tag_open
+                    break
+                self._handle_data(buffer[position : tag_open + 1])
+                position = tag_open + 1
+                continue
+
+            if tag_open > position:
+                self._handle_data(buffer[position:tag_open])
+            position = token.end()
+            end_tag = token.group("end")
+            if end_tag is not None:
+                self._handle_end(end_tag.lower())
+                continue
+            start_tag = token.group("start")
+            if start_tag is None:
+                continue
+            tag = start_tag.lower()
+            attrs = token.group("attrs")
+            if attrs.endswith("/"):
+                self._handle_start(tag, attrs[:-1])
+                self._handle_end(tag)
+                continue
+            self._handle_start(tag, attrs)
+            if tag in _RAW_TEXT_END:
+                self._raw_text_end = _RAW_TEXT_END[tag]
+        self._position = position
+
+
+def _decoded_chunks(
+    stream: Union[BinaryIO, Iterable[bytes]], encoding: str, chunk_size: int
+) -> Iterator[str]:
+    decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+    if hasattr(stream, "read"):
+        read = stream.read  # type: ignore[union-attr]
+        chunks: Iterable[bytes] = iter(lambda: read(chunk_size), b"")
+    else:
+        chunks = stream  # type: ignore[assignment]
+    for chunk in chunks:
+        text = decoder.decode(chunk)
+        if text:
+            yield text
+    tail = decoder.decode(b"", final=True)
+    if tail:
+        yield tail
+
+
+def extract_answer_list_from_stream(
+    stream: Union[BinaryIO, Iterable[bytes]],
+    encoding: str = "utf-8",
+    chunk_size: int = 16384,
+) -> list[str]:
+    """Extract the answer list from a byte stream, reading no further than the list's end."""
+    scanner = AnswerListScanner()
+    for text in _decoded_chunks(stream, encoding, chunk_size):
+        if scanner.feed(text):
+            break
+    return [item.replace("\r", "") for item in scanner.close()]
 
 
 def extract_answer_list(html: str) -> list[str]:
     """Extract the answer list from NYTBee HTML."""
-    parser = MainAnswerListParser()
-    parser.feed(html)
-    return [item.replace("\r", "") for item in parser.items]
+    scanner = AnswerListScanner()
+    scanner.feed(html)
+    return [item.replace("\r", "") for item in scanner.close()]
 
 
 def normalize_answer(answer: str) -> str:
@@ -97,6 +329,59 @@ def normalize_answer(answer: str) -> str:
     return "".join(tokens)
 
 
+def is_final_page(target_date: date, today: Optional[date] = None) -> bool:
+    """Return whether a day's page is old enough to never change again."""
+    return target_date < (today or date.today()) - timedelta(days=1)
+
+
+def final_since(target_date: date) -> float:
+    """Return the Unix time from which a day's page counts as final."""
+    return datetime.combine(target_date + timedelta(days=2), datetime.min.time()).timestamp()
+
+
+def fetch_day_page(
+    url: str,
+    target_date: date,
+    *,
+    timeout: int = 20,
+    rate_limiter: Optional[RateLimiter] = None,
+    client: Optional[HttpClient] = None,
+) -> str:
+    """Fetch one day's page, waiting on ``rate_limiter`` unless it comes from the cache.
+
+    Final pages cached after they became final never reach the network; an entry
+    cached while the day was current (a 404 or a partial list) is revalidated like
+    any other once it is older than the client's cache TTL.
+    """
+    fresh_after = final_since(target_date) if is_final_page(target_date) else None
+    served_from_cache = False
+    if fresh_after is not None and client is not None and client.cache is not None:
+        fetched_at = client.cache.fetched_at(url)
+        served_from_cache = fetched_at is not None and fetched_at >= fresh_after
+    if rate_limiter is not None and not served_from_cache:
+        with get_metrics().timer("rate_limit_wait_seconds"):
+            rate_limiter.wait()
+    if client is not None:
+        return client.fetch_html(url, timeout=timeout, fresh_after=fresh_after)
+    return fetch_html(url, timeout=timeout)
+
+
+def _fetch_page(
+    url: str,
+    target_date: date,
+    timeout: int,
+    rate_limiter: Optional[RateLimiter],
+    client: Optional[HttpClient],
+) -> tuple[Optional[str], object]:
+    try:
+        html = fetch_day_page(
+            url, target_date, timeout=timeout, rate_limiter=rate_limiter, client=client
+        )
+    except (HTTPError, URLError) as exc:
+        return None, exc
+    return html, None
+
+
 def collect_word_counts(
     starting_date: date,
     days_to_collect: int,
@@ -106,38 +391,93 @@ def collect_word_counts(
     existing_word_counts: Optional[dict[str, int]] = None,
     existing_scraped_urls: Optional[set[str]] = None,
     progress_callback: Optional[Callable[[date, int, int], None]] = None,
+    max_workers: int = 1,
+    max_requests_per_second: Optional[float] = None,
+    client: Optional[HttpClient] = None,
+    store: Optional[ScrapeStore] = None,
 ) -> tuple[dict[str, int], set[str], list[tuple[str, object]]]:
-    """Collect word counts from recent NYTBee puzzles."""
+    """Collect word counts from recent NYTBee puzzles.
+
+    With ``max_workers`` above one, pages are fetched on a thread pool, optionally
+    capped at ``max_requests_per_second``. Results are still merged newest day
+    first, so counts, scraped URLs and failures do not depend on completion order.
+    Pass ``client`` to share one connection pool across calls; if it has a
+    response cache, pages older than yesterday are served from it without a request.
+    With a ``store``, each parsed day is recorded immediately and days already in
+    the store are counted from it instead of being fetched again.
+    """
     if days_to_collect < 0:
         raise ValueError("days_to_collect must be non-negative")
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
     word_counts = dict(existing_word_counts or {})
     scraped_urls = set(existing_scraped_urls or set())
     failed_urls: list[tuple[str, object]] = []
 
+    stored_days: dict[date, tuple[str, list[str]]] = {}
+    if store is not None and days_to_collect:
+        stored_days = store.days_between(
+            starting_date - timedelta(days=days_to_collect - 1), starting_date
+        )
+
+    days = []
     for offset in range(days_to_collect):
         target_date = starting_date - timedelta(days=offset)
-        if progress_callback is not None:
-            progress_callback(target_date, offset + 1, days_to_collect)
         url = base_url.format(date=target_date.strftime("%Y%m%d"))
+        days.append(
+            (target_date, url, url not in scraped_urls and target_date not in stored_days)
+        )
+    to_fetch = [(url, target_date) for target_date, url, needs_fetch in days if needs_fetch]
+
+    rate_limiter = (
+        RateLimiter(max_requests_per_second) if max_requests_per_second is not None else None
+    )
+
+    def fetch(page: tuple[str, date]) -> tuple[Optional[str], object]:
+        url, target_date = page
+        return _fetch_page(url, target_date, timeout, rate_limiter, client)
 
-        if url in scraped_urls:
-            continue
+    metrics = get_metrics()
+    executor = ThreadPoolExecutor(max_workers=max_workers) if max_workers > 1 else None
+    try:
+        pages: Iterator[tuple[Optional[str], object]] = (
+            executor.map(fetch, to_fetch) if executor is not None else map(fetch, to_fetch)
+        )
+        for offset, (target_date, url, needs_fetch) in enumerate(days):
+            if progress_callback is not None:
+                progress_callback(target_date, offset + 1, days_to_collect)
+            if not needs_fetch:
+                if url not in scraped_urls and target_date in stored_days:
+                    for word in stored_days[target_date][1]:
+                        word_counts[word] = word_counts.get(word, 0) + 1
+                    scraped_urls.add(url)
+                continue
+            html, error = next(pages)
+            if url in scraped_urls:
+                continue
 
-        try:
-            html = fetch_html(url, timeout=timeout)
-        except (HTTPError, URLError) as exc:
-            failed_urls.append((url, exc))
-            continue
+            if html is None:
+                metrics.increment("pages_failed_total")
+                failed_urls.append((url, error))
+                continue
 
-        items = extract_answer_list(html)
-        if not items:
-            failed_urls.append((url, "No answers extracted"))
-            continue
+            with metrics.timer("parse_seconds"):
+                items = extract_answer_list(html)
+            if not items:
+                metrics.increment("pages_failed_total")
+                failed_urls.append((url, "No answers extracted"))
+                continue
 
-        for item in items:
-            word = normalize_answer(item)
-            if word:
+            with metrics.timer("normalize_seconds"):
+                words = [word for word in (normalize_answer(item) for item in items) if word]
+            metrics.increment("pages_scraped_total")
+            for word in words:
                 word_counts[word] = word_counts.get(word, 0) + 1
-        scraped_urls.add(url)
+            scraped_urls.add(url)
+            if store is not None:
+                store.record_day(target_date, url, words)
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
 
     return word_counts, scraped_urls, failed_urls
@@ -0,0 +1,244 @@
+from __future__ import annotations
+
+import argparse
+import gzip
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Iterable, Mapping, NamedTuple, Optional
+
+from .scraper import extract_answer_list, normalize_answer
+from .store import ScrapeStore
+
+SHARD_FORMAT_VERSION = 1
+SHARD_SUFFIX = ".counts.gz"
+GRANULARITIES = ("month", "year")
+_HEADER = f"nytbee-counts {SHARD_FORMAT_VERSION}"
+
+
+class WordCountShard(NamedTuple):
+    """Partial answer counts over an explicit set of puzzle days.
+
+    Shards over disjoint days merge associatively and commutatively, so totals
+    for any range can be assembled from per-period shards in any order.
+    """
+
+    days: frozenset[date]
+    counts: dict[str, int]
+
+    @classmethod
+    def from_days(cls, days: Mapping[date, Iterable[str]]) -> "WordCountShard":
+        """Count normalized answers keyed by puzzle day."""
+        counts: Counter[str] = Counter()
+        for words in days.values():
+            counts.update(word for word in words if word)
+        return cls(frozenset(days), dict(counts))
+
+    @classmethod
+    def from_html(cls, pages: Mapping[date, str]) -> "WordCountShard":
+        """Parse and count answer-list pages keyed by puzzle day."""
+        return cls.from_days(
+            {
+                day: [normalize_answer(item) for item in extract_answer_list(html)]
+                for day, html in pages.items()
+            }
+        )
+
+    def merge(self, other: "WordCountShard") -> "WordCountShard":
+        """Return the combined shard; overlapping days would be double counted."""
+        overlap = self.days & other.days
+        if overlap:
+            raise ValueError(f"Shards overlap on {len(overlap)} days (first: {min(overlap)}).")
+        counts = dict(self.counts)
+        for word, count in other.counts.items():
+            counts[word] = counts.get(word, 0) + count
+        return WordCountShard(self.days | other.days, counts)
+
+
+EMPTY_SHARD = WordCountShard(frozenset(), {})
+
+
+def merge_shards(shards: Iterable[WordCountShard]) -> WordCountShard:
+    """Merge any number of disjoint shards into one."""
+    merged = EMPTY_SHARD
+    for shard in shards:
+        merged = merged.merge(shard)
+    return merged
+
+
+def _format_days(days: Iterable[date]) -> str:
+    ranges: list[str] = []
+    run_start = previous = None
+    for day in sorted(days):
+        if previous is not None and day == previous + timedelta(days=1):
+            previous = day
+            continue
+        if run_start is not None:
+            ranges.append(_format_range(run_start, previous))  # type: ignore[arg-type]
+        run_start = previous = day
+    if run_start is not None:
+        ranges.append(_format_range(run_start, previous))  # type: ignore[arg-type]
+    return ",".join(ranges)
+
+
+def _format_range(start: date, end: date) -> str:
+    return start.isoformat() if start == end else f"{start.isoformat()}..{end.isoformat()}"
+
+
+def _parse_days(text: str) -> frozenset[date]:
+    days = set()
+    for item in filter(None, text.split(",")):
+        first, _, last = item.partition("..")
+        day = date.fromisoformat(first)
+        end = date.fromisoformat(last) if last else day
+        while day <= end:
+            days.add(day)
+            day += timedelta(days=1)
+    return frozenset(days)
+
+
+def dumps_shard(shard: WordCountShard) -> bytes:
+    """Serialize a shard as gzip-compressed text with contiguous days as ranges."""
+    lines = [_HEADER, f"days {_format_days(shard.days)}"]
+    lines.extend(f"{word}\t{count}" for word, count in sorted(shard.counts.items()))
+    # A fixed mtime keeps the output byte-identical for identical shards.
+    return gzip.compress(("\n".join(lines) + "\n").encode("utf-8"), mtime=0)
+
+
+def loads_shard(data: bytes) -> WordCountShard:
+    """Parse bytes written by ``dumps_shard``."""
+    try:
+        lines = gzip.decompress(data).decode("utf-8").splitlines()
+    except (OSError, EOFError, UnicodeDecodeError) as exc:
+        raise ValueError(f"Not a word-count shard: {exc}") from exc
+    if len(lines) < 2 or lines[0] != _HEADER or not lines[1].startswith("days "):
+        raise ValueError("Not a word-count shard or unsupported shard version.")
+    counts = {}
+    for line in lines[2:]:
+        word, _, count = line.rpartition("\t")
+        counts[word] = int(count)
+    return WordCountShard(_parse_days(lines[1][len("days ") :]), counts)
+
+
+def write_shard(path: Path, shard: WordCountShard) -> bool:
+    """Atomically write ``shard`` to ``path``; return whether the file changed."""
+    data = dumps_shard(shard)
+    if path.exists() and path.read_bytes() == data:
+        return False
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(path.name + ".tmp")
+    temp_path.write_bytes(data)
+    temp_path.replace(path)
+    return True
+
+
+def read_shard(path: Path) -> WordCountShard:
+    return loads_shard(path.read_bytes())
+
+
+def shard_periods(
+    start: date, end: date, granularity: str = "month"
+) -> list[tuple[str, date, date]]:
+    """Split ``start..end`` into ``(key, first_day, last_day)`` calendar periods."""
+    if granularity not in GRANULARITIES:
+        raise ValueError(f"Unknown shard granularity {granularity!r}.")
+    periods = []
+    period_start = start
+    while period_start <= end:
+        if granularity == "year":
+            key = f"{period_start.year:04d}"
+            next_start = date(period_start.year + 1, 1, 1)
+        else:
+            key = f"{period_start.year:04d}-{period_start.month:02d}"
+            next_start = (period_start.replace(day=28) + timedelta(days=4)).replace(day=1)
+        periods.append((key, period_start, min(end, next_start - timedelta(days=1))))
+        period_start = next_start
+    return periods
+
+
+def _build_store_shard(
+    store_path: Path, output_path: Path, start: date, end: date
+) -> tuple[str, str]:
+    with ScrapeStore(store_path) as store:
+        days = store.days_between(start, end)
+    shard = WordCountShard.from_days({day: words for day, (_, words) in days.items()})
+    changed = write_shard(output_path, shard)
+    return output_path.name, "written" if changed else "unchanged"
+
+
+def build_shards(
+    store_path: Path,
+    output_dir: Path,
+    start: date,
+    end: date,
+    *,
+    granularity: str = "month",
+    max_workers: Optional[int] = None,
+) -> list[tuple[str, str]]:
+    """Write one shard per calendar period of ``start..end`` from a ``ScrapeStore``.
+
+    Periods are counted in worker processes, each reading the store directly, and
+    shard files are only rewritten when their content changed.
+    """
+    if end < start:
+        raise ValueError("end must not be before start")
+    periods = shard_periods(start, end, granularity)
+    arguments = [
+        (store_path, output_dir / f"{key}{SHARD_SUFFIX}", first, last)
+        for key, first, last in periods
+    ]
+    if max_workers == 1 or len(arguments) <= 1:
+        return [_build_store_shard(*item) for item in arguments]
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_build_store_shard, *zip(*arguments)))
+
+
+def load_totals(paths: Iterable[Path]) -> WordCountShard:
+    """Read and merge shard files into a single shard of totals."""
+    return merge_shards(read_shard(path) for path in paths)
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    """Build word-count shards from a scrape store or total existing shards."""
+    parser = argparse.ArgumentParser(
+        prog="python -m nytbee_scrapper.shards",
+        description="Build and combine per-period NYTBee word-count shards.",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    build_parser = subparsers.add_parser("build", help="Write shards from a scrape store.")
+    build_parser.add_argument("--store", type=Path, required=True, help="ScrapeStore file.")
+    build_parser.add_argument("--output-dir", type=Path, default=Path("shards"))
+    build_parser.add_argument("--start", type=date.fromisoformat, required=True)
+    build_parser.add_argument("--end", type=date.fromisoformat, default=None)
+    build_parser.add_argument("--granularity", choices=GRANULARITIES, default="month")
+    build_parser.add_argument(
+        "--workers", type=int, default=None, help="Worker processes (default: CPU count)."
+    )
+    total_parser = subparsers.add_parser("total", help="Merge shards and list top words.")
+    total_parser.add_argument("shards", type=Path, nargs="+")
+    total_parser.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        outcomes = build_shards(
+            args.store,
+            args.output_dir,
+            args.start,
+            args.end or date.today(),
+            granularity=args.granularity,
+            max_workers=args.workers,
+        )
+        for name, outcome in outcomes:
+            print(f"{name}: {outcome}")
+        return
+
+    totals = load_totals(args.shards)
+    print(f"{len(totals.days)} days, {len(totals.counts)} unique words")
+    ranked = sorted(totals.counts.items(), key=lambda item: (-item[1], item[0]))
+    for word, count in ranked[: args.limit]:
+        print(f"{count:5d} {word}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from collections import Counter
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Iterable, Optional
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS days (
+    date TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    answers TEXT NOT NULL,
+    scraped_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS monthly_counts (
+    month TEXT NOT NULL,
+    word TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (month, word)
+);
+"""
+
+
+def _month_start(day: date) -> date:
+    return day.replace(day=1)
+
+
+def _next_month(day: date) -> date:
+    return (day.replace(day=28) + timedelta(days=4)).replace(day=1)
+
+
+def _split_answers(answers: str) -> list[str]:
+    return answers.split("\n") if answers else []
+
+
+class ScrapeStore:
+    """Durable per-day record of scraped answers with monthly count rollups.
+
+    Each day is committed as soon as it is recorded, so an interrupted backfill
+    loses at most the page being processed. Window counts read whole months from
+    the rollup table and only the partial months at the edges from per-day rows.
+    """
+
+    def __init__(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(str(path), check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.executescript(_SCHEMA)
+
+    def __enter__(self) -> "ScrapeStore":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._connection.execute("SELECT COUNT(*) FROM days").fetchone()
+        return count
+
+    def __contains__(self, day: object) -> bool:
+        if not isinstance(day, date):
+            return False
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT 1 FROM days WHERE date = ?", (day.isoformat(),)
+            ).fetchone()
+        return row is not None
+
+    def record_day(self, day: date, url: str, words: Iterable[str]) -> None:
+        """Store a day's normalized answers and update the monthly rollup."""
+        answers = [word for word in words if word]
+        month = _month_start(day).isoformat()
+        with self._lock, self._connection:
+            previous = self._connection.execute(
+                "SELECT answers FROM days WHERE date = ?", (day.isoformat(),)
+            ).fetchone()
+            if previous is not None:
+                self._connection.executemany(
+                    "UPDATE monthly_counts SET count = count - ? WHERE month = ? AND word = ?",
+                    [
+                        (count, month, word)
+                        for word, count in Counter(_split_answers(previous[0])).items()
+                    ],
+                )
+                self._connection.execute(
+                    "DELETE FROM monthly_counts WHERE month = ? AND count <= 0", (month,)
+                )
+            self._connection.execute(
+                "INSERT OR REPLACE INTO days (date, url, answers, scraped_at) VALUES (?, ?, ?, ?)",
+                (day.isoformat(), url, "\n".join(answers), time.time()),
+            )
+            self._connection.executemany(
+                "INSERT INTO monthly_counts (month, word, count) VALUES (?, ?, ?) "
+                "ON CONFLICT (month, word) DO UPDATE SET count = count + excluded.count",
+                [(month, word, count) for word, count in Counter(answers).items()],
+            )
+
+    def answers(self, day: date) -> Optional[list[str]]:
+        """Return the stored answers for ``day``, or ``None`` if it was not scraped."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT answers FROM days WHERE date = ?", (day.isoformat(),)
+            ).fetchone()
+        return None if row is None else _split_answers(row[0])
+
+    def days_between(self, start: date, end: date) -> dict[date, tuple[str, list[str]]]:
+        """Return ``{day: (url, answers)}`` for stored days in ``start..end`` inclusive."""
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT date, url, answers FROM days WHERE date BETWEEN ? AND ? ORDER BY date",
+                (start.isoformat(), end.isoformat()),
+            ).fetchall()
+        return {
+            date.fromisoformat(day): (url, _split_answers(answers)) for day, url, answers in rows
+        }
+
+    def days_scraped_after(self, timestamp: float) -> list[tuple[date, float, list[str]]]:
+        """Return ``(day, scraped_at, answers)`` recorded after ``timestamp``, oldest first."""
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT date, scraped_at, answers FROM days WHERE scraped_at > ? "
+                "ORDER BY scraped_at",
+                (timestamp,),
+            ).fetchall()
+        return [
+            (date.fromisoformat(day), scraped_at, _split_answers(answers))
+            for day, scraped_at, answers in rows
+        ]
+
+    def word_counts(self, start: date, end: date) -> dict[str, int]:
+        """Return answer counts for every stored day in ``start..end`` inclusive."""
+        if end < start:
+            return {}
+        counts: Counter[str] = Counter()
+        first_full = start if start.day == 1 else _next_month(start)
+        end_exclusive = (
+            _next_month(end) if (end + timedelta(days=1)).day == 1 else _month_start(end)
+        )
+        with self._lock:
+            if first_full < end_exclusive:
+                rows = self._connection.execute(
+                    "SELECT word, SUM(count) FROM monthly_counts "
+                    "WHERE month >= ? AND month < ? GROUP BY word",
+                    (first_full.isoformat(), end_exclusive.isoformat()),
+                )
+                counts.update(dict(rows.fetchall()))
+                edges = [
+                    (start, first_full - timedelta(days=1)),
+                    (end_exclusive, end),
+                ]
+            else:
+                edges = [(start, end)]
+            for edge_start, edge_end in edges:
+                if edge_end < edge_start:
+                    continue
+                for (answers,) in self._connection.execute(
+                    "SELECT answers FROM days WHERE date BETWEEN ? AND ?",
+                    (edge_start.isoformat(), edge_end.isoformat()),
+                ):
+                    counts.update(_split_answers(answers))
+        return dict(counts)
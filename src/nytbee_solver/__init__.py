@@ -1,26 +1,45 @@
-from .encoding import decode_terminated, encode_terminated
-from .solver import (
-    WORDLIST_URL,
-    ensure_wordlist,
-    get_default_wordlist_path,
-    get_todays_puzzle_letters,
-    load_words,
-    normalize_letters,
-    print_hint_page,
-    run_today_hint_page,
-    solve_spelling_bee,
-)
+from importlib import import_module
+from typing import Any
 
-__all__ = [
-    "decode_terminated",
-    "encode_terminated",
-    "WORDLIST_URL",
-    "ensure_wordlist",
-    "get_default_wordlist_path",
-    "get_todays_puzzle_letters",
-    "load_words",
-    "normalize_letters",
-    "print_hint_page",
-    "run_today_hint_page",
-    "solve_spelling_bee",
-]
+# See nytbee_scrapper/__init__.py: exports resolve lazily so the CLI only
+# imports what a command actually uses.
+_EXPORTS = {
+    "decode_terminated": ".encoding",
+    "encode_terminated": ".encoding",
+    "WORDLIST_URL": ".solver",
+    "ensure_wordlist": ".solver",
+    "get_default_wordlist_path": ".solver",
+    "get_puzzle_letters": ".solver",
+    "get_todays_puzzle_letters": ".solver",
+    "get_word_store": ".solver",
+    "HintSummary": ".hints",
+    "attach_wordlist": ".shared",
+    "letter_mask": ".wordstore",
+    "load_words": ".solver",
+    "normalize_letters": ".solver",
+    "print_hint_page": ".solver",
+    "run_today_hint_page": ".solver",
+    "share_wordlist": ".shared",
+    "SharedWordlist": ".shared",
+    "solve_many": ".solver",
+    "solve_spelling_bee": ".solver",
+    "solve_streaming": ".streaming",
+    "update_wordlist": ".wordlist",
+    "WordArray": ".wordstore",
+    "WordStore": ".wordstore",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
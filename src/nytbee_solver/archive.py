@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+import argparse
+import re
+import sqlite3
+from datetime import date
+from pathlib import Path
+from typing import NamedTuple, Optional
+
+from .wordstore import letter_mask
+
+RESULTS_FILE_RE = re.compile(r"^(\d{4}-\d{2}-\d{2})\.txt$")
+_LETTERS_RE = re.compile(r"^Letters: ([a-z]+)$", re.MULTILINE)
+_REQUIRED_RE = re.compile(r"\(required: ([a-z])\)")
+_BY_LENGTH_RE = re.compile(r"^\d+ letters \(\d+\): (.*)$", re.MULTILINE)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    name TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS puzzles (
+    date TEXT PRIMARY KEY,
+    letters TEXT NOT NULL,
+    required TEXT NOT NULL,
+    letter_mask INTEGER NOT NULL,
+    word_count INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS puzzles_letter_mask ON puzzles (letter_mask);
+CREATE TABLE IF NOT EXISTS answers (
+    word TEXT NOT NULL,
+    date TEXT NOT NULL,
+    PRIMARY KEY (word, date)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS answers_date ON answers (date);
+"""
+
+
+class ArchivedPuzzle(NamedTuple):
+    date: date
+    letters: str
+    required: str
+    words: list[str]
+
+
+def parse_results_file(text: str, puzzle_date: date) -> ArchivedPuzzle:
+    """Parse a dated hint page written by ``nytbee_solver.publish``."""
+    letters_match = _LETTERS_RE.search(text)
+    required_match = _REQUIRED_RE.search(text)
+    if letters_match is None or required_match is None:
+        raise ValueError(f"Results for {puzzle_date.isoformat()} are missing puzzle letters.")
+    words: list[str] = []
+    for line in _BY_LENGTH_RE.findall(text):
+        words.extend(word.strip() for word in line.split(","))
+    return ArchivedPuzzle(
+        puzzle_date, letters_match.group(1), required_match.group(1), sorted(words)
+    )
+
+
+class ResultsIndex:
+    """SQLite index over the dated hint pages in ``results/``."""
+
+    def __init__(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self._connection = sqlite3.connect(str(path))
+        with self._connection:
+            self._connection.executescript(_SCHEMA)
+
+    def __enter__(self) -> "ResultsIndex":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def __len__(self) -> int:
+        (count,) = self._connection.execute("SELECT COUNT(*) FROM puzzles").fetchone()
+        return count
+
+    def _remove(self, day: str) -> None:
+        self._connection.execute("DELETE FROM puzzles WHERE date = ?", (day,))
+        self._connection.execute("DELETE FROM answers WHERE date = ?", (day,))
+
+    def update(self, results_dir: Path) -> int:
+        """Ingest new or changed dated results files and drop deleted ones."""
+        indexed = {
+            name: (mtime_ns, size)
+            for name, mtime_ns, size in self._connection.execute(
+                "SELECT name, mtime_ns, size FROM files"
+            )
+        }
+        seen = set()
+        changed = 0
+        with self._connection:
+            for path in sorted(results_dir.iterdir()):
+                match = RESULTS_FILE_RE.match(path.name)
+                if match is None or not path.is_file():
+                    continue
+                seen.add(path.name)
+                stat = path.stat()
+                signature = (stat.st_mtime_ns, stat.st_size)
+                if indexed.get(path.name) == signature:
+                    continue
+                puzzle = parse_results_file(
+                    path.read_text(encoding="utf-8"), date.fromisoformat(match.group(1))
+                )
+                day = puzzle.date.isoformat()
+                self._remove(day)
+                self._connection.execute(
+                    "INSERT INTO puzzles (date, letters, required, letter_mask, word_count) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (
+                        day,
+                        puzzle.letters,
+                        puzzle.required,
+                        letter_mask(puzzle.letters),
+                        len(puzzle.words),
+                    ),
+                )
+                self._connection.executemany(
+                    "INSERT OR IGNORE INTO answers (word, date) VALUES (?, ?)",
+                    [(word, day) for word in puzzle.words],
+                )
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO files (name, mtime_ns, size) VALUES (?, ?, ?)",
+                    (path.name, *signature),
+                )
+                changed += 1
+            for name in set(indexed) - seen:
+                self._remove(RESULTS_FILE_RE.match(name).group(1))  # type: ignore[union-attr]
+                self._connection.execute("DELETE FROM files WHERE name = ?", (name,))
+                changed += 1
+        return changed
+
+    def dates_for_word(self, word: str) -> list[date]:
+        """Return every puzzle date that accepted ``word``."""
+        rows = self._connection.execute(
+            "SELECT date FROM answers WHERE word = ? ORDER BY date", (word.strip().lower(),)
+        )
+        return [date.fromisoformat(day) for (day,) in rows]
+
+    def puzzles_with_letters(
+        self, letters: str, required: Optional[str] = None
+    ) -> list[tuple[date, str, str]]:
+        """Return ``(date, letters, required)`` for puzzles using exactly this letter set."""
+        query = "SELECT date, letters, required FROM puzzles WHERE letter_mask = ?"
+        params: list[object] = [letter_mask(letters.lower())]
+        if required is not None:
+            query += " AND required = ?"
+            params.append(required.lower())
+        rows = self._connection.execute(query + " ORDER BY date", params)
+        return [(date.fromisoformat(day), puzzle_letters, req) for day, puzzle_letters, req in rows]
+
+    def most_frequent(
+        self, start: Optional[date] = None, end: Optional[date] = None, limit: int = 20
+    ) -> list[tuple[str, int]]:
+        """Return the most frequently accepted answers between ``start`` and ``end``."""
+        rows = self._connection.execute(
+            "SELECT word, COUNT(*) AS uses FROM answers WHERE date BETWEEN ? AND ? "
+            "GROUP BY word ORDER BY uses DESC, word LIMIT ?",
+            (
+                (start or date.min).isoformat(),
+                (end or date.max).isoformat(),
+                limit,
+            ),
+        )
+        return [(word, uses) for word, uses in rows]
+
+
+def get_default_index_path(results_dir: Path) -> Path:
+    return results_dir / "index.sqlite3"
+
+
+def main() -> None:
+    """Update or query the index of published daily results."""
+    parser = argparse.ArgumentParser(description="Query published NYT Spelling Bee results.")
+    parser.add_argument(
+        "--results-dir",
+        type=Path,
+        default=Path("results"),
+        help="Directory containing dated results files.",
+    )
+    parser.add_argument(
+        "--index",
+        type=Path,
+        default=None,
+        help="Path of the SQLite index (default: index.sqlite3 in the results directory).",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("update", help="Ingest new or changed results files.")
+    word_parser = subparsers.add_parser("word", help="List dates that accepted a word.")
+    word_parser.add_argument("word")
+    letters_parser = subparsers.add_parser("letters", help="List puzzles using a letter set.")
+    letters_parser.add_argument("letters")
+    top_parser = subparsers.add_parser("top", help="Most frequent answers in a date range.")
+    top_parser.add_argument("--start", type=date.fromisoformat, default=None)
+    top_parser.add_argument("--end", type=date.fromisoformat, default=None)
+    top_parser.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args()
+
+    with ResultsIndex(args.index or get_default_index_path(args.results_dir)) as index:
+        changed = index.update(args.results_dir)
+        if args.command == "update":
+            print(f"Indexed {len(index)} puzzles ({changed} updated).")
+        elif args.command == "word":
+            for day in index.dates_for_word(args.word):
+                print(day.isoformat())
+        elif args.command == "letters":
+            for day, letters, required in index.puzzles_with_letters(args.letters):
+                print(f"{day.isoformat()} {letters} (required: {required})")
+        else:
+            for word, uses in index.most_frequent(args.start, args.end, args.limit):
+                print(f"{uses:4d} {word}")
+
+
+if __name__ == "__main__":
+    main()
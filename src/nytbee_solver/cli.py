@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 import argparse
+import sys
 from pathlib import Path
+from typing import Optional
 
-from .solver import get_todays_puzzle_letters, print_hint_page, solve_spelling_bee
+from .hints import HintSummary
+from .solver import get_todays_puzzle_letters, solve_spelling_bee
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -16,28 +19,68 @@ def build_parser() -> argparse.ArgumentParser:
         nargs="?",
         help=(
             "Seven letters with the required letter first. "
-            "When omitted, the solver uses today's NYTBee puzzle."
+            "When omitted, the solver uses today's NYTBee puzzle. "
+            "Use 'serve' to run the long-lived solver service."
         ),
     )
     parser.add_argument(
         "--wordlist",
         type=Path,
         default=None,
-        help="Path to the wordlist file to use instead of the default cache.",
+        help=(
+            "Path to the wordlist file to use instead of the default cache. A compiled "
+            "copy (WORDLIST.idx) is written next to it when that directory is writable."
+        ),
+    )
+    parser.add_argument(
+        "--format",
+        choices=("text", "markdown", "json"),
+        default="text",
+        help="Output format of the hint page (default: text).",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help=(
+            "Scan the wordlist in fixed-size chunks instead of loading it, for very "
+            "large lists; throughput is reported on stderr."
+        ),
     )
     return parser
 
 
-def main() -> None:
+def main(argv: Optional[list[str]] = None) -> None:
     """Run the solver CLI and print the Spelling Bee hint page."""
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] == "serve":
+        from .server import main as serve_main
+
+        serve_main(argv[1:])
+        return
+
     parser = build_parser()
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     letters = args.letters or get_todays_puzzle_letters()
-    words, pangrams, cleaned_letters, required = solve_spelling_bee(
-        letters, wordlist_path=args.wordlist
-    )
-    print_hint_page(words, pangrams, cleaned_letters, required)
+    if args.stream:
+        from .streaming import StreamStats, solve_streaming
+
+        stats = StreamStats()
+        words, pangrams, cleaned_letters, required = solve_streaming(
+            letters, args.wordlist, stats=stats
+        )
+        print(stats, file=sys.stderr)
+    else:
+        words, pangrams, cleaned_letters, required = solve_spelling_bee(
+            letters, wordlist_path=args.wordlist
+        )
+    summary = HintSummary.from_solution(words, pangrams, cleaned_letters, required)
+    if args.format == "json":
+        summary.write_json(sys.stdout)
+    elif args.format == "markdown":
+        summary.write_markdown(sys.stdout)
+    else:
+        summary.write_text(sys.stdout)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+import hashlib
+import mmap
+import os
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import Iterator, Sequence
+
+from .wordstore import WordArray, WordStore, group_by_mask, letter_mask
+
+MAGIC = b"NYTBWLC\0"
+FORMAT_VERSION = 2
+# magic, version, flags, word count, blob bytes, max word length, source sha256,
+# distinct mask count
+_HEADER = struct.Struct("<8sHHIII32sI")
+_HEADER_SIZE = 64
+
+
+def get_compiled_wordlist_path(path: Path) -> Path:
+    """Return where the compiled form of a wordlist is stored."""
+    return path.with_name(f"{path.name}.idx")
+
+
+def wordlist_digest(path: Path) -> bytes:
+    """Return the SHA-256 digest of a wordlist source file."""
+    return hashlib.sha256(path.read_bytes()).digest()
+
+
+def _uint32_array(values: Sequence[int]) -> array:
+    packed = array("I", values)
+    if sys.byteorder != "little":
+        packed.byteswap()
+    return packed
+
+
+def compile_wordlist(words: Sequence[str], digest: bytes) -> bytes:
+    """Serialize sorted words, letter masks, length buckets and mask groups into one buffer."""
+    ordered = sorted(words)
+    encoded = [word.encode("utf-8") for word in ordered]
+    blob = b"\n".join(encoded)
+    offsets = [0]
+    for raw in encoded:
+        offsets.append(offsets[-1] + len(raw) + 1)
+    lengths = [len(word) for word in ordered]
+    max_length = max(lengths, default=0)
+    if max_length > 255:
+        raise ValueError("Words longer than 255 letters cannot be compiled.")
+
+    by_length = sorted(range(len(ordered)), key=lambda index: lengths[index])
+    bucket_starts = [0] * (max_length + 2)
+    for length in lengths:
+        bucket_starts[length + 1] += 1
+    for length in range(1, max_length + 2):
+        bucket_starts[length] += bucket_starts[length - 1]
+
+    masks = [letter_mask(word) for word in ordered]
+    order, group_masks, group_starts = group_by_mask(masks)
+
+    header = _HEADER.pack(
+        MAGIC, FORMAT_VERSION, 0, len(ordered), len(blob), max_length, digest, len(group_masks)
+    ).ljust(_HEADER_SIZE, b"\0")
+    return b"".join(
+        [
+            header,
+            _uint32_array(offsets).tobytes(),
+            _uint32_array(masks).tobytes(),
+            _uint32_array(by_length).tobytes(),
+            _uint32_array(bucket_starts).tobytes(),
+            _uint32_array(order).tobytes(),
+            _uint32_array(group_masks).tobytes(),
+            _uint32_array(group_starts).tobytes(),
+            bytes(lengths),
+            blob,
+        ]
+    )
+
+
+class CompiledWordlist(Sequence[str]):
+    """Read-only view over a compiled wordlist buffer."""
+
+    def __init__(self, buffer: bytes | mmap.mmap) -> None:
+        if len(buffer) < _HEADER_SIZE:
+            raise ValueError("Compiled wordlist is truncated.")
+        fields = _HEADER.unpack_from(buffer)
+        magic, version, _flags, count, blob_size, max_length, digest, group_count = fields
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError("Unsupported compiled wordlist format.")
+        expected = (
+            _HEADER_SIZE + 4 * (4 * count + max_length + 2 * group_count + 4) + count + blob_size
+        )
+        if len(buffer) != expected:
+            raise ValueError("Compiled wordlist is truncated.")
+
+        self._buffer = buffer
+        self._view = memoryview(buffer)
+        self._count = count
+        self.digest = digest
+        self.max_length = max_length
+
+        position = _HEADER_SIZE
+        self._offsets, position = self._uint32_section(position, count + 1)
+        self.masks, position = self._uint32_section(position, count)
+        self._by_length, position = self._uint32_section(position, count)
+        self._bucket_starts, position = self._uint32_section(position, max_length + 2)
+        self._mask_order, position = self._uint32_section(position, count)
+        self._group_masks, position = self._uint32_section(position, group_count)
+        self._group_starts, position = self._uint32_section(position, group_count + 1)
+        self.lengths = self._view[position : position + count]
+        position += count
+        self._blob = self._view[position : position + blob_size]
+
+    @classmethod
+    def open(cls, path: Path) -> "CompiledWordlist":
+        """Memory-map a compiled wordlist file."""
+        with path.open("rb") as handle:
+            if os.fstat(handle.fileno()).st_size == 0:
+                raise ValueError("Compiled wordlist is empty.")
+            mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            return cls(mapped)
+        except ValueError:
+            mapped.close()
+            raise
+
+    def _uint32_section(self, position: int, count: int) -> tuple[Sequence[int], int]:
+        end = position + 4 * count
+        section = self._view[position:end]
+        if sys.byteorder == "little":
+            return section.cast("I"), end
+        values = array("I", section.tobytes())
+        values.byteswap()
+        return values, end
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index):  # type: ignore[override]
+        if isinstance(index, slice):
+            return [self[position] for position in range(*index.indices(self._count))]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("word index out of range")
+        start = self._offsets[index]
+        end = self._offsets[index + 1] - 1
+        return bytes(self._blob[start:end]).decode("utf-8")
+
+    def __iter__(self) -> Iterator[str]:
+        if not self._count:
+            return iter(())
+        return iter(bytes(self._blob).decode("utf-8").split("\n"))
+
+    def words_of_length(self, length: int) -> list[str]:
+        """Return the words with exactly ``length`` letters, in sorted order."""
+        if not 0 <= length <= self.max_length:
+            return []
+        start = self._bucket_starts[length]
+        end = self._bucket_starts[length + 1]
+        return [self[self._by_length[position]] for position in range(start, end)]
+
+    def to_word_array(self) -> WordArray:
+        """View the words, masks and lengths in place; the buffer stays open while it is used."""
+        return WordArray(self._blob, self._offsets, self.masks, self.lengths, owner=self)
+
+    def to_word_store(self) -> WordStore:
+        """Build a ``WordStore`` over the stored mask groups without copying or sorting."""
+        return WordStore(
+            self.to_word_array(),
+            groups=(self._mask_order, self._group_masks, self._group_starts),
+        )
+
+    def close(self) -> None:
+        """Release the underlying buffer."""
+        for name in (
+            "masks",
+            "lengths",
+            "_offsets",
+            "_by_length",
+            "_bucket_starts",
+            "_mask_order",
+            "_group_masks",
+            "_group_starts",
+            "_blob",
+        ):
+            section = getattr(self, name)
+            if isinstance(section, memoryview):
+                section.release()
+        self._view.release()
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    import tempfile
+
+    handle, temp_name = tempfile.mkstemp(prefix=f".{path.name}.", dir=path.parent)
+    try:
+        with os.fdopen(handle, "wb") as temp_file:
+            temp_file.write(data)
+        os.chmod(temp_name, 0o644)
+        os.replace(temp_name, path)
+    except BaseException:
+        try:
+            os.unlink(temp_name)
+        except OSError:
+            pass
+        raise
+
+
+def load_compiled_wordlist(path: Path) -> CompiledWordlist:
+    """Load the compiled wordlist for ``path``, rebuilding it when the source changed."""
+    from .solver import load_words
+
+    digest = wordlist_digest(path)
+    compiled_path = get_compiled_wordlist_path(path)
+    try:
+        compiled = CompiledWordlist.open(compiled_path)
+    except (OSError, ValueError):
+        compiled = None
+    if compiled is not None:
+        if compiled.digest == digest:
+            return compiled
+        compiled.close()
+
+    data = compile_wordlist(load_words(path), digest)
+    try:
+        _write_atomic(compiled_path, data)
+        return CompiledWordlist.open(compiled_path)
+    except OSError:
+        # Read-only locations still get the compiled layout, just not on disk.
+        return CompiledWordlist(data)
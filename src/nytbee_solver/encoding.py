@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import base64
-from typing import Iterable
+import struct
+from pathlib import Path
+from typing import Iterable, Sequence
 
 
 class BitWriter:
@@ -75,6 +77,56 @@ def _build_letter_map(letters: str) -> dict[str, int]:
     return {letter: index for index, letter in enumerate(letters)}
 
 
+# The terminated format is a stream of 3-bit symbols, i.e. one octal digit per
+# letter, so whole word lists are packed and unpacked through ``int(..., 8)``.
+_COUNT_DIGITS = 4
+_TERMINATOR = "7"
+# Capped below the terminator symbol so records can be split on it directly.
+_MAX_SHARED_PREFIX = 6
+_PREFIX_LENGTHS = {str(length): length for length in range(_MAX_SHARED_PREFIX + 1)}
+
+FRONT_CODED_VERSION = 1
+
+CANDIDATE_BITMAP_VERSION = 1
+DICTIONARY_TAG_SIZE = 4
+# Version, dictionary tag and candidate count, followed by the candidate bitmap.
+_BITMAP_HEADER = struct.Struct(f">B{DICTIONARY_TAG_SIZE}sH")
+
+
+def _encode_table(letters: str) -> dict[int, str]:
+    return {ord(letter): str(index) for letter, index in _build_letter_map(letters[:7]).items()}
+
+
+def _check_symbols(words: list[str], letters: str) -> None:
+    # Only seven letters fit in a 3-bit symbol next to the terminator.
+    unencodable = set(letters[7:]) - set(letters[:7])
+    if unencodable and any(not unencodable.isdisjoint(word) for word in words):
+        raise ValueError("Words may only use the first seven puzzle letters to be encoded.")
+
+
+def _decode_table(letters: str) -> dict[int, str]:
+    return {ord(str(index)): letter for index, letter in enumerate(letters[:7])}
+
+
+def _pack_digits(digits: str) -> bytes:
+    byte_count, used_bits = divmod(len(digits) * 3, 8)
+    padding = 8 - used_bits if used_bits else 0
+    return (int(digits, 8) << padding).to_bytes(byte_count + bool(used_bits), "big")
+
+
+def _unpack_digits(data: bytes, minimum: int) -> str:
+    digit_count = _digit_count(data, minimum)
+    spare_bits = len(data) * 8 - digit_count * 3
+    return format(int.from_bytes(data, "big") >> spare_bits, "o").zfill(digit_count)
+
+
+def _digit_count(data: bytes, minimum: int) -> int:
+    digit_count = len(data) * 8 // 3
+    if digit_count < minimum:
+        raise EOFError("Not enough data to read the requested bits.")
+    return digit_count
+
+
 def _validate_words(words: Iterable[str], letters: str, required: str) -> list[str]:
     allowed = set(letters)
     cleaned = []
@@ -86,7 +138,7 @@ def _validate_words(words: Iterable[str], letters: str, required: str) -> list[s
             raise ValueError("Words must include the required letter.")
         if not normalized.isalpha():
             raise ValueError("Words must use letters a-z only.")
-        if set(normalized) - allowed:
+        if not set(normalized) <= allowed:
             raise ValueError("Words must only use the puzzle letters.")
         cleaned.append(normalized)
     return cleaned
@@ -99,28 +151,219 @@ def encode_terminated(words: Iterable[str], letters: str, required: str) -> str:
 
 def decode_terminated(payload: str, letters: str, required: str) -> list[str]:
     """Decode words packed with 3-bit letters plus a terminator symbol."""
-    reader = BitReader(_b64decode(payload))
-    total = reader.read(12)
-    words = []
-    current: list[str] = []
-    while len(words) < total:
-        value = reader.read(3)
-        if value == 7:
-            word = "".join(current)
-            words.append(word)
-            current = []
-        else:
-            current.append(letters[value])
-    return _validate_words(words, letters, required)
+    return _validate_words(_unpack_terminated(_b64decode(payload), letters), letters, required)
+
+
+def _unpack_terminated(data: bytes, letters: str) -> list[str]:
+    return _split_terminated(_unpack_digits(data, _COUNT_DIGITS), _decode_table(letters))
+
+
+def _split_terminated(digits: str, table: dict[int, str]) -> list[str]:
+    total = int(digits[:_COUNT_DIGITS], 8)
+    symbols = digits[_COUNT_DIGITS:].split(_TERMINATOR, total)
+    if len(symbols) <= total:
+        raise EOFError("Not enough data to read the requested bits.")
+    return [word.translate(table) for word in symbols[:total]]
 
 
 def _encode_terminated_bytes(words: Iterable[str], letters: str, required: str) -> bytes:
+    return _pack_digits(_terminated_digits(words, letters, required, _encode_table(letters)))
+
+
+def _terminated_digits(
+    words: Iterable[str], letters: str, required: str, table: dict[int, str]
+) -> str:
     cleaned = _validate_words(words, letters, required)
-    letter_map = _build_letter_map(letters)
-    writer = BitWriter()
-    writer.write(len(cleaned), 12)
+    if len(cleaned) >= 1 << (3 * _COUNT_DIGITS):
+        raise ValueError("Value out of range for bit length.")
+    _check_symbols(cleaned, letters)
+    body = _TERMINATOR.join(word.translate(table) for word in cleaned)
+    return f"{len(cleaned):04o}{body}{_TERMINATOR if cleaned else ''}"
+
+
+def encode_front_coded(words: Iterable[str], letters: str, required: str) -> str:
+    """Encode words as shared-prefix lengths plus terminated 3-bit suffixes.
+
+    The payload starts with a version symbol, then a 12-bit word count. Each word
+    stores how many leading letters (0-6) it shares with the previous word followed
+    by the rest of its letters, so sorted lists need fewer symbols than
+    ``encode_terminated``.
+    """
+    cleaned = _validate_words(words, letters, required)
+    if len(cleaned) >= 1 << (3 * _COUNT_DIGITS):
+        raise ValueError("Value out of range for bit length.")
+    _check_symbols(cleaned, letters)
+    table = _encode_table(letters)
+    parts = [f"{FRONT_CODED_VERSION}{len(cleaned):04o}"]
+    previous = ""
     for word in cleaned:
-        for char in word:
-            writer.write(letter_map[char], 3)
-        writer.write(7, 3)
-    return writer.finish()
+        shared = 0
+        limit = min(len(previous), len(word), _MAX_SHARED_PREFIX)
+        while shared < limit and word[shared] == previous[shared]:
+            shared += 1
+        parts.append(str(shared))
+        parts.append(word[shared:].translate(table))
+        parts.append(_TERMINATOR)
+        previous = word
+    return _b64encode(_pack_digits("".join(parts)))
+
+
+def decode_front_coded(payload: str, letters: str, required: str) -> list[str]:
+    """Decode words written by ``encode_front_coded``.
+
+    Each word is rebuilt from the previous one, so decoding stays somewhat slower
+    than ``decode_terminated`` in exchange for the smaller payload.
+    """
+    digits = _unpack_digits(_b64decode(payload), _COUNT_DIGITS + 1)
+    if digits[0] != str(FRONT_CODED_VERSION):
+        raise ValueError(f"Unsupported front-coded payload version {digits[0]}.")
+    total = int(digits[1 : _COUNT_DIGITS + 1], 8)
+    # Translate the whole body at once; translation keeps positions, so each
+    # record's prefix length is read from the untranslated digits.
+    body = digits[_COUNT_DIGITS + 1 :]
+    records = body.translate(_decode_table(letters)).split(_TERMINATOR, total)
+    if len(records) <= total:
+        raise EOFError("Not enough data to read the requested bits.")
+    words: list[str] = []
+    previous = ""
+    position = 0
+    for record in records[:total]:
+        if not record:
+            raise ValueError("Front-coded record is missing its shared prefix length.")
+        shared = _PREFIX_LENGTHS[body[position]]
+        if shared > len(previous):
+            raise ValueError("Shared prefix is longer than the previous word.")
+        previous = previous[:shared] + record[1:]
+        words.append(previous)
+        position += len(record) + 1
+    return _validate_words(words, letters, required)
+
+
+def get_dictionary_tag(wordlist_path: Path) -> bytes:
+    """Return the short wordlist fingerprint stored in candidate-bitmap payloads."""
+    from .compiled import wordlist_digest
+
+    return wordlist_digest(wordlist_path)[:DICTIONARY_TAG_SIZE]
+
+
+def encode_candidate_bitmap(
+    words: Iterable[str],
+    letters: str,
+    required: str,
+    candidates: Sequence[str],
+    dictionary_tag: bytes,
+) -> str:
+    """Encode words as a bitmap over the solver's sorted ``candidates``.
+
+    Answers missing from ``candidates`` are appended in the terminated format.
+    ``dictionary_tag`` (see ``get_dictionary_tag``) lets the decoder detect that it
+    solved the puzzle against a different wordlist.
+    """
+    if len(dictionary_tag) != DICTIONARY_TAG_SIZE:
+        raise ValueError(f"Dictionary tags must be {DICTIONARY_TAG_SIZE} bytes long.")
+    if len(candidates) > 0xFFFF:
+        raise ValueError("Too many candidate words for a bitmap payload.")
+    positions = {word: index for index, word in enumerate(candidates)}
+    bitmap = 0
+    extras = []
+    for word in _validate_words(words, letters, required):
+        index = positions.get(word)
+        if index is None:
+            extras.append(word)
+        else:
+            bitmap |= 1 << (len(candidates) - 1 - index)
+    byte_count = (len(candidates) + 7) // 8
+    data = _BITMAP_HEADER.pack(CANDIDATE_BITMAP_VERSION, dictionary_tag, len(candidates))
+    data += (bitmap << (byte_count * 8 - len(candidates))).to_bytes(byte_count, "big")
+    if extras:
+        data += _encode_terminated_bytes(sorted(extras), letters, required)
+    return _b64encode(data)
+
+
+def decode_candidate_bitmap(
+    payload: str,
+    letters: str,
+    required: str,
+    candidates: Sequence[str],
+    dictionary_tag: bytes,
+) -> list[str]:
+    """Decode words written by ``encode_candidate_bitmap`` against the same candidates."""
+    data = _b64decode(payload)
+    if len(data) < _BITMAP_HEADER.size:
+        raise EOFError("Not enough data to read the requested bits.")
+    version, tag, candidate_count = _BITMAP_HEADER.unpack_from(data)
+    if version != CANDIDATE_BITMAP_VERSION:
+        raise ValueError(f"Unsupported candidate-bitmap payload version {version}.")
+    if tag != dictionary_tag:
+        raise ValueError("Payload was encoded against a different wordlist.")
+    if candidate_count != len(candidates):
+        raise ValueError(
+            f"Payload expects {candidate_count} candidate words; got {len(candidates)}."
+        )
+    start = _BITMAP_HEADER.size
+    end = start + (candidate_count + 7) // 8
+    if len(data) < end:
+        raise EOFError("Not enough data to read the requested bits.")
+    bitmap = format(int.from_bytes(data[start:end], "big"), "b").zfill((end - start) * 8)
+    words = [word for word, bit in zip(candidates, bitmap) if bit == "1"]
+    if len(data) > end:
+        words.extend(_unpack_terminated(data[end:], letters))
+    return sorted(_validate_words(words, letters, required))
+
+
+def encode_many(puzzles: Iterable[tuple[Iterable[str], str, str]]) -> list[str]:
+    """Encode ``(words, letters, required)`` puzzles like ``encode_terminated``.
+
+    Letter tables are built once per distinct letter set, and every payload is
+    packed through a single big-integer conversion. Each payload's digits are
+    zero-padded to a whole number of 3-byte groups so they can be cut apart again.
+    """
+    tables: dict[str, dict[int, str]] = {}
+    chunks = []
+    sizes = []
+    for words, letters, required in puzzles:
+        table = tables.get(letters)
+        if table is None:
+            table = tables[letters] = _encode_table(letters)
+        digits = _terminated_digits(words, letters, required, table)
+        sizes.append((len(digits) * 3 + 7) // 8)
+        chunks.append(digits.ljust(-(-len(digits) // 8) * 8, "0"))
+    if not chunks:
+        return []
+    joined = "".join(chunks)
+    data = int(joined, 8).to_bytes(len(joined) * 3 // 8, "big")
+    payloads = []
+    offset = 0
+    for chunk, size in zip(chunks, sizes):
+        payloads.append(_b64encode(data[offset : offset + size]))
+        offset += len(chunk) * 3 // 8
+    return payloads
+
+
+def decode_many(payloads: Iterable[tuple[str, str, str]]) -> list[list[str]]:
+    """Decode ``(payload, letters, required)`` entries like ``decode_terminated``.
+
+    The payloads are unpacked through a single big-integer conversion, and letter
+    tables are built once per distinct letter set.
+    """
+    entries = []
+    chunks = []
+    for payload, letters, required in payloads:
+        data = _b64decode(payload)
+        entries.append((_digit_count(data, _COUNT_DIGITS), letters, required))
+        chunks.append(data + bytes(-len(data) % 3))
+    if not chunks:
+        return []
+    joined = b"".join(chunks)
+    digits = format(int.from_bytes(joined, "big"), "o").zfill(len(joined) * 8 // 3)
+    tables: dict[str, dict[int, str]] = {}
+    decoded = []
+    offset = 0
+    for chunk, (digit_count, letters, required) in zip(chunks, entries):
+        table = tables.get(letters)
+        if table is None:
+            table = tables[letters] = _decode_table(letters)
+        words = _split_terminated(digits[offset : offset + digit_count], table)
+        decoded.append(_validate_words(words, letters, required))
+        offset += len(chunk) * 8 // 3
+    return decoded
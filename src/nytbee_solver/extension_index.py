@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+from pathlib import Path
+from typing import Optional
+
+from .compiled import wordlist_digest
+from .solver import get_default_wordlist_path, get_word_store, normalize_letters
+from .wordstore import ALPHABET, IRREGULAR_BIT, LETTER_BITS, letter_mask
+
+INDEX_VERSION = 1
+MANIFEST_NAME = "index.json"
+MAX_PUZZLE_LETTERS = 7
+MIN_WORD_LENGTH = 4
+
+
+def get_default_index_dir() -> Path:
+    return Path("safari-extension") / "wordlist" / "index"
+
+
+def _shard_name(letter: str) -> str:
+    return f"{letter}.json"
+
+
+def _write_if_changed(path: Path, text: str) -> bool:
+    if path.exists() and path.read_text(encoding="utf-8") == text:
+        return False
+    temp_path = path.with_name(path.name + ".tmp")
+    temp_path.write_text(text, encoding="utf-8")
+    os.replace(temp_path, path)
+    return True
+
+
+def build_extension_index(
+    wordlist_path: Optional[Path] = None, output_dir: Optional[Path] = None
+) -> bool:
+    """Write per-required-letter shards of mask-grouped words plus a manifest.
+
+    Shard ``<letter>.json`` is a JSON array of ``[mask, "word word ..."]`` groups
+    holding every word of at least four letters that contains ``letter`` and uses
+    at most seven distinct a-z letters, so a client solving a puzzle reads one
+    shard and tests one mask per group. Returns whether any file changed.
+    """
+    wordlist_path = wordlist_path or get_default_wordlist_path()
+    output_dir = output_dir or get_default_index_dir()
+    output_dir.mkdir(parents=True, exist_ok=True)
+    store = get_word_store(wordlist_path)
+
+    shards: dict[str, list[tuple[int, str]]] = {letter: [] for letter in ALPHABET}
+    for mask in sorted(store.masks):
+        if mask & IRREGULAR_BIT or bin(mask).count("1") > MAX_PUZZLE_LETTERS:
+            continue
+        words = sorted(word for word in store.words_for_mask(mask) if len(word) >= MIN_WORD_LENGTH)
+        if not words:
+            continue
+        group = (mask, " ".join(words))
+        for letter in ALPHABET:
+            if mask & LETTER_BITS[letter]:
+                shards[letter].append(group)
+
+    changed = False
+    manifest_shards = {}
+    for letter, groups in shards.items():
+        text = json.dumps(groups, separators=(",", ":")) + "\n"
+        changed = _write_if_changed(output_dir / _shard_name(letter), text) or changed
+        manifest_shards[letter] = {
+            "file": _shard_name(letter),
+            "groups": len(groups),
+            "words": sum(words.count(" ") + 1 for _, words in groups),
+            "bytes": len(text.encode("utf-8")),
+        }
+    manifest = {
+        "version": INDEX_VERSION,
+        "wordlist_sha256": wordlist_digest(wordlist_path).hex(),
+        "min_length": MIN_WORD_LENGTH,
+        "max_letters": MAX_PUZZLE_LETTERS,
+        "shards": manifest_shards,
+    }
+    text = json.dumps(manifest, indent=2) + "\n"
+    return _write_if_changed(output_dir / MANIFEST_NAME, text) or changed
+
+
+def extension_index_is_current(wordlist_path: Path, index_dir: Path) -> bool:
+    """Return whether ``index_dir`` holds an index built from this wordlist version."""
+    try:
+        manifest = json.loads((index_dir / MANIFEST_NAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return False
+    return (
+        manifest.get("version") == INDEX_VERSION
+        and manifest.get("wordlist_sha256") == wordlist_digest(wordlist_path).hex()
+    )
+
+
+class ExtensionIndex:
+    """Reader for an index written by ``build_extension_index``."""
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+        self.manifest = json.loads((directory / MANIFEST_NAME).read_text(encoding="utf-8"))
+        if self.manifest.get("version") != INDEX_VERSION:
+            raise ValueError("Unsupported extension index version.")
+        self._shards: dict[str, list[tuple[int, list[str]]]] = {}
+
+    def shard(self, letter: str) -> list[tuple[int, list[str]]]:
+        """Return the ``(mask, words)`` groups of words containing ``letter``."""
+        groups = self._shards.get(letter)
+        if groups is None:
+            entry = self.manifest["shards"][letter]
+            data = json.loads((self.directory / entry["file"]).read_text(encoding="utf-8"))
+            groups = self._shards[letter] = [(mask, words.split(" ")) for mask, words in data]
+        return groups
+
+    def solve(self, letters: str) -> tuple[list[str], list[str], str, str]:
+        """Solve like ``solve_spelling_bee``, reading only the required letter's shard."""
+        required, cleaned_letters = normalize_letters(letters)
+        allowed = letter_mask(cleaned_letters)
+        if allowed & IRREGULAR_BIT or len(cleaned_letters) > self.manifest["max_letters"]:
+            raise ValueError(
+                f"The extension index covers puzzles of at most "
+                f"{self.manifest['max_letters']} letters a-z."
+            )
+        words: list[str] = []
+        pangrams: list[str] = []
+        for mask, group in self.shard(required):
+            if mask & ~allowed:
+                continue
+            words.extend(group)
+            if mask == allowed:
+                pangrams.extend(group)
+        return sorted(words), sorted(pangrams), cleaned_letters, required
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    """Build the sharded wordlist index bundled with the Safari extension."""
+    parser = argparse.ArgumentParser(
+        prog="python -m nytbee_solver.extension_index",
+        description="Build the per-letter wordlist index for the Safari extension.",
+    )
+    parser.add_argument("--wordlist", type=Path, default=Path("nytbee_dict.txt"))
+    parser.add_argument(
+        "--output-dir",
+        type=Path,
+        default=None,
+        help="Index directory (default: safari-extension/wordlist/index).",
+    )
+    args = parser.parse_args(argv)
+
+    output_dir = args.output_dir or get_default_index_dir()
+    changed = build_extension_index(args.wordlist, output_dir)
+    manifest = json.loads((output_dir / MANIFEST_NAME).read_text(encoding="utf-8"))
+    sizes = [entry["bytes"] for entry in manifest["shards"].values()]
+    print(
+        f"{'Updated' if changed else 'Unchanged'} {output_dir}: 26 shards, "
+        f"largest {max(sizes)} bytes, mean {sum(sizes) // len(sizes)} bytes"
+    )
+
+
+if __name__ == "__main__":
+    main()
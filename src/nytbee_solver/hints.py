@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+import io
+from typing import Iterable, NamedTuple, TextIO
+
+ALPHABETICAL_COLUMNS = 3
+
+
+def _format_grid(counts: dict[str, dict[int, int]]) -> str:
+    row_letters = sorted(counts)
+    col_lengths = sorted({length for letter_counts in counts.values() for length in letter_counts})
+
+    headers: list[str | int] = [""] + [str(length) for length in col_lengths] + ["Total"]
+    rows: list[list[str | int]] = []
+    for letter in row_letters:
+        row_counts = [counts[letter].get(length, 0) for length in col_lengths]
+        rows.append([letter.upper(), *row_counts, sum(row_counts)])
+
+    col_totals = [sum(counts[letter].get(length, 0) for letter in row_letters) for length in col_lengths]
+    rows.append(["Total", *col_totals, sum(col_totals)])
+
+    columns = list(zip(headers, *rows))
+    col_widths = [max(len(str(cell)) for cell in column) for column in columns]
+
+    def format_row(row: list[str | int]) -> str:
+        formatted_cells = []
+        for index, (cell, width) in enumerate(zip(row, col_widths)):
+            cell_text = str(cell)
+            formatted_cells.append(cell_text.ljust(width) if index == 0 else cell_text.rjust(width))
+        return " | ".join(formatted_cells)
+
+    separator = "-+-".join("-" * width for width in col_widths)
+    lines = [format_row(headers), separator]
+    lines.extend(format_row(row) for row in rows)
+    return "\n".join(lines)
+
+
+def _alphabetical_rows(words: tuple[str, ...]) -> list[str]:
+    if not words:
+        return []
+    rows = (len(words) + ALPHABETICAL_COLUMNS - 1) // ALPHABETICAL_COLUMNS
+    column_words = [words[start : start + rows] for start in range(0, len(words), rows)]
+    while len(column_words) < ALPHABETICAL_COLUMNS:
+        column_words.append(())
+    column_widths = [max((len(word) for word in column), default=0) for column in column_words]
+    lines = []
+    for row_index in range(rows):
+        row_entries = []
+        for column, width in zip(column_words, column_widths):
+            word = column[row_index] if row_index < len(column) else ""
+            row_entries.append(word.ljust(width))
+        lines.append("  ".join(row_entries).rstrip())
+    return lines
+
+
+class HintSummary(NamedTuple):
+    """Aggregated hint-page data for one solved puzzle, renderable in several formats."""
+
+    letters: str
+    required: str
+    words: tuple[str, ...]
+    pangrams: tuple[str, ...]
+    perfect_pangram_count: int
+    bingo: bool
+    grid: dict[str, dict[int, int]]
+    by_length: dict[int, list[str]]
+
+    @classmethod
+    def from_solution(
+        cls, words: Iterable[str], pangrams: Iterable[str], letters: str, required: str
+    ) -> "HintSummary":
+        """Build the summary with a single pass over the sorted answers."""
+        sorted_words = tuple(sorted(words))
+        grid: dict[str, dict[int, int]] = {}
+        by_length: dict[int, list[str]] = {}
+        for word in sorted_words:
+            length = len(word)
+            by_length.setdefault(length, []).append(word)
+            if word:
+                row = grid.setdefault(word[0], {})
+                row[length] = row.get(length, 0) + 1
+
+        unique_letters = set(letters)
+        sorted_pangrams = tuple(sorted(pangrams))
+        perfect = sum(
+            1
+            for word in sorted_pangrams
+            if len(word) == len(unique_letters) and set(word) == unique_letters
+        )
+        return cls(
+            letters,
+            required,
+            sorted_words,
+            sorted_pangrams,
+            perfect,
+            unique_letters <= set(grid),
+            grid,
+            dict(sorted(by_length.items())),
+        )
+
+    def write_text(self, stream: TextIO) -> None:
+        """Write the plain-text hint page printed by ``print_hint_page``."""
+        lines = [
+            "NYT Spelling Bee Hint Page",
+            "-" * 30,
+            f"Letters: {', '.join(self.letters)} (required: {self.required})",
+            f"Total words: {len(self.words)}",
+        ]
+        if self.pangrams:
+            pangram_summary = f"Pangrams: {len(self.pangrams)}"
+            if self.perfect_pangram_count:
+                pangram_summary += f" (perfect: {self.perfect_pangram_count})"
+            lines.append(pangram_summary)
+            lines.append("\nPangrams (bolded):")
+            lines.append(", ".join(f"**{word}**" for word in self.pangrams))
+        else:
+            lines.append("Pangrams: 0")
+        if self.bingo:
+            lines.append("BINGO")
+
+        lines.append("\nSpelling Bee Grid:")
+        lines.append(_format_grid(self.grid))
+        lines.append("\nBy length:")
+        for length, group in self.by_length.items():
+            lines.append(f"{length} letters ({len(group)}): {', '.join(group)}")
+        lines.append("\nAlphabetical:")
+        lines.extend(_alphabetical_rows(self.words))
+        stream.write("\n".join(lines) + "\n")
+
+    def write_markdown(self, stream: TextIO) -> None:
+        """Write the hint page as Markdown with a table for the grid."""
+        lines = [
+            "## NYT Spelling Bee Hint Page",
+            "",
+            f"- **Letters:** {', '.join(self.letters)} (required: **{self.required}**)",
+            f"- **Total words:** {len(self.words)}",
+        ]
+        pangram_summary = f"- **Pangrams:** {len(self.pangrams)}"
+        if self.perfect_pangram_count:
+            pangram_summary += f" (perfect: {self.perfect_pangram_count})"
+        if self.pangrams:
+            pangram_summary += " — " + ", ".join(f"**{word}**" for word in self.pangrams)
+        lines.append(pangram_summary)
+        if self.bingo:
+            lines.append("- **BINGO**")
+
+        lengths = sorted({length for row in self.grid.values() for length in row})
+        lines.extend(["", "### Spelling Bee Grid", ""])
+        lines.append("| | " + " | ".join(str(length) for length in lengths) + " | Total |")
+        lines.append("|---|" + "---:|" * (len(lengths) + 1))
+        for letter in sorted(self.grid):
+            counts = [self.grid[letter].get(length, 0) for length in lengths]
+            cells = " | ".join(str(count) for count in [*counts, sum(counts)])
+            lines.append(f"| {letter.upper()} | {cells} |")
+        totals = [sum(row.get(length, 0) for row in self.grid.values()) for length in lengths]
+        lines.append(
+            "| **Total** | " + " | ".join(str(count) for count in [*totals, sum(totals)]) + " |"
+        )
+
+        lines.extend(["", "### By length", ""])
+        for length, group in self.by_length.items():
+            lines.append(f"- **{length} letters ({len(group)}):** {', '.join(group)}")
+        stream.write("\n".join(lines) + "\n")
+
+    def write_json(self, stream: TextIO) -> None:
+        """Write the summary as a JSON object."""
+        import json
+
+        json.dump(self.to_dict(), stream, indent=2)
+        stream.write("\n")
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            "letters": self.letters,
+            "required": self.required,
+            "total_words": len(self.words),
+            "pangrams": list(self.pangrams),
+            "perfect_pangrams": self.perfect_pangram_count,
+            "bingo": self.bingo,
+            "grid": {
+                letter.upper(): {str(length): count for length, count in sorted(row.items())}
+                for letter, row in sorted(self.grid.items())
+            },
+            "by_length": {str(length): group for length, group in self.by_length.items()},
+            "words": list(self.words),
+        }
+
+    def to_text(self) -> str:
+        return self._render(self.write_text)
+
+    def to_markdown(self) -> str:
+        return self._render(self.write_markdown)
+
+    def to_json(self) -> str:
+        return self._render(self.write_json)
+
+    @staticmethod
+    def _render(writer) -> str:
+        buffer = io.StringIO()
+        writer(buffer)
+        return buffer.getvalue()
@@ -1,56 +1,211 @@
 from __future__ import annotations
 
 import argparse
-import io
-from contextlib import redirect_stdout
-from datetime import date
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import ExitStack
+from datetime import date, timedelta
 from pathlib import Path
+from typing import Optional
 
+from nytbee_scrapper.client import HttpClient
+from nytbee_scrapper.scraper import RateLimiter
+from nytbee_scrapper.metrics import (
+    Metrics,
+    add_metrics_arguments,
+    get_metrics,
+    metrics_from_args,
+    report_metrics,
+    use_metrics,
+)
+from nytbee_solver import solver
 from nytbee_solver.encoding import encode_terminated
-from nytbee_solver.solver import print_hint_page, solve_spelling_bee
-from nytbee_solver.solver import get_todays_puzzle_letters
+from nytbee_solver.hints import HintSummary
+from nytbee_solver.shared import attach_wordlist, share_wordlist
+from nytbee_solver.solver import get_puzzle_letters, solve_spelling_bee
 
 
 def _solve_daily_puzzle(
     puzzle_date: date | None = None,
+    client: Optional[HttpClient] = None,
+    letters: Optional[str] = None,
+    wordlist_path: Optional[Path] = None,
 ) -> tuple[date, str, list[str], list[str], str, str]:
     resolved_date = puzzle_date or date.today()
-    letters = get_todays_puzzle_letters()
-    words, pangrams, cleaned_letters, required = solve_spelling_bee(letters)
+    metrics = get_metrics()
+    if letters is None:
+        with metrics.timer("puzzle_letters_seconds"):
+            letters = get_puzzle_letters(resolved_date, client=client)
+    with metrics.timer("solve_seconds"):
+        words, pangrams, cleaned_letters, required = solve_spelling_bee(letters, wordlist_path)
     return resolved_date, letters, words, pangrams, cleaned_letters, required
 
 
 def _render_hint_page(words: list[str], pangrams: list[str], letters: str, required: str) -> str:
-    buffer = io.StringIO()
-    with redirect_stdout(buffer):
-        print_hint_page(words, pangrams, letters, required)
-    return buffer.getvalue()
+    return HintSummary.from_solution(words, pangrams, letters, required).to_text()
 
 
-def generate_daily_results(output_dir: Path, puzzle_date: date | None = None) -> tuple[Path, Path]:
-    """Generate today's Spelling Bee results and write them to dated files."""
+def _results_paths(output_dir: Path, puzzle_date: date) -> tuple[Path, Path]:
+    return (
+        output_dir / f"{puzzle_date.isoformat()}.txt",
+        output_dir / f"{puzzle_date.isoformat()}.encoded.txt",
+    )
+
+
+def _write_if_changed(path: Path, content: str) -> bool:
+    if path.exists() and path.read_text(encoding="utf-8") == content:
+        return False
+    path.write_text(content, encoding="utf-8")
+    return True
+
+
+def _write_daily_results(
+    output_dir: Path,
+    puzzle_date: date | None,
+    client: Optional[HttpClient] = None,
+    letters: Optional[str] = None,
+    wordlist_path: Optional[Path] = None,
+) -> tuple[Path, Path, bool]:
     output_dir.mkdir(parents=True, exist_ok=True)
     resolved_date, letters, words, pangrams, cleaned_letters, required = _solve_daily_puzzle(
-        puzzle_date
+        puzzle_date, client, letters, wordlist_path
     )
-    hint_page = _render_hint_page(words, pangrams, cleaned_letters, required)
-    output_path = output_dir / f"{resolved_date.isoformat()}.txt"
-    output_path.write_text(
+    metrics = get_metrics()
+    with metrics.timer("render_seconds"):
+        hint_page = _render_hint_page(words, pangrams, cleaned_letters, required)
+    with metrics.timer("encode_seconds"):
+        encoded = encode_terminated(words, cleaned_letters, required)
+    output_path, encoded_path = _results_paths(output_dir, resolved_date)
+    changed = _write_if_changed(
+        output_path,
         "NYT Spelling Bee Daily Results\n"
         f"Date: {resolved_date.isoformat()}\n"
         f"Letters: {letters}\n\n"
         f"{hint_page}",
-        encoding="utf-8",
     )
+    changed = _write_if_changed(encoded_path, encoded) or changed
+    return output_path, encoded_path, changed
 
-    encoded_path = output_dir / f"{resolved_date.isoformat()}.encoded.txt"
-    encoded_path.write_text(
-        encode_terminated(words, cleaned_letters, required),
-        encoding="utf-8",
+
+def generate_daily_results(
+    output_dir: Path,
+    puzzle_date: date | None = None,
+    client: Optional[HttpClient] = None,
+    wordlist_path: Optional[Path] = None,
+) -> tuple[Path, Path]:
+    """Generate a day's Spelling Bee results (default: today) and write them to dated files."""
+    output_path, encoded_path, _ = _write_daily_results(
+        output_dir, puzzle_date, client, wordlist_path=wordlist_path
     )
     return output_path, encoded_path
 
 
+def _fetch_backfill_letters(
+    puzzle_date: date, client: Optional[HttpClient], rate_limiter: Optional[RateLimiter]
+) -> tuple[date, Optional[str], Optional[str]]:
+    try:
+        with get_metrics().timer("puzzle_letters_seconds"):
+            letters = get_puzzle_letters(puzzle_date, client=client, rate_limiter=rate_limiter)
+    except (RuntimeError, ValueError) as exc:
+        return puzzle_date, None, f"failed: {exc}"
+    return puzzle_date, letters, None
+
+
+def _backfill_day(
+    output_dir: Path,
+    puzzle_date: date,
+    letters: str,
+    wordlist_path: Path,
+    collect_metrics: bool = False,
+) -> tuple[date, str, Optional[Metrics]]:
+    # Workers record into their own Metrics, which the parent merges.
+    metrics = Metrics() if collect_metrics else None
+    with use_metrics(metrics or get_metrics()):
+        try:
+            _, _, changed = _write_daily_results(
+                output_dir, puzzle_date, letters=letters, wordlist_path=wordlist_path
+            )
+        except (RuntimeError, ValueError) as exc:
+            return puzzle_date, f"failed: {exc}", metrics
+    return puzzle_date, "written" if changed else "unchanged", metrics
+
+
+def backfill_results(
+    output_dir: Path,
+    start_date: date,
+    end_date: date,
+    *,
+    max_workers: Optional[int] = None,
+    force: bool = False,
+    client: Optional[HttpClient] = None,
+    max_requests_per_second: Optional[float] = None,
+    wordlist_path: Optional[Path] = None,
+) -> list[tuple[date, str]]:
+    """Regenerate dated results for every day in ``start_date..end_date``.
+
+    Days whose hint page and encoded file both exist are skipped unless ``force``
+    is set; regenerated files are only rewritten when their content changed.
+    Puzzle letters are fetched in this process on up to ``max_workers`` threads,
+    through ``client`` (and its response cache) and capped at
+    ``max_requests_per_second``. Solving and rendering then run in worker
+    processes that attach ``wordlist_path`` (default: the bundled wordlist) as
+    published by ``share_wordlist``.
+    """
+    if end_date < start_date:
+        raise ValueError("end_date must not be before start_date")
+    output_dir.mkdir(parents=True, exist_ok=True)
+    wordlist_path = wordlist_path or solver.get_default_wordlist_path()
+    outcomes: list[tuple[date, str]] = []
+    pending = []
+    day = start_date
+    while day <= end_date:
+        if not force and all(path.exists() for path in _results_paths(output_dir, day)):
+            outcomes.append((day, "skipped"))
+        else:
+            pending.append(day)
+        day += timedelta(days=1)
+
+    rate_limiter = (
+        RateLimiter(max_requests_per_second) if max_requests_per_second is not None else None
+    )
+    fetch_args = ([client] * len(pending), [rate_limiter] * len(pending))
+    if max_workers == 1 or len(pending) <= 1:
+        fetched = list(map(_fetch_backfill_letters, pending, *fetch_args))
+    else:
+        with ThreadPoolExecutor(max_workers=max_workers) as threads:
+            fetched = list(threads.map(_fetch_backfill_letters, pending, *fetch_args))
+    solvable = []
+    for day, letters, failure in fetched:
+        if failure is not None:
+            outcomes.append((day, failure))
+        else:
+            solvable.append((day, letters))
+
+    metrics = get_metrics()
+    if max_workers == 1 or len(solvable) <= 1:
+        results = [
+            _backfill_day(output_dir, day, letters, wordlist_path) for day, letters in solvable
+        ]
+    else:
+        with share_wordlist(wordlist_path) as wordlist, ProcessPoolExecutor(
+            max_workers=max_workers, initializer=attach_wordlist, initargs=(wordlist,)
+        ) as executor:
+            results = list(
+                executor.map(
+                    _backfill_day,
+                    [output_dir] * len(solvable),
+                    [day for day, _ in solvable],
+                    [letters for _, letters in solvable],
+                    [wordlist_path] * len(solvable),
+                    [metrics.enabled] * len(solvable),
+                )
+            )
+    for puzzle_date, outcome, worker_metrics in results:
+        outcomes.append((puzzle_date, outcome))
+        if worker_metrics is not None:
+            metrics.merge(worker_metrics)
+    return sorted(outcomes)
+
+
 def update_latest_files(output_dir: Path, output_path: Path, encoded_path: Path) -> tuple[Path, Path]:
     """Write latest copies of the hint page and encoded output."""
     latest_hint_path = output_dir / "latest.txt"
@@ -72,12 +227,87 @@ def main() -> None:
         default=Path("results"),
         help="Directory to write daily results files into.",
     )
+    parser.add_argument(
+        "--index",
+        type=Path,
+        default=None,
+        help="Update this results index (see nytbee_solver.archive) after writing.",
+    )
+    parser.add_argument(
+        "--start-date",
+        type=date.fromisoformat,
+        default=None,
+        help="Backfill results from this date (YYYY-MM-DD) instead of publishing today's.",
+    )
+    parser.add_argument(
+        "--end-date",
+        type=date.fromisoformat,
+        default=None,
+        help="Last date to backfill, inclusive; requires --start-date (default: today).",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of worker processes used for backfills (default: CPU count).",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Regenerate backfill dates even when their results files already exist.",
+    )
+    parser.add_argument(
+        "--rate-limit",
+        type=float,
+        default=None,
+        metavar="REQUESTS_PER_SECOND",
+        help="Maximum number of backfill page requests started per second (default: unlimited).",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Fetch backfill pages without reading or writing the HTTP response cache.",
+    )
+    add_metrics_arguments(parser)
     args = parser.parse_args()
+    if args.end_date is not None and args.start_date is None:
+        parser.error("--end-date requires --start-date")
+
+    metrics = metrics_from_args(args)
+    with use_metrics(metrics):
+        _publish(args)
+    report_metrics(metrics, args)
+
+
+def _publish(args: argparse.Namespace) -> None:
+    if args.start_date is not None:
+        from nytbee_scrapper.cache import ResponseCache
+
+        with ExitStack() as stack:
+            cache = None if args.no_cache else stack.enter_context(ResponseCache.open_default())
+            client = stack.enter_context(HttpClient(cache=cache))
+            outcomes = backfill_results(
+                args.output_dir,
+                args.start_date,
+                args.end_date or date.today(),
+                max_workers=args.workers,
+                force=args.force,
+                client=client,
+                max_requests_per_second=args.rate_limit,
+            )
+        for puzzle_date, outcome in outcomes:
+            print(f"{puzzle_date.isoformat()}: {outcome}")
+    else:
+        output_path, encoded_path = generate_daily_results(args.output_dir)
+        update_latest_files(args.output_dir, output_path, encoded_path)
+        print(f"Wrote results to {output_path}")
+        print(f"Wrote encoded results to {encoded_path}")
+    if args.index is not None:
+        from nytbee_solver.archive import ResultsIndex
 
-    output_path, encoded_path = generate_daily_results(args.output_dir)
-    update_latest_files(args.output_dir, output_path, encoded_path)
-    print(f"Wrote results to {output_path}")
-    print(f"Wrote encoded results to {encoded_path}")
+        with ResultsIndex(args.index) as index:
+            index.update(args.output_dir)
+        print(f"Updated results index {args.index}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,296 @@
+from __future__ import annotations
+
+import argparse
+import os
+import struct
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Iterator, NamedTuple, Optional, Sequence
+
+from .compiled import wordlist_digest
+from .solver import get_default_wordlist_path, get_word_store, normalize_letters
+from .wordstore import ALPHABET, IRREGULAR_BIT, LETTER_BITS, WordStore
+
+MAGIC = b"NYTBPZX\0"
+FORMAT_VERSION = 2
+PUZZLE_SIZE = 7
+# magic, version, record count, string table bytes, wordlist sha256
+_HEADER = struct.Struct("<8sHII32s")
+# letter mask, then word count, pangram count, perfect pangram count and longest
+# word index for each of the seven required letters in alphabetical order.
+_RECORD = struct.Struct("<I" + "IIII" * PUZZLE_SIZE)
+
+# Aggregated (word count, longest word) per letter mask, shared with pool workers.
+_MASK_TABLE: dict[int, tuple[int, str]] = {}
+
+
+class PuzzleStats(NamedTuple):
+    letters: str
+    required: str
+    word_count: int
+    pangram_count: int
+    perfect_pangram_count: int
+    longest_word: str
+
+
+def get_default_puzzle_index_path(wordlist_path: Path) -> Path:
+    """Return where the puzzle index for a wordlist is stored by default."""
+    return wordlist_path.with_name(f"{wordlist_path.name}.puzzles")
+
+
+def _mask_letters(mask: int) -> str:
+    return "".join(letter for letter in ALPHABET if mask & LETTER_BITS[letter])
+
+
+def _longer(candidate: str, current: str) -> bool:
+    return len(candidate) > len(current) or (
+        len(candidate) == len(current) and candidate < current
+    )
+
+
+def _build_mask_table(store: WordStore, min_length: int = 4) -> dict[int, tuple[int, str]]:
+    table: dict[int, tuple[int, str]] = {}
+    for mask in store.masks:
+        if mask & IRREGULAR_BIT:
+            continue
+        words = [word for word in store.words_for_mask(mask) if len(word) >= min_length]
+        if not words:
+            continue
+        longest = words[0]
+        for word in words[1:]:
+            if _longer(word, longest):
+                longest = word
+        table[mask] = (len(words), longest)
+    return table
+
+
+def _init_worker(table: dict[int, tuple[int, str]]) -> None:
+    global _MASK_TABLE
+    _MASK_TABLE = table
+
+
+def _aggregate_puzzles(
+    puzzle_masks: Sequence[int],
+) -> list[tuple[int, list[tuple[int, str]]]]:
+    """Sum word counts over every submask of each puzzle, per required letter."""
+    table = _MASK_TABLE
+    results = []
+    for puzzle in puzzle_masks:
+        letter_bits = [bit for bit in LETTER_BITS.values() if puzzle & bit]
+        counts = [0] * len(letter_bits)
+        longest = [""] * len(letter_bits)
+        submask = puzzle
+        while submask:
+            entry = table.get(submask)
+            if entry is not None:
+                count, word = entry
+                for position, bit in enumerate(letter_bits):
+                    if submask & bit:
+                        counts[position] += count
+                        if _longer(word, longest[position]):
+                            longest[position] = word
+            submask = (submask - 1) & puzzle
+        results.append((puzzle, list(zip(counts, longest))))
+    return results
+
+
+def _chunks(values: Sequence[int], size: int) -> Iterator[Sequence[int]]:
+    for start in range(0, len(values), size):
+        yield values[start : start + size]
+
+
+def build_puzzle_index(
+    wordlist_path: Optional[Path] = None,
+    output_path: Optional[Path] = None,
+    *,
+    max_workers: Optional[int] = None,
+    chunk_size: int = 256,
+) -> Path:
+    """Enumerate every pangram letter set and write per-required-letter stats."""
+    if wordlist_path is None:
+        wordlist_path = get_default_wordlist_path()
+    if output_path is None:
+        output_path = get_default_puzzle_index_path(wordlist_path)
+
+    store = get_word_store(wordlist_path)
+    table = _build_mask_table(store)
+    puzzle_masks = sorted(mask for mask in table if bin(mask).count("1") == PUZZLE_SIZE)
+
+    if max_workers == 1 or len(puzzle_masks) <= chunk_size:
+        _init_worker(table)
+        aggregated = _aggregate_puzzles(puzzle_masks)
+    else:
+        aggregated = []
+        with ProcessPoolExecutor(
+            max_workers=max_workers, initializer=_init_worker, initargs=(table,)
+        ) as executor:
+            for chunk in executor.map(_aggregate_puzzles, _chunks(puzzle_masks, chunk_size)):
+                aggregated.extend(chunk)
+
+    strings: dict[str, int] = {}
+    records = []
+    for puzzle, per_letter in aggregated:
+        pangrams = store.words_for_mask(puzzle)
+        perfect = sum(1 for word in pangrams if len(word) == PUZZLE_SIZE)
+        fields: list[int] = [puzzle]
+        for count, longest in per_letter:
+            fields.extend(
+                (count, len(pangrams), perfect, strings.setdefault(longest, len(strings)))
+            )
+        records.append(_RECORD.pack(*fields))
+
+    string_table = "\n".join(strings).encode("utf-8")
+    header = _HEADER.pack(
+        MAGIC, FORMAT_VERSION, len(records), len(string_table), wordlist_digest(wordlist_path)
+    )
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = output_path.with_name(f".{output_path.name}.{os.getpid()}.tmp")
+    temp_path.write_bytes(header + b"".join(records) + string_table)
+    os.replace(temp_path, output_path)
+    return output_path
+
+
+class PuzzleIndex:
+    """Constant-time lookup over a precomputed puzzle index."""
+
+    def __init__(self, data: bytes) -> None:
+        if len(data) < _HEADER.size:
+            raise ValueError("Puzzle index is truncated.")
+        magic, version, count, string_size, digest = _HEADER.unpack_from(data)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError("Unsupported puzzle index format.")
+        records_end = _HEADER.size + count * _RECORD.size
+        if len(data) != records_end + string_size:
+            raise ValueError("Puzzle index is truncated.")
+        self.digest = digest
+        self._data = data
+        self._strings = data[records_end:].decode("utf-8").split("\n")
+        self._positions = {
+            struct.unpack_from("<I", data, _HEADER.size + index * _RECORD.size)[0]: index
+            for index in range(count)
+        }
+
+    @classmethod
+    def open(cls, path: Path, wordlist_path: Optional[Path] = None) -> "PuzzleIndex":
+        """Read a puzzle index written by :func:`build_puzzle_index`.
+
+        With ``wordlist_path``, raise ``ValueError`` if the index was built from a
+        different version of that wordlist.
+        """
+        index = cls(path.read_bytes())
+        if wordlist_path is not None and index.digest != wordlist_digest(wordlist_path):
+            raise ValueError(f"Puzzle index {path} is out of date for {wordlist_path}.")
+        return index
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __contains__(self, letters: object) -> bool:
+        if not isinstance(letters, str):
+            return False
+        return self._mask_for(letters) in self._positions
+
+    @staticmethod
+    def _mask_for(letters: str) -> int:
+        mask = 0
+        for letter in letters.lower():
+            mask |= LETTER_BITS.get(letter, 0)
+        return mask
+
+    def _record_stats(self, index: int) -> list[PuzzleStats]:
+        fields = _RECORD.unpack_from(self._data, _HEADER.size + index * _RECORD.size)
+        letters = _mask_letters(fields[0])
+        stats = []
+        for position, required in enumerate(letters):
+            count, pangrams, perfect, longest = fields[1 + 4 * position : 5 + 4 * position]
+            others = letters.replace(required, "")
+            stats.append(
+                PuzzleStats(
+                    required + others, required, count, pangrams, perfect, self._strings[longest]
+                )
+            )
+        return stats
+
+    def lookup(self, letters: str) -> Optional[PuzzleStats]:
+        """Return stats for a puzzle given as seven letters with the required letter first."""
+        required, cleaned_letters = normalize_letters(letters)
+        if len(cleaned_letters) != PUZZLE_SIZE:
+            return None
+        index = self._positions.get(self._mask_for(cleaned_letters))
+        if index is None:
+            return None
+        for stats in self._record_stats(index):
+            if stats.required == required:
+                return stats
+        return None
+
+    def __iter__(self) -> Iterator[PuzzleStats]:
+        for index in range(len(self._positions)):
+            yield from self._record_stats(index)
+
+
+def main() -> None:
+    """Build the puzzle index or look up puzzles in it."""
+    parser = argparse.ArgumentParser(
+        description="Precompute stats for every Spelling Bee puzzle the wordlist allows."
+    )
+    parser.add_argument(
+        "--wordlist",
+        type=Path,
+        default=None,
+        help=(
+            "Path to the wordlist file to use instead of the default cache. A compiled "
+            "copy (WORDLIST.idx) is written next to it when that directory is writable."
+        ),
+    )
+    parser.add_argument(
+        "--index",
+        type=Path,
+        default=None,
+        help="Path of the puzzle index (default: next to the wordlist).",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of worker processes used to build the index (default: CPU count).",
+    )
+    parser.add_argument(
+        "--lookup",
+        nargs="*",
+        default=None,
+        metavar="LETTERS",
+        help="Look up puzzles (required letter first) instead of building the index.",
+    )
+    args = parser.parse_args()
+
+    wordlist_path = args.wordlist or get_default_wordlist_path()
+    index_path = args.index or get_default_puzzle_index_path(wordlist_path)
+    if args.lookup is None:
+        build_puzzle_index(wordlist_path, index_path, max_workers=args.workers)
+        print(f"Wrote {len(PuzzleIndex.open(index_path))} puzzles to {index_path}")
+        return
+
+    try:
+        index = PuzzleIndex.open(index_path, wordlist_path)
+    except ValueError as exc:
+        print(f"{exc} Rebuilding it.", file=sys.stderr)
+        build_puzzle_index(wordlist_path, index_path, max_workers=args.workers)
+        index = PuzzleIndex.open(index_path, wordlist_path)
+    for letters in args.lookup:
+        try:
+            stats = index.lookup(letters)
+        except ValueError:
+            stats = None
+        if stats is None:
+            print(f"{letters}: not a valid puzzle")
+            continue
+        print(
+            f"{stats.letters}: {stats.word_count} words, {stats.pangram_count} pangrams "
+            f"(perfect: {stats.perfect_pangram_count}), longest: {stats.longest_word}"
+        )
+
+
+if __name__ == "__main__":
+    main()
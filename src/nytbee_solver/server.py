@@ -0,0 +1,271 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import socketserver
+import stat
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Callable, Optional
+from urllib.parse import parse_qs, urlsplit
+
+from .encoding import encode_front_coded, encode_terminated
+from .hints import HintSummary
+from .solver import ensure_wordlist, get_default_wordlist_path, get_word_store, normalize_letters
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+LATENCY_WINDOW = 1024
+
+HINT_FORMATS = ("text", "markdown", "json")
+ENCODE_FORMATS = ("terminated", "front-coded")
+
+
+class LatencyStats:
+    """Request counts and a rolling window of latencies for one endpoint."""
+
+    def __init__(self, window: int = LATENCY_WINDOW) -> None:
+        self._lock = threading.Lock()
+        self._recent: deque[float] = deque(maxlen=window)
+        self.count = 0
+        self.errors = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+
+    def record(self, seconds: float, error: bool = False) -> None:
+        with self._lock:
+            self._recent.append(seconds)
+            self.count += 1
+            self.errors += error
+            self.total_seconds += seconds
+            self.max_seconds = max(self.max_seconds, seconds)
+
+    def snapshot(self) -> dict[str, float]:
+        with self._lock:
+            recent = sorted(self._recent)
+            count = self.count
+
+            def percentile(fraction: float) -> float:
+                if not recent:
+                    return 0.0
+                return recent[min(len(recent) - 1, int(fraction * len(recent)))]
+
+            return {
+                "count": count,
+                "errors": self.errors,
+                "mean_ms": 1000 * self.total_seconds / count if count else 0.0,
+                "p50_ms": 1000 * percentile(0.5),
+                "p99_ms": 1000 * percentile(0.99),
+                "max_ms": 1000 * self.max_seconds,
+            }
+
+
+class SolverService:
+    """Wordlist and indexes loaded once, answering solve, hint and encode requests."""
+
+    def __init__(self, wordlist_path: Optional[Path] = None) -> None:
+        self.wordlist_path = wordlist_path or get_default_wordlist_path()
+        ensure_wordlist(self.wordlist_path)
+        self._store = get_word_store(self.wordlist_path)
+        self.started_at = time.time()
+        self.stats: dict[str, LatencyStats] = {
+            name: LatencyStats() for name in ("solve", "hint", "encode")
+        }
+
+    def solve(self, letters: str) -> tuple[list[str], list[str], str, str]:
+        required, cleaned_letters = normalize_letters(letters)
+        words, pangrams = self._store.matching(cleaned_letters, required)
+        return words, pangrams, cleaned_letters, required
+
+    def solve_json(self, letters: str) -> dict[str, object]:
+        words, pangrams, cleaned_letters, required = self.solve(letters)
+        return {
+            "letters": cleaned_letters,
+            "required": required,
+            "words": words,
+            "pangrams": pangrams,
+        }
+
+    def hint(self, letters: str, output_format: str = "text") -> str:
+        if output_format not in HINT_FORMATS:
+            raise ValueError(f"Unknown hint format {output_format!r}.")
+        summary = HintSummary.from_solution(*self.solve(letters))
+        if output_format == "json":
+            return summary.to_json()
+        if output_format == "markdown":
+            return summary.to_markdown()
+        return summary.to_text()
+
+    def encode(self, letters: str, output_format: str = "terminated") -> str:
+        if output_format not in ENCODE_FORMATS:
+            raise ValueError(f"Unknown encoding {output_format!r}.")
+        words, _, cleaned_letters, required = self.solve(letters)
+        if output_format == "front-coded":
+            return encode_front_coded(words, cleaned_letters, required)
+        return encode_terminated(words, cleaned_letters, required)
+
+    def metrics(self) -> dict[str, object]:
+        return {
+            "wordlist": str(self.wordlist_path),
+            "words": len(self._store),
+            "uptime_seconds": time.time() - self.started_at,
+            "endpoints": {name: stats.snapshot() for name, stats in self.stats.items()},
+        }
+
+
+class SolverRequestHandler(BaseHTTPRequestHandler):
+    """HTTP front end for a ``SolverService`` bound to the server as ``service``."""
+
+    protocol_version = "HTTP/1.1"
+    server_version = "nytbee-solver"
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        parts = urlsplit(self.path)
+        query = {key: values[-1] for key, values in parse_qs(parts.query).items()}
+        service: SolverService = self.server.service  # type: ignore[attr-defined]
+        handlers: dict[str, Callable[[], tuple[str, str]]] = {
+            "/solve": lambda: (_json_body(service.solve_json(query.get("letters", ""))), "json"),
+            "/hint": lambda: _hint_response(service, query),
+            "/encode": lambda: (
+                service.encode(query.get("letters", ""), query.get("format", "terminated")),
+                "text",
+            ),
+            "/metrics": lambda: (_json_body(service.metrics()), "json"),
+        }
+        handler = handlers.get(parts.path.rstrip("/") or "/")
+        if handler is None:
+            self._send(404, _json_body({"error": f"Unknown endpoint {parts.path}"}), "json")
+            return
+
+        stats = service.stats.get(parts.path.strip("/"))
+        start = time.perf_counter()
+        try:
+            body, content_type = handler()
+        except ValueError as exc:
+            if stats is not None:
+                stats.record(time.perf_counter() - start, error=True)
+            self._send(400, _json_body({"error": str(exc)}), "json")
+            return
+        except Exception as exc:
+            if stats is not None:
+                stats.record(time.perf_counter() - start, error=True)
+            self._send(500, _json_body({"error": f"Internal error: {exc}"}), "json")
+            return
+        if stats is not None:
+            stats.record(time.perf_counter() - start)
+        self._send(200, body, content_type)
+
+    def _send(self, status: int, body: str, content_type: str) -> None:
+        payload = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header(
+            "Content-Type",
+            "application/json" if content_type == "json" else "text/plain; charset=utf-8",
+        )
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+def _json_body(data: object) -> str:
+    return json.dumps(data) + "\n"
+
+
+def _hint_response(service: SolverService, query: dict[str, str]) -> tuple[str, str]:
+    output_format = query.get("format", "text")
+    body = service.hint(query.get("letters", ""), output_format)
+    return body, "json" if output_format == "json" else "text"
+
+
+class SolverHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], service: SolverService) -> None:
+        self.service = service
+        super().__init__(address, SolverRequestHandler)
+
+
+if hasattr(socketserver, "ThreadingUnixStreamServer"):
+
+    class SolverUnixServer(socketserver.ThreadingUnixStreamServer):
+        daemon_threads = True
+
+        def __init__(self, path: str, service: SolverService) -> None:
+            self.service = service
+            super().__init__(path, SolverRequestHandler)
+
+        def get_request(self):  # type: ignore[no-untyped-def]
+            request, _ = super().get_request()
+            # BaseHTTPRequestHandler expects an (address, port) client address.
+            return request, ("unix", 0)
+
+
+def _is_socket(path: Path) -> bool:
+    try:
+        return stat.S_ISSOCK(path.lstat().st_mode)
+    except FileNotFoundError:
+        return False
+
+
+def create_server(
+    service: SolverService,
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    unix_socket: Optional[Path] = None,
+) -> socketserver.BaseServer:
+    """Bind a threaded HTTP server for ``service`` on TCP or a Unix socket."""
+    if unix_socket is None:
+        return SolverHTTPServer((host, port), service)
+    if not hasattr(socketserver, "ThreadingUnixStreamServer"):
+        raise OSError("Unix sockets are not supported on this platform.")
+    if _is_socket(unix_socket):
+        unix_socket.unlink()
+    elif os.path.lexists(unix_socket):
+        raise FileExistsError(f"{unix_socket} exists and is not a socket.")
+    return SolverUnixServer(os.fspath(unix_socket), service)
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    """Serve solve, hint and encode requests from a preloaded wordlist."""
+    parser = argparse.ArgumentParser(
+        prog="nytbee-solver serve",
+        description="Serve Spelling Bee solutions over HTTP from a preloaded wordlist.",
+    )
+    parser.add_argument("--host", default=DEFAULT_HOST, help="Interface to bind (TCP mode).")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="Port to bind (TCP mode).")
+    parser.add_argument(
+        "--unix-socket",
+        type=Path,
+        default=None,
+        help="Serve on this Unix socket path instead of TCP.",
+    )
+    parser.add_argument(
+        "--wordlist",
+        type=Path,
+        default=None,
+        help=(
+            "Path to the wordlist file to use instead of the default cache. A compiled "
+            "copy (WORDLIST.idx) is written next to it when that directory is writable."
+        ),
+    )
+    args = parser.parse_args(argv)
+
+    service = SolverService(args.wordlist)
+    server = create_server(service, args.host, args.port, args.unix_socket)
+    where = args.unix_socket or f"http://{args.host}:{server.server_address[1]}"
+    print(f"Serving {service.metrics()['words']} words on {where}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if args.unix_socket is not None and _is_socket(args.unix_socket):
+            args.unix_socket.unlink()
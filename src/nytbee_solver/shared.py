@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import mmap
+import os
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, NamedTuple
+
+from .compiled import CompiledWordlist, get_compiled_wordlist_path, load_compiled_wordlist
+from .solver import _WORD_STORES, _cache_word_store, ensure_wordlist
+from .wordstore import WordStore
+
+
+class SharedWordlist(NamedTuple):
+    """Picklable handle to a compiled wordlist published for worker processes.
+
+    Workers map ``compiled_path`` read-only, so every process reads the same
+    physical pages from the page cache.
+    """
+
+    wordlist_path: Path
+    signature: tuple[int, int]
+    digest: bytes
+    compiled_path: Path
+
+
+@contextmanager
+def share_wordlist(wordlist_path: Path) -> Iterator[SharedWordlist]:
+    """Publish the compiled wordlist once for the duration of a worker pool.
+
+    Pass the handle to :func:`attach_wordlist` as the pool initializer so workers
+    solve from the shared buffers instead of loading the wordlist themselves. When
+    the compiled file cannot be written next to the source, it is published as a
+    temporary file that is removed on exit.
+    """
+    ensure_wordlist(wordlist_path)
+    resolved = wordlist_path.resolve()
+    stat = resolved.stat()
+    signature = (stat.st_mtime_ns, stat.st_size)
+    compiled = load_compiled_wordlist(resolved)
+    temp_path = None
+    try:
+        if isinstance(compiled._buffer, mmap.mmap):
+            compiled_path = get_compiled_wordlist_path(resolved)
+        else:
+            handle, temp_name = tempfile.mkstemp(prefix=f"{resolved.name}.", suffix=".idx")
+            temp_path = compiled_path = Path(temp_name)
+            try:
+                with os.fdopen(handle, "wb") as temp_file:
+                    temp_file.write(compiled._buffer)
+            except BaseException:
+                temp_path.unlink()
+                raise
+        shared = SharedWordlist(resolved, signature, compiled.digest, compiled_path)
+    finally:
+        compiled.close()
+    try:
+        yield shared
+    finally:
+        if temp_path is not None:
+            # Workers that still map the file keep its pages until they exit.
+            temp_path.unlink()
+
+
+def attach_wordlist(handle: SharedWordlist) -> WordStore:
+    """Attach a published wordlist and make it this process's store for its path.
+
+    Later ``get_word_store`` and ``solve_spelling_bee`` calls for the same wordlist
+    reuse the attached store while the source file is unchanged.
+    """
+    cached = _WORD_STORES.get(handle.wordlist_path)
+    if cached is not None and cached[0] == handle.signature:
+        return cached[1]
+    compiled = CompiledWordlist.open(handle.compiled_path)
+    if compiled.digest != handle.digest:
+        compiled.close()
+        raise ValueError(f"Compiled wordlist for {handle.wordlist_path} changed after sharing.")
+    store = compiled.to_word_store()
+    _cache_word_store(handle.wordlist_path, handle.signature, store)
+    return store
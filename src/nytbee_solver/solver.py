@@ -1,12 +1,21 @@
 from __future__ import annotations
 
+import sys
 from collections import defaultdict
 from datetime import date
 from pathlib import Path
-from typing import Iterable
-from urllib.request import urlopen
+from typing import TYPE_CHECKING, Iterable, Optional
 
-from nytbee_scrapper.scraper import BASE_URL, extract_answer_list, fetch_html, normalize_answer
+from .compiled import load_compiled_wordlist
+from .hints import HintSummary, _format_grid
+from .wordstore import WordStore
+
+if TYPE_CHECKING:
+    from nytbee_scrapper.client import HttpClient
+    from nytbee_scrapper.scraper import RateLimiter
+
+# The scraper and HTTP client are only imported when something is fetched, so
+# solving from a local wordlist does not pay for html.parser or http.client.
 
 WORDLIST_URL = (
     "https://raw.githubusercontent.com/fptprdqs66-dot/nytbee_scrapper/refs/heads/main/nytbee_dict.txt"
@@ -17,14 +26,17 @@ def get_default_wordlist_path() -> Path:
     return Path.home() / ".cache" / "nytbee_solver" / "nytbee_dict.txt"
 
 
-def ensure_wordlist(path: Path) -> None:
+def ensure_wordlist(path: Path, client: Optional[HttpClient] = None) -> None:
     if path.exists():
         return
     print(f"Wordlist not found at {path}. Downloading from {WORDLIST_URL}...")
     path.parent.mkdir(parents=True, exist_ok=True)
     try:
-        with urlopen(WORDLIST_URL) as response:
-            content = response.read().decode("utf-8")
+        if client is None:
+            from nytbee_scrapper.client import get_default_client
+
+            client = get_default_client()
+        content = client.get(WORDLIST_URL).body.decode("utf-8")
     except Exception as exc:
         raise FileNotFoundError(
             f"Unable to download wordlist from {WORDLIST_URL}"
@@ -33,6 +45,7 @@ def ensure_wordlist(path: Path) -> None:
 
 
 def load_words(path: Path) -> list[str]:
+    """Parse a plain-text or dict-literal wordlist into lowercase words."""
     ensure_wordlist(path)
     contents = path.read_text().strip()
     if not contents:
@@ -52,6 +65,39 @@ def load_words(path: Path) -> list[str]:
     return [word for word in words if word.isalpha()]
 
 
+_WORD_STORES: dict[Path, tuple[tuple[int, int], WordStore]] = {}
+
+
+def _cache_word_store(path: Path, signature: tuple[int, int], store: WordStore) -> None:
+    previous = _WORD_STORES.get(path)
+    _WORD_STORES[path] = (signature, store)
+    if previous is not None and previous[1] is not store:
+        # Unmap the replaced compiled wordlist instead of leaking it until exit.
+        previous[1].close()
+
+
+def get_word_store(path: Path) -> WordStore:
+    """Return a mask-indexed store for the wordlist, reusing it while the file is unchanged.
+
+    When the file changes, the store returned for its previous contents is closed.
+    """
+    ensure_wordlist(path)
+    resolved = path.resolve()
+    stat = resolved.stat()
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cached = _WORD_STORES.get(resolved)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    compiled = load_compiled_wordlist(resolved)
+    try:
+        store = compiled.to_word_store()
+    except BaseException:
+        compiled.close()
+        raise
+    _cache_word_store(resolved, signature, store)
+    return store
+
+
 def normalize_letters(raw_letters: str) -> tuple[str, str]:
     cleaned = [char for char in raw_letters.lower() if char.isalpha()]
     if not cleaned:
@@ -84,68 +130,58 @@ def _flatten_letters(words: Iterable[str]) -> list[str]:
 
 def _format_spelling_bee_grid(words: list[str]) -> str:
     """Return a summary table grouped by starting letter and word length."""
-    counts: dict[str, dict[int, int]] = defaultdict(lambda: defaultdict(int))
+    counts: dict[str, dict[int, int]] = defaultdict(dict)
     for word in words:
-        if not word:
-            continue
-        counts[word[0]][len(word)] += 1
-
-    row_letters = sorted(counts)
-    col_lengths = sorted({length for letter_counts in counts.values() for length in letter_counts})
-
-    headers: list[str | int] = [""] + [str(length) for length in col_lengths] + ["Total"]
-    rows: list[list[str | int]] = []
-    for letter in row_letters:
-        row_counts = [counts[letter].get(length, 0) for length in col_lengths]
-        row_total = sum(row_counts)
-        rows.append([letter.upper(), *row_counts, row_total])
-
-    col_totals = [sum(counts[letter].get(length, 0) for letter in row_letters) for length in col_lengths]
-    grand_total = sum(col_totals)
-    rows.append(["Total", *col_totals, grand_total])
-
-    columns = list(zip(headers, *rows))
-    col_widths = [max(len(str(cell)) for cell in column) for column in columns]
-
-    def format_row(row: list[str | int]) -> str:
-        formatted_cells = []
-        for index, (cell, width) in enumerate(zip(row, col_widths)):
-            cell_text = str(cell)
-            formatted_cells.append(cell_text.ljust(width) if index == 0 else cell_text.rjust(width))
-        return " | ".join(formatted_cells)
-
-    separator = "-+-".join("-" * width for width in col_widths)
-    lines = [format_row(headers), separator]
-    lines.extend(format_row(row) for row in rows)
-    return "\n".join(lines)
-
-
-def _has_bingo(words: list[str], letters: str) -> bool:
-    first_letters = {word[0] for word in words if word}
-    return set(letters) <= first_letters
-
-
-def _count_perfect_pangrams(pangrams: list[str], letters: str) -> int:
-    unique_letters = set(letters)
-    return sum(
-        1 for word in pangrams if set(word) == unique_letters and len(word) == len(unique_letters)
+        if word:
+            counts[word[0]][len(word)] = counts[word[0]].get(len(word), 0) + 1
+    return _format_grid(counts)
+
+
+def fetch_html(url: str, *args: object, **kwargs: object) -> str:
+    """Fetch a page through ``nytbee_scrapper.scraper.fetch_html``."""
+    from nytbee_scrapper.scraper import fetch_html as fetch_page
+
+    return fetch_page(url, *args, **kwargs)  # type: ignore[arg-type]
+
+
+def get_puzzle_letters(
+    puzzle_date: date,
+    base_url: Optional[str] = None,
+    client: Optional[HttpClient] = None,
+    rate_limiter: Optional[RateLimiter] = None,
+) -> str:
+    """Infer a day's puzzle letters (required letter first) from its NYTBee answer list.
+
+    With a ``client``, final pages are served from its response cache like the
+    scraper's; ``rate_limiter`` throttles the requests that do reach the network.
+    """
+    from nytbee_scrapper.metrics import get_metrics
+    from nytbee_scrapper.scraper import (
+        BASE_URL,
+        extract_answer_list,
+        fetch_day_page,
+        normalize_answer,
     )
 
-
-def _format_bold_word(word: str) -> str:
-    return f"**{word}**"
-
-
-def get_todays_puzzle_letters(base_url: str = BASE_URL) -> str:
-    today = date.today().strftime("%Y%m%d")
-    url = base_url.format(date=today)
+    url = (base_url or BASE_URL).format(date=puzzle_date.strftime("%Y%m%d"))
     try:
-        html = fetch_html(url)
+        if client is None:
+            if rate_limiter is not None:
+                with get_metrics().timer("rate_limit_wait_seconds"):
+                    rate_limiter.wait()
+            html = fetch_html(url)
+        else:
+            html = fetch_day_page(url, puzzle_date, rate_limiter=rate_limiter, client=client)
     except Exception as exc:
-        raise RuntimeError(f"Unable to fetch today's NYTBee puzzle from {url}.") from exc
+        raise RuntimeError(
+            f"Unable to fetch the NYTBee puzzle for {puzzle_date.isoformat()} from {url}."
+        ) from exc
 
-    answers = [normalize_answer(item) for item in extract_answer_list(html)]
-    answers = [answer for answer in answers if answer]
+    metrics = get_metrics()
+    with metrics.timer("parse_seconds"):
+        items = extract_answer_list(html)
+    with metrics.timer("normalize_seconds"):
+        answers = [answer for answer in (normalize_answer(item) for item in items) if answer]
     if not answers:
         raise ValueError(f"No answers extracted for {url}.")
 
@@ -154,102 +190,62 @@ def get_todays_puzzle_letters(base_url: str = BASE_URL) -> str:
         required_letters &= set(answer)
 
     if not required_letters:
-        raise ValueError("Unable to determine the required letter from today's answers.")
+        raise ValueError(f"Unable to determine the required letter from the answers at {url}.")
 
     required_letter = sorted(required_letters)[0]
     unique_letters = _flatten_letters(answers)
 
     if required_letter not in unique_letters:
-        raise ValueError("Required letter not found in today's answer list.")
+        raise ValueError(f"Required letter not found in the answer list at {url}.")
 
     remaining_letters = [letter for letter in unique_letters if letter != required_letter]
     if len(remaining_letters) != 6:
         raise ValueError(
-            "Expected seven unique letters in today's answers; found "
+            f"Expected seven unique letters in the answers at {url}; found "
             f"{len(remaining_letters) + 1}."
         )
 
     return required_letter + "".join(remaining_letters)
 
 
+def get_todays_puzzle_letters(
+    base_url: Optional[str] = None, client: Optional[HttpClient] = None
+) -> str:
+    return get_puzzle_letters(date.today(), base_url=base_url, client=client)
+
+
 def solve_spelling_bee(
     letters: str, wordlist_path: Path | None = None
 ) -> tuple[list[str], list[str], str, str]:
     required, cleaned_letters = normalize_letters(letters)
-    allowed = set(cleaned_letters)
 
     if wordlist_path is None:
         wordlist_path = get_default_wordlist_path()
 
-    words = [
-        word
-        for word in load_words(wordlist_path)
-        if len(word) >= 4 and required in word and set(word) <= allowed
-    ]
-    pangrams = [word for word in words if set(cleaned_letters) <= set(word)]
-    return sorted(words), sorted(pangrams), cleaned_letters, required
+    words, pangrams = get_word_store(wordlist_path).matching(cleaned_letters, required)
+    return words, pangrams, cleaned_letters, required
 
 
-def print_hint_page(words: list[str], pangrams: list[str], letters: str, required: str) -> None:
-    """Print a hint page summary for the provided Spelling Bee solution list."""
-    print("NYT Spelling Bee Hint Page")
-    print("-" * 30)
-    print(f"Letters: {', '.join(letters)} (required: {required})")
-
-    total_words = len(words)
-    perfect_pangrams = _count_perfect_pangrams(pangrams, letters)
-    print(f"Total words: {total_words}")
-    if pangrams:
-        pangram_summary = f"Pangrams: {len(pangrams)}"
-        if perfect_pangrams:
-            pangram_summary += f" (perfect: {perfect_pangrams})"
-        print(pangram_summary)
-        print("\nPangrams (bolded):")
-        pangram_list = ", ".join(_format_bold_word(word) for word in sorted(pangrams))
-        print(pangram_list)
-    else:
-        print("Pangrams: 0")
-    if _has_bingo(words, letters):
-        print("BINGO")
-
-    print("\nSpelling Bee Grid:")
-    print(_format_spelling_bee_grid(words))
-
-    grouped: dict[int, list[str]] = defaultdict(list)
-    for word in words:
-        grouped[len(word)].append(word)
-
-    print("\nBy length:")
-    for length in sorted(grouped):
-        word_list = ", ".join(sorted(grouped[length]))
-        print(f"{length} letters ({len(grouped[length])}): {word_list}")
+def solve_many(
+    letter_sets: Iterable[str], wordlist_path: Path | None = None
+) -> list[tuple[list[str], list[str], str, str]]:
+    """Solve many puzzles against one loaded wordlist, in the order given."""
+    normalized = [normalize_letters(letters) for letters in letter_sets]
 
-    print("\nAlphabetical:")
-    sorted_words = sorted(words)
-    if not sorted_words:
-        return
+    if wordlist_path is None:
+        wordlist_path = get_default_wordlist_path()
 
-    columns = 3
-    rows = (len(sorted_words) + columns - 1) // columns
-    column_words = [
-        sorted_words[start : start + rows]
-        for start in range(0, len(sorted_words), rows)
+    store = get_word_store(wordlist_path)
+    matches = store.matching_many([(cleaned, required) for required, cleaned in normalized])
+    return [
+        (words, pangrams, cleaned, required)
+        for (words, pangrams), (required, cleaned) in zip(matches, normalized)
     ]
-    while len(column_words) < columns:
-        column_words.append([])
 
-    column_widths = [
-        max((len(word) for word in column), default=0) for column in column_words
-    ]
 
-    for row_index in range(rows):
-        row_entries = []
-        for col_index in range(columns):
-            column = column_words[col_index]
-            word = column[row_index] if row_index < len(column) else ""
-            padding = column_widths[col_index]
-            row_entries.append(word.ljust(padding))
-        print("  ".join(entry for entry in row_entries).rstrip())
+def print_hint_page(words: list[str], pangrams: list[str], letters: str, required: str) -> None:
+    """Print a hint page summary for the provided Spelling Bee solution list."""
+    HintSummary.from_solution(words, pangrams, letters, required).write_text(sys.stdout)
 
 
 def run_today_hint_page() -> str:
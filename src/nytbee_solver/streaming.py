@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import re
+import time
+from pathlib import Path
+from typing import BinaryIO, Iterator, Optional
+
+from .solver import ensure_wordlist, get_default_wordlist_path, normalize_letters
+
+DEFAULT_CHUNK_SIZE = 1 << 20
+_PADDING_RE = re.compile(rb"[ \t\x0b\x0c]")
+
+
+class StreamStats:
+    """Bytes scanned, lines matched and elapsed time of one streaming solve."""
+
+    def __init__(self) -> None:
+        self.bytes_read = 0
+        self.chunks = 0
+        self.matches = 0
+        self.seconds = 0.0
+
+    @property
+    def megabytes_per_second(self) -> float:
+        return self.bytes_read / 1e6 / self.seconds if self.seconds else 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"StreamStats({self.bytes_read} bytes in {self.chunks} chunks, "
+            f"{self.matches} matches, {self.megabytes_per_second:.1f} MB/s)"
+        )
+
+
+def iter_chunks(handle: BinaryIO, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+    """Yield ``chunk_size`` reads of ``handle`` cut back to whole lines.
+
+    Raises ``ValueError`` on a line longer than ``chunk_size`` bytes, so at most
+    two chunks are ever buffered.
+    """
+    remainder = b""
+    while True:
+        chunk = handle.read(chunk_size)
+        if not chunk:
+            break
+        chunk = remainder + chunk
+        cut = chunk.rfind(b"\n") + 1
+        remainder = chunk[cut:]
+        if len(remainder) > chunk_size:
+            raise ValueError(f"Wordlist has a line longer than {chunk_size} bytes.")
+        if cut:
+            yield chunk[:cut]
+    if remainder:
+        yield remainder
+
+
+def _line_patterns(
+    letters: str, required: str, min_length: int
+) -> tuple[re.Pattern, re.Pattern]:
+    allowed = re.escape(letters + letters.upper())
+    needed = re.escape(required + required.upper())
+    word = rf"(?=[{allowed}]*[{needed}])[{allowed}]{{{min_length},}}"
+    # Most wordlists have no padding around words, and the bare pattern is
+    # about twice as fast; chunks containing blanks use the padded one.
+    return (
+        re.compile(rf"^({word})\r?$", re.MULTILINE),
+        re.compile(rf"^[ \t\r\f\v]*({word})[ \t\r\f\v]*$", re.MULTILINE),
+    )
+
+
+def iter_matching_words(
+    path: Path,
+    letters: str,
+    required: str,
+    *,
+    min_length: int = 4,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    stats: Optional[StreamStats] = None,
+) -> Iterator[str]:
+    """Yield the lowercase words of a plain-text wordlist spelled from ``letters``.
+
+    The file is read ``chunk_size`` bytes at a time and each chunk is scanned with
+    one regular expression, so memory use depends on the chunk size and the number
+    of matches, not on the size of the wordlist. Words are yielded in file order.
+    Dict-literal wordlists, which ``load_words`` also reads, are rejected with a
+    ``ValueError`` since they have no line structure to stream.
+    """
+    bare, padded = _line_patterns(letters, required, min_length)
+    stats = stats if stats is not None else StreamStats()
+    start = time.perf_counter()
+    try:
+        with path.open("rb") as handle:
+            if handle.read(chunk_size).lstrip().startswith(b"{"):
+                raise ValueError(
+                    f"{path} is a dict-literal wordlist; streaming needs one word per line."
+                )
+            handle.seek(0)
+            for chunk in iter_chunks(handle, chunk_size):
+                stats.bytes_read += len(chunk)
+                stats.chunks += 1
+                pattern = padded if _PADDING_RE.search(chunk) else bare
+                for word in pattern.findall(chunk.decode("utf-8")):
+                    stats.matches += 1
+                    yield word.lower()
+    finally:
+        stats.seconds += time.perf_counter() - start
+
+
+def solve_streaming(
+    letters: str,
+    wordlist_path: Optional[Path] = None,
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    stats: Optional[StreamStats] = None,
+) -> tuple[list[str], list[str], str, str]:
+    """Solve like ``solve_spelling_bee`` without loading the wordlist into memory.
+
+    Only plain one-word-per-line wordlists can be streamed.
+    """
+    required, cleaned_letters = normalize_letters(letters)
+    if wordlist_path is None:
+        wordlist_path = get_default_wordlist_path()
+    ensure_wordlist(wordlist_path)
+
+    allowed = set(cleaned_letters)
+    words: list[str] = []
+    pangrams: list[str] = []
+    for word in iter_matching_words(
+        wordlist_path, cleaned_letters, required, chunk_size=chunk_size, stats=stats
+    ):
+        words.append(word)
+        if allowed <= set(word):
+            pangrams.append(word)
+    return sorted(words), sorted(pangrams), cleaned_letters, required
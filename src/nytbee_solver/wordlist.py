@@ -0,0 +1,269 @@
+from __future__ import annotations
+
+import argparse
+import hashlib
+import heapq
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Iterable, Iterator, NamedTuple, Optional, Sequence
+
+VERSION_SUFFIX = ".version"
+
+
+class WordlistUpdate(NamedTuple):
+    version: str
+    word_count: int
+    added: list[str]
+    written: list[Path]
+
+
+class _UnsortedWordlist(Exception):
+    pass
+
+
+def get_version_path(path: Path) -> Path:
+    """Return the sidecar file recording a wordlist's version hash."""
+    return path.with_name(f"{path.name}{VERSION_SUFFIX}")
+
+
+def read_wordlist_version(path: Path) -> Optional[dict[str, object]]:
+    """Return the recorded version of ``path``, or ``None`` if there is none."""
+    try:
+        return json.loads(get_version_path(path).read_text(encoding="utf-8"))
+    except (FileNotFoundError, ValueError):
+        return None
+
+
+def _normalize_words(words: Iterable[str]) -> list[str]:
+    normalized = {word.strip().lower() for word in words}
+    return sorted(word for word in normalized if word.isalpha())
+
+
+def _read_words(path: Path, digest: "hashlib._Hash") -> Iterator[str]:
+    if not path.exists():
+        return
+    with path.open("rb") as handle:
+        for line in handle:
+            digest.update(line)
+            word = line.decode("utf-8").strip()
+            if word:
+                yield word
+
+
+def _find_new_words(existing: Iterable[str], candidates: list[str]) -> tuple[list[str], int]:
+    added = []
+    count = 0
+    index = 0
+    previous = ""
+    for word in existing:
+        if word < previous:
+            raise _UnsortedWordlist
+        previous = word
+        count += 1
+        while index < len(candidates) and candidates[index] < word:
+            added.append(candidates[index])
+            index += 1
+        if index < len(candidates) and candidates[index] == word:
+            index += 1
+    added.extend(candidates[index:])
+    return added, count
+
+
+def merge_sorted_words(existing: Iterable[str], new: Iterable[str]) -> Iterator[str]:
+    """Merge two sorted word streams, dropping duplicates."""
+    previous = None
+    for word in heapq.merge(existing, new):
+        if word != previous:
+            yield word
+            previous = word
+
+
+def _make_temp(path: Path) -> Path:
+    # A unique name, so concurrent runs never write into each other's temp file.
+    handle, temp_name = tempfile.mkstemp(prefix=f".{path.name}.", dir=path.parent)
+    os.close(handle)
+    os.chmod(temp_name, 0o644)
+    return Path(temp_name)
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    temp_path = _make_temp(path)
+    try:
+        temp_path.write_bytes(data)
+        os.replace(temp_path, path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+
+def _write_version(path: Path, version: str, word_count: int, state: dict[str, object]) -> None:
+    record = {"sha256": version, "words": word_count, **state}
+    if read_wordlist_version(path) != record:
+        _write_atomic(get_version_path(path), (json.dumps(record, indent=2) + "\n").encode())
+
+
+def update_wordlist(
+    path: Path,
+    new_words: Iterable[str],
+    copies: Sequence[Path] = (),
+    *,
+    state: Optional[dict[str, object]] = None,
+) -> WordlistUpdate:
+    """Merge ``new_words`` into the sorted wordlist at ``path`` and its ``copies``.
+
+    The existing list is streamed once to find words it lacks; only when there
+    are some is the merged list written, to temporary files that then replace
+    ``path`` and every copy. The version is the SHA-256 of the wordlist bytes,
+    the same digest the compiled wordlist and puzzle index are keyed on, and is
+    recorded with ``state`` in a ``.version`` sidecar next to each file.
+    """
+    candidates = _normalize_words(new_words)
+    digest = hashlib.sha256()
+    try:
+        added, word_count = _find_new_words(_read_words(path, digest), candidates)
+        merged: Optional[list[str]] = None
+    except _UnsortedWordlist:
+        digest = hashlib.sha256()
+        existing = set(_read_words(path, digest))
+        added = [word for word in candidates if word not in existing]
+        merged = sorted(existing | set(added))
+        word_count = len(existing)
+
+    written: list[Path] = []
+    if added:
+        words = merged or merge_sorted_words(_read_words(path, hashlib.sha256()), added)
+        digest = hashlib.sha256()
+        word_count = 0
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = _make_temp(path)
+        temps = [temp_path]
+        try:
+            with temp_path.open("wb") as handle:
+                for word in words:
+                    line = f"{word}\n".encode("utf-8")
+                    handle.write(line)
+                    digest.update(line)
+                    word_count += 1
+            copy_temps = []
+            for copy in copies:
+                copy.parent.mkdir(parents=True, exist_ok=True)
+                copy_temp = _make_temp(copy)
+                temps.append(copy_temp)
+                shutil.copyfile(temp_path, copy_temp)
+                copy_temps.append((copy_temp, copy))
+            # Every file is fully written before any of them is replaced.
+            os.replace(temp_path, path)
+            written.append(path)
+            for copy_temp, copy in copy_temps:
+                os.replace(copy_temp, copy)
+                written.append(copy)
+        except BaseException:
+            for temp in temps:
+                temp.unlink(missing_ok=True)
+            raise
+
+    version = digest.hexdigest()
+    for copy in copies:
+        if copy in written:
+            continue
+        recorded = read_wordlist_version(copy)
+        if recorded is not None and recorded.get("sha256") == version:
+            continue
+        if copy.exists() and hashlib.sha256(copy.read_bytes()).hexdigest() == version:
+            continue
+        copy.parent.mkdir(parents=True, exist_ok=True)
+        _write_atomic(copy, path.read_bytes())
+        written.append(copy)
+
+    for target in (path, *copies):
+        _write_version(target, version, word_count, state or {})
+    return WordlistUpdate(version, word_count, added, written)
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    """Merge newly scraped answers into the wordlist and its extension copy."""
+    parser = argparse.ArgumentParser(
+        prog="python -m nytbee_solver.wordlist",
+        description="Merge new answers into the sorted NYT Spelling Bee wordlist.",
+    )
+    parser.add_argument("--wordlist", type=Path, default=Path("nytbee_dict.txt"))
+    parser.add_argument(
+        "--copy",
+        type=Path,
+        action="append",
+        default=None,
+        help=(
+            "Additional copy kept identical to the wordlist; repeatable "
+            "(default: safari-extension/wordlist/nytbee_dict.txt)."
+        ),
+    )
+    parser.add_argument(
+        "--store",
+        type=Path,
+        default=None,
+        help="ScrapeStore file; only days scraped since the last build are read.",
+    )
+    parser.add_argument(
+        "--words",
+        type=Path,
+        action="append",
+        default=[],
+        help="File of newline-separated answers to merge; repeatable.",
+    )
+    parser.add_argument(
+        "--extension-index",
+        type=Path,
+        default=None,
+        help=(
+            "Extension index directory rebuilt when it no longer matches the wordlist "
+            "(default: safari-extension/wordlist/index unless --copy is given)."
+        ),
+    )
+    args = parser.parse_args(argv)
+
+    copies = args.copy
+    index_dir = args.extension_index
+    if copies is None:
+        copies = [Path("safari-extension") / "wordlist" / args.wordlist.name]
+        if index_dir is None:
+            index_dir = copies[0].parent / "index"
+    new_words: list[str] = []
+    for words_path in args.words:
+        new_words.extend(words_path.read_text(encoding="utf-8").splitlines())
+
+    state: dict[str, object] = {}
+    recorded = read_wordlist_version(args.wordlist) or {}
+    if "store_scraped_through" in recorded:
+        state["store_scraped_through"] = recorded["store_scraped_through"]
+    if args.store is not None:
+        from nytbee_scrapper.store import ScrapeStore
+
+        scraped_through = float(recorded.get("store_scraped_through") or 0.0)
+        with ScrapeStore(args.store) as store:
+            for _, scraped_at, answers in store.days_scraped_after(scraped_through):
+                new_words.extend(answers)
+                scraped_through = max(scraped_through, scraped_at)
+        state["store_scraped_through"] = scraped_through
+
+    update = update_wordlist(args.wordlist, new_words, copies, state=state)
+    if update.added:
+        print(f"Added {len(update.added)} words: {', '.join(update.added[:20])}")
+    else:
+        print("No new words.")
+    for path in update.written:
+        print(f"Wrote {path}")
+    print(f"{update.word_count} words, version {update.version}")
+
+    if index_dir is not None:
+        from .extension_index import build_extension_index, extension_index_is_current
+
+        if not extension_index_is_current(args.wordlist, index_dir):
+            build_extension_index(args.wordlist, index_dir)
+            print(f"Rebuilt extension index {index_dir}")
+
+
+if __name__ == "__main__":
+    main()
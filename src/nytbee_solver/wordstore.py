@@ -0,0 +1,326 @@
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left
+from functools import lru_cache
+from typing import Iterable, Iterator, Optional, Sequence
+
+ALPHABET = "abcdefghijklmnopqrstuvwxyz"
+LETTER_BITS = {letter: 1 << index for index, letter in enumerate(ALPHABET)}
+
+# Set on words containing letters outside a-z so they never pass a mask check.
+IRREGULAR_BIT = 1 << len(ALPHABET)
+
+
+@lru_cache(maxsize=None)
+def _numpy():
+    # NumPy takes longer to import than the whole CLI, so only the batch
+    # matching path loads it.
+    try:
+        import numpy
+    except ImportError:  # pragma: no cover - exercised when the "fast" extra is absent
+        return None
+    return numpy
+
+
+def letter_mask(word: str) -> int:
+    """Return the 26-bit letter mask for a word, flagging non a-z letters."""
+    mask = 0
+    for char in set(word):
+        mask |= LETTER_BITS.get(char, IRREGULAR_BIT)
+    return mask
+
+
+MAX_WORD_LENGTH = 255
+
+
+class WordArray(Sequence[str]):
+    """Words packed into one buffer with parallel offset, mask and length arrays.
+
+    Word ``i`` is ``blob[offsets[i]:offsets[i + 1] - 1]``; words are newline
+    separated, which is also the layout of a compiled wordlist, so one can be
+    viewed in place. Strings are only created for the words that are read.
+    """
+
+    def __init__(
+        self,
+        blob: bytes | memoryview,
+        offsets: Sequence[int],
+        masks: Sequence[int],
+        lengths: Sequence[int],
+        owner: Optional[object] = None,
+    ) -> None:
+        if not len(offsets) == len(masks) + 1 == len(lengths) + 1:
+            raise ValueError("Word offsets, masks and lengths do not line up.")
+        self._blob = blob
+        self._offsets = offsets
+        self.masks = masks
+        self.lengths = lengths
+        # Keeps the buffer provider (e.g. a memory-mapped compiled wordlist) alive.
+        self._owner = owner
+
+    def close(self) -> None:
+        """Release the buffer provider, e.g. the memory map of a compiled wordlist."""
+        close = getattr(self._owner, "close", None)
+        if close is not None:
+            close()
+
+    @classmethod
+    def from_words(
+        cls, words: Iterable[str], masks: Optional[Iterable[int]] = None
+    ) -> "WordArray":
+        """Pack ``words`` in the order given, computing letter masks unless supplied."""
+        blob = bytearray()
+        offsets = array("I", [0])
+        word_masks = array("I")
+        lengths = array("B")
+        mask_values = iter(masks) if masks is not None else None
+        for word in words:
+            if len(word) > MAX_WORD_LENGTH:
+                raise ValueError(f"Words longer than {MAX_WORD_LENGTH} letters are not supported.")
+            blob += word.encode("utf-8")
+            blob += b"\n"
+            offsets.append(len(blob))
+            lengths.append(len(word))
+            word_masks.append(letter_mask(word) if mask_values is None else next(mask_values))
+        return cls(bytes(blob), offsets, word_masks, lengths)
+
+    def __len__(self) -> int:
+        return len(self.lengths)
+
+    def _word(self, index: int) -> str:
+        return str(self._blob[self._offsets[index] : self._offsets[index + 1] - 1], "utf-8")
+
+    def __getitem__(self, index):  # type: ignore[override]
+        if isinstance(index, slice):
+            return self.select(range(*index.indices(len(self))))
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("word index out of range")
+        return self._word(index)
+
+    def __iter__(self) -> Iterator[str]:
+        return map(self._word, range(len(self)))
+
+    def select(self, indices: Iterable[int]) -> list[str]:
+        """Return the words at ``indices``."""
+        return [self._word(index) for index in indices]
+
+    def indices_of_length(self, minimum: int, maximum: int = MAX_WORD_LENGTH) -> array:
+        """Return the indices of words with ``minimum`` to ``maximum`` letters."""
+        return array(
+            "I",
+            (index for index, length in enumerate(self.lengths) if minimum <= length <= maximum),
+        )
+
+    def indices_within(self, allowed: int, required: int = 0, min_length: int = 0) -> array:
+        """Return indices of words whose mask is within ``allowed`` and meets ``required``."""
+        blocked = ~allowed
+        lengths = self.lengths
+        return array(
+            "I",
+            (
+                index
+                for index, mask in enumerate(self.masks)
+                if not mask & blocked
+                and (not required or mask & required)
+                and lengths[index] >= min_length
+            ),
+        )
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the word buffer and the parallel arrays."""
+        return len(self._blob) + 9 * len(self.lengths) + 4
+
+
+def group_by_mask(masks: Sequence[int]) -> tuple[array, array, array]:
+    """Return word indices sorted by mask, each distinct mask and the start of its run."""
+    order = array("I", sorted(range(len(masks)), key=masks.__getitem__))
+    group_masks = array("I")
+    group_starts = array("I")
+    previous = None
+    for position, index in enumerate(order):
+        mask = masks[index]
+        if mask != previous:
+            group_masks.append(mask)
+            group_starts.append(position)
+            previous = mask
+    group_starts.append(len(order))
+    return order, group_masks, group_starts
+
+
+class WordStore:
+    """Wordlist grouped by letter mask for repeated Spelling Bee solving.
+
+    Words live in a ``WordArray``; the store adds a permutation ordering them by
+    mask and the start of each distinct mask's run, all as flat integer arrays.
+    """
+
+    def __init__(
+        self,
+        words: Iterable[str] | WordArray,
+        masks: Optional[Iterable[int]] = None,
+        *,
+        groups: Optional[tuple[Sequence[int], Sequence[int], Sequence[int]]] = None,
+    ) -> None:
+        """Group ``words`` by letter mask, reusing precomputed ``masks`` or ``groups``.
+
+        ``groups`` is the ``(order, group_masks, group_starts)`` triple returned by
+        ``group_by_mask``, e.g. as stored in a compiled wordlist.
+        """
+        self.words = words if isinstance(words, WordArray) else WordArray.from_words(words, masks)
+        if groups is None:
+            groups = group_by_mask(self.words.masks)
+        self._order, self._group_masks, self._group_starts = groups
+        # Masks sort ascending, so the groups with IRREGULAR_BIT set come last.
+        self._irregular = [
+            word
+            for position in range(
+                bisect_left(self._group_masks, IRREGULAR_BIT), len(self._group_masks)
+            )
+            for word in self._group_words(position)
+        ]
+        self._letter_groups: dict[int, array] = {}
+        self._mask_array = None
+        self._mask_positions: list[int] = []
+
+    def _groups_with(self, letter_bit: int) -> array:
+        # Positions of the masks containing one letter, built on first use; a
+        # puzzle only scans the groups that contain its required letter.
+        positions = self._letter_groups.get(letter_bit)
+        if positions is None:
+            positions = self._letter_groups[letter_bit] = array(
+                "I",
+                (
+                    position
+                    for position, mask in enumerate(self._group_masks)
+                    if mask & letter_bit
+                ),
+            )
+        return positions
+
+    def _group_words(self, position: int, min_length: int = 0) -> list[str]:
+        words = self.words
+        lengths = words.lengths
+        indices = self._order[self._group_starts[position] : self._group_starts[position + 1]]
+        return [words._word(index) for index in indices if lengths[index] >= min_length]
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def close(self) -> None:
+        """Release the buffers backing the words; the store is unusable afterwards."""
+        self.words.close()
+
+    @property
+    def masks(self) -> list[int]:
+        """Distinct letter masks present in the store."""
+        return list(self._group_masks)
+
+    def words_for_mask(self, mask: int) -> list[str]:
+        """Return the words whose letter set is exactly ``mask``."""
+        position = bisect_left(self._group_masks, mask)
+        if position == len(self._group_masks) or self._group_masks[position] != mask:
+            return []
+        return self._group_words(position)
+
+    def matching(
+        self, letters: str, required: str, min_length: int = 4
+    ) -> tuple[list[str], list[str]]:
+        """Return sorted words and pangrams spelled from ``letters``."""
+        allowed = letter_mask(letters)
+        required_bit = LETTER_BITS.get(required, 0)
+        words: list[str] = []
+        pangrams: list[str] = []
+        if required_bit and not allowed & IRREGULAR_BIT:
+            blocked = ~allowed
+            group_masks = self._group_masks
+            for position in self._groups_with(required_bit):
+                mask = group_masks[position]
+                if mask & blocked:
+                    continue
+                matches = self._group_words(position, min_length)
+                words.extend(matches)
+                if mask == allowed:
+                    pangrams.extend(matches)
+        elif required_bit:
+            # Non a-z puzzle letters: plain a-z words can match but never be pangrams.
+            ascii_allowed = allowed & ~IRREGULAR_BIT
+            for position, mask in enumerate(self._group_masks):
+                if mask & ~ascii_allowed or not mask & required_bit:
+                    continue
+                words.extend(self._group_words(position, min_length))
+
+        self._add_irregular(words, pangrams, letters, required, min_length)
+        return sorted(words), sorted(pangrams)
+
+    def matching_many(
+        self, puzzles: Sequence[tuple[str, str]], min_length: int = 4, chunk_size: int = 512
+    ) -> list[tuple[list[str], list[str]]]:
+        """Return ``matching`` results for many ``(letters, required)`` puzzles at once.
+
+        With NumPy installed, the allowed and required masks of ``chunk_size`` puzzles
+        are tested against every word mask in one vectorized comparison; otherwise
+        each puzzle is matched in turn.
+        """
+        np = _numpy()
+        if np is None:
+            return [self.matching(letters, required, min_length) for letters, required in puzzles]
+
+        results: list[Optional[tuple[list[str], list[str]]]] = [None] * len(puzzles)
+        vectorized = []
+        for index, (letters, required) in enumerate(puzzles):
+            allowed = letter_mask(letters)
+            required_bit = LETTER_BITS.get(required, 0)
+            if required_bit and not allowed & IRREGULAR_BIT:
+                vectorized.append((index, allowed, required_bit))
+            else:
+                results[index] = self.matching(letters, required, min_length)
+
+        masks = self._get_mask_array(np)
+        for start in range(0, len(vectorized), chunk_size):
+            chunk = vectorized[start : start + chunk_size]
+            allowed = np.array([entry[1] for entry in chunk], dtype=np.uint32)
+            required_bits = np.array([entry[2] for entry in chunk], dtype=np.uint32)
+            hits = ((masks[None, :] & ~allowed[:, None]) == 0) & (
+                (masks[None, :] & required_bits[:, None]) != 0
+            )
+            for row, (index, puzzle_allowed, _) in enumerate(chunk):
+                letters, required = puzzles[index]
+                words: list[str] = []
+                pangrams: list[str] = []
+                for column in np.flatnonzero(hits[row]).tolist():
+                    matches = self._group_words(self._mask_positions[column], min_length)
+                    words.extend(matches)
+                    if int(masks[column]) == puzzle_allowed:
+                        pangrams.extend(matches)
+                self._add_irregular(words, pangrams, letters, required, min_length)
+                results[index] = (sorted(words), sorted(pangrams))
+        return results  # type: ignore[return-value]
+
+    def _get_mask_array(self, np):
+        if self._mask_array is None:
+            self._mask_positions = [
+                position
+                for position, mask in enumerate(self._group_masks)
+                if not mask & IRREGULAR_BIT
+            ]
+            self._mask_array = np.array(
+                [self._group_masks[position] for position in self._mask_positions],
+                dtype=np.uint32,
+            )
+        return self._mask_array
+
+    def _add_irregular(
+        self, words: list[str], pangrams: list[str], letters: str, required: str, min_length: int
+    ) -> None:
+        if not self._irregular:
+            return
+        allowed_set = set(letters)
+        for word in self._irregular:
+            if len(word) >= min_length and required in word and set(word) <= allowed_set:
+                words.append(word)
+                if allowed_set <= set(word):
+                    pangrams.append(word)
@@ -0,0 +1,63 @@
+import shutil
+import sys
+import tempfile
+import unittest
+from datetime import date
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from nytbee_solver import archive
+
+
+class TestResultsIndex(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.results_dir = Path(self._tmpdir.name) / "results"
+        self.results_dir.mkdir()
+        for name in ("2026-03-01.txt", "2026-03-02.txt", "latest.txt", "2026-03-01.encoded.txt"):
+            shutil.copy(ROOT / "results" / name, self.results_dir / name)
+        self.index = archive.ResultsIndex(Path(self._tmpdir.name) / "index.sqlite3")
+
+    def tearDown(self) -> None:
+        self.index.close()
+        self._tmpdir.cleanup()
+
+    def test_parse_results_file(self) -> None:
+        puzzle = archive.parse_results_file(
+            (ROOT / "results" / "2026-03-01.txt").read_text(encoding="utf-8"), date(2026, 3, 1)
+        )
+        self.assertEqual(puzzle.letters, "mafirng")
+        self.assertEqual(puzzle.required, "m")
+        self.assertEqual(len(puzzle.words), 58)
+        self.assertIn("anagramming", puzzle.words)
+
+    def test_queries(self) -> None:
+        self.assertEqual(self.index.update(self.results_dir), 2)
+        self.assertEqual(len(self.index), 2)
+        self.assertEqual(self.index.dates_for_word("Farm"), [date(2026, 3, 1)])
+        self.assertEqual(
+            self.index.puzzles_with_letters("gramfin"), [(date(2026, 3, 1), "mafirng", "m")]
+        )
+        self.assertEqual(self.index.puzzles_with_letters("gramfin", required="a"), [])
+        top = self.index.most_frequent(date(2026, 3, 1), date(2026, 3, 1), limit=3)
+        self.assertEqual(len(top), 3)
+        self.assertTrue(all(count == 1 for _, count in top))
+
+    def test_update_is_incremental(self) -> None:
+        self.index.update(self.results_dir)
+        self.assertEqual(self.index.update(self.results_dir), 0)
+        (self.results_dir / "2026-03-02.txt").unlink()
+        shutil.copy(ROOT / "results" / "2026-03-03.txt", self.results_dir / "2026-03-03.txt")
+        self.assertEqual(self.index.update(self.results_dir), 2)
+        self.assertEqual(
+            [day for day, _, _ in self.index.puzzles_with_letters("mafirng")], [date(2026, 3, 1)]
+        )
+        self.assertEqual(len(self.index), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,40 @@
+import json
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SCRIPT = ROOT / "benchmarks" / "run_benchmarks.py"
+
+
+class TestBenchmarkSuite(unittest.TestCase):
+    def _run(self, *args: str) -> subprocess.CompletedProcess:
+        return subprocess.run(
+            [sys.executable, str(SCRIPT), "--repeat", "2", "--min-time", "0.01", *args],
+            capture_output=True,
+            text=True,
+        )
+
+    def test_json_output_and_baseline_comparison(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output = Path(tmpdir) / "bench.json"
+            result = self._run("--filter", "hint", "--output", str(output))
+            self.assertEqual(result.returncode, 0, result.stderr)
+            report = json.loads(output.read_text(encoding="utf-8"))
+            self.assertEqual(
+                sorted(report["benchmarks"]), ["hint_summary_json", "print_hint_page"]
+            )
+            self.assertGreater(report["benchmarks"]["print_hint_page"]["median"], 0)
+
+            for stats in report["benchmarks"].values():
+                stats["median"] /= 1000
+            output.write_text(json.dumps(report), encoding="utf-8")
+            result = self._run("--filter", "hint", "--compare", str(output))
+        self.assertEqual(result.returncode, 1)
+        self.assertIn("Regressed", result.stdout)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,155 @@
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.error import HTTPError
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from nytbee_scrapper import cache, client, scraper
+
+PAGE = b'<div id="main-answer-list"><ul><li>Alpha</li></ul></div>'
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    requests: list = []
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        type(self).requests.append((self.path, self.headers.get("If-None-Match")))
+        if "missing" in self.path:
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if self.headers.get("If-None-Match") == '"v1"':
+            self.send_response(304)
+            self.send_header("ETag", '"v1"')
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("ETag", '"v1"')
+        self.send_header("Content-Length", str(len(PAGE)))
+        self.end_headers()
+        self.wfile.write(PAGE)
+
+
+class TestResponseCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.path = Path(self._tmpdir.name) / "responses.sqlite3"
+
+    def tearDown(self) -> None:
+        self._tmpdir.cleanup()
+
+    def test_put_and_get_round_trip(self) -> None:
+        with cache.ResponseCache(self.path) as response_cache:
+            response_cache.put("https://example.com/a", 200, PAGE, etag='"v1"')
+            entry = response_cache.get("https://example.com/a")
+            self.assertIn("https://example.com/a", response_cache)
+        self.assertEqual(entry.body, PAGE)
+        self.assertEqual(entry.etag, '"v1"')
+        self.assertFalse(entry.is_negative)
+
+    def test_evicts_least_recently_used(self) -> None:
+        body = os.urandom(2000)
+        with cache.ResponseCache(self.path, max_bytes=5000) as response_cache:
+            response_cache.put("https://example.com/a", 200, body)
+            time.sleep(0.01)
+            response_cache.put("https://example.com/b", 200, body)
+            time.sleep(0.01)
+            response_cache.get("https://example.com/a")
+            time.sleep(0.01)
+            response_cache.put("https://example.com/c", 200, body)
+            self.assertIn("https://example.com/a", response_cache)
+            self.assertNotIn("https://example.com/b", response_cache)
+            self.assertIn("https://example.com/c", response_cache)
+            self.assertLessEqual(response_cache.total_bytes, 5000)
+
+
+class TestCachedClient(unittest.TestCase):
+    def setUp(self) -> None:
+        _Handler.requests = []
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self.thread = threading.Thread(
+            target=self.server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+        )
+        self.thread.start()
+        self.base = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.cache = cache.ResponseCache(Path(self._tmpdir.name) / "responses.sqlite3")
+
+    def tearDown(self) -> None:
+        self.cache.close()
+        self._tmpdir.cleanup()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_final_pages_are_served_without_requests(self) -> None:
+        with client.HttpClient(cache=self.cache) as http_client:
+            http_client.fetch_html(self.base + "/page")
+            response = http_client.get(self.base + "/page", revalidate=False)
+        self.assertTrue(response.from_cache)
+        self.assertEqual(response.body, PAGE)
+        self.assertEqual(len(_Handler.requests), 1)
+
+    def test_stale_entries_are_revalidated_conditionally(self) -> None:
+        with client.HttpClient(cache=self.cache, cache_ttl=0) as http_client:
+            http_client.fetch_html(self.base + "/page")
+            response = http_client.get(self.base + "/page")
+        self.assertTrue(response.from_cache)
+        self.assertEqual(response.text(), PAGE.decode("utf-8"))
+        self.assertEqual(_Handler.requests[-1], ("/page", '"v1"'))
+
+    def test_missing_pages_are_negatively_cached(self) -> None:
+        with client.HttpClient(cache=self.cache) as http_client:
+            for _ in range(2):
+                with self.assertRaises(HTTPError):
+                    http_client.get(self.base + "/missing", revalidate=False)
+        self.assertEqual(len(_Handler.requests), 1)
+
+    def test_rerunning_collect_word_counts_hits_cache(self) -> None:
+        base_url = self.base + "/Bee_{date}"
+        start = date.today() - timedelta(days=5)
+        with client.HttpClient(cache=self.cache) as http_client:
+            first = scraper.collect_word_counts(start, 3, base_url=base_url, client=http_client)
+            second = scraper.collect_word_counts(start, 3, base_url=base_url, client=http_client)
+        self.assertEqual(first, second)
+        self.assertEqual(first[0], {"alpha": 3})
+        self.assertEqual(len(_Handler.requests), 3)
+
+    def test_404_cached_while_current_is_refetched_once_final(self) -> None:
+        day = date.today() - timedelta(days=5)
+        base_url = self.base + "/missing_{date}"
+        url = base_url.format(date=day.strftime("%Y%m%d"))
+        self.cache.put(url, 404, b"")
+        with self.cache._connection:
+            self.cache._connection.execute(
+                "UPDATE responses SET fetched_at = ? WHERE url = ?",
+                (scraper.final_since(day) - 86400, url),
+            )
+
+        with client.HttpClient(cache=self.cache) as http_client:
+            scraper.collect_word_counts(day, 1, base_url=base_url, client=http_client)
+            scraper.collect_word_counts(day, 1, base_url=base_url, client=http_client)
+
+        # Refetched once; the fresh 404 was cached after the day became final.
+        self.assertEqual(len(_Handler.requests), 1)
+        self.assertGreaterEqual(self.cache.fetched_at(url), scraper.final_since(day))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+import gzip
+import sys
+import threading
+import unittest
+import zlib
+from datetime import date
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.error import HTTPError
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from nytbee_scrapper import client, scraper
+from nytbee_scrapper.metrics import Metrics, use_metrics
+
+PAGE = '<div id="main-answer-list"><ul><li>Alpha</li><li>Beta</li></ul></div>'
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    connections: set = set()
+    accept_encodings: list = []
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        type(self).connections.add(self.client_address)
+        type(self).accept_encodings.append(self.headers.get("Accept-Encoding"))
+        body = PAGE.encode("utf-8")
+        encoding = None
+        if self.path == "/missing":
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if self.path == "/moved":
+            self.send_response(301)
+            self.send_header("Location", "/gzip")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if self.path == "/gzip":
+            body, encoding = gzip.compress(body), "gzip"
+        elif self.path == "/deflate":
+            body, encoding = zlib.compress(body), "deflate"
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        if encoding:
+            self.send_header("Content-Encoding", encoding)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class TestHttpClient(unittest.TestCase):
+    def setUp(self) -> None:
+        _Handler.connections = set()
+        _Handler.accept_encodings = []
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self.thread = threading.Thread(
+            target=self.server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+        )
+        self.thread.start()
+        self.base = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def tearDown(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_reuses_connection_and_decodes_compression(self) -> None:
+        with client.HttpClient() as http_client:
+            for path in ("/plain", "/gzip", "/deflate"):
+                self.assertEqual(http_client.fetch_html(self.base + path), PAGE)
+        self.assertEqual(len(_Handler.connections), 1)
+        self.assertEqual(set(_Handler.accept_encodings), {"gzip, deflate"})
+
+    def test_records_compressed_transfer_size(self) -> None:
+        with use_metrics(Metrics()) as metrics, client.HttpClient() as http_client:
+            response = http_client.get(self.base + "/gzip")
+        self.assertEqual(response.transfer_size, len(gzip.compress(PAGE.encode("utf-8"))))
+        self.assertEqual(metrics.counters["fetch_bytes_total"], response.transfer_size)
+
+    def test_follows_redirects(self) -> None:
+        with client.HttpClient() as http_client:
+            response = http_client.get(self.base + "/moved")
+        self.assertEqual(response.status, 200)
+        self.assertTrue(response.url.endswith("/gzip"))
+        self.assertEqual(response.text(), PAGE)
+
+    def test_error_status_raises_http_error(self) -> None:
+        with client.HttpClient() as http_client:
+            with self.assertRaises(HTTPError) as context:
+                http_client.get(self.base + "/missing")
+        self.assertEqual(context.exception.code, 404)
+
+    def test_collect_word_counts_shares_client(self) -> None:
+        base_url = self.base + "/gzip?day={date}"
+        with client.HttpClient() as http_client:
+            counts, scraped, failures = scraper.collect_word_counts(
+                date(2024, 1, 3), 3, base_url=base_url, client=http_client, max_workers=2
+            )
+        self.assertEqual(counts, {"alpha": 3, "beta": 3})
+        self.assertEqual(failures, [])
+        self.assertLessEqual(len(_Handler.connections), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
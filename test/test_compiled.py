@@ -0,0 +1,64 @@
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from nytbee_solver import compiled, wordstore
+
+
+class TestCompiledWordlist(unittest.TestCase):
+    def test_compile_round_trips_words_masks_and_lengths(self) -> None:
+        words = ["face", "bead", "decafbag", "café", "abed"]
+        view = compiled.CompiledWordlist(compiled.compile_wordlist(words, b"\0" * 32))
+        try:
+            self.assertEqual(list(view), sorted(words))
+            self.assertEqual(view[1], "bead")
+            self.assertEqual(list(view.masks), [wordstore.letter_mask(word) for word in sorted(words)])
+            self.assertEqual(view.words_of_length(4), ["abed", "bead", "café", "face"])
+            self.assertEqual(view.words_of_length(8), ["decafbag"])
+            self.assertEqual(view.words_of_length(3), [])
+        finally:
+            view.close()
+
+    def test_stored_mask_groups_match_a_fresh_store(self) -> None:
+        words = ["face", "bead", "decafbag", "café", "abed", "cafe", "fade"]
+        view = compiled.CompiledWordlist(compiled.compile_wordlist(words, b"\0" * 32))
+        attached = view.to_word_store()
+        fresh = wordstore.WordStore(sorted(words))
+        self.assertEqual(attached.masks, fresh.masks)
+        for mask in fresh.masks:
+            self.assertEqual(attached.words_for_mask(mask), fresh.words_for_mask(mask))
+        self.assertEqual(attached.matching("facedbg", "a"), fresh.matching("facedbg", "a"))
+
+    def test_compile_empty_wordlist(self) -> None:
+        view = compiled.CompiledWordlist(compiled.compile_wordlist([], b"\0" * 32))
+        self.assertEqual(list(view), [])
+        self.assertEqual(len(view), 0)
+
+    def test_load_rebuilds_when_source_changes(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "words.txt"
+            path.write_text("{'Face': 1, 'bead': 2}")
+            first = compiled.load_compiled_wordlist(path)
+            self.assertEqual(list(first), ["bead", "face"])
+            self.assertTrue(compiled.get_compiled_wordlist_path(path).exists())
+            first.close()
+
+            path.write_text("face\nbead\nabed\n")
+            second = compiled.load_compiled_wordlist(path)
+            self.assertEqual(list(second), ["abed", "bead", "face"])
+            self.assertEqual(second.digest, compiled.wordlist_digest(path))
+            second.close()
+
+    def test_rejects_corrupt_compiled_file(self) -> None:
+        with self.assertRaises(ValueError):
+            compiled.CompiledWordlist(b"not a compiled wordlist".ljust(64, b"\0"))
+
+
+if __name__ == "__main__":
+    unittest.main()
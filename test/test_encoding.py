@@ -1,6 +1,7 @@
 import random
 import sys
 import unittest
+from datetime import date
 from pathlib import Path
 
 ROOT = Path(__file__).resolve().parents[1]
@@ -8,7 +9,7 @@ SRC = ROOT / "src"
 if str(SRC) not in sys.path:
     sys.path.insert(0, str(SRC))
 
-from nytbee_solver import encoding, solver
+from nytbee_solver import archive, encoding, solver
 
 
 class TestEncodingRoundTrips(unittest.TestCase):
@@ -38,6 +39,127 @@ class TestEncodingRoundTrips(unittest.TestCase):
             decoded = encoding.decode_terminated(encoded, letters, required)
             self.assertEqual(decoded, words)
 
+    def test_front_coded_round_trip_is_smaller(self) -> None:
+        encoded = encoding.encode_front_coded(self.words, self.letters, self.required)
+        self.assertEqual(
+            encoding.decode_front_coded(encoded, self.letters, self.required), self.words
+        )
+        self.assertLess(
+            len(encoded), len(encoding.encode_terminated(self.words, self.letters, self.required))
+        )
+
+    def test_front_coded_rejects_terminated_payloads(self) -> None:
+        encoded = encoding.encode_terminated(self.words, self.letters, self.required)
+        with self.assertRaises(ValueError):
+            encoding.decode_front_coded(encoded, self.letters, self.required)
+
+    def test_candidate_bitmap_round_trip_with_missing_answers(self) -> None:
+        tag = encoding.get_dictionary_tag(self.wordlist_path)
+        candidates = [word for word in self.words if word not in {"faded", "gaffe"}]
+        encoded = encoding.encode_candidate_bitmap(
+            self.words, self.letters, self.required, candidates, tag
+        )
+        decoded = encoding.decode_candidate_bitmap(
+            encoded, self.letters, self.required, candidates, tag
+        )
+        self.assertEqual(decoded, self.words)
+
+        without_extras = encoding.encode_candidate_bitmap(
+            self.words, self.letters, self.required, self.words, tag
+        )
+        self.assertLess(len(without_extras), 40)
+
+    def test_candidate_bitmap_detects_dictionary_mismatch(self) -> None:
+        tag = encoding.get_dictionary_tag(self.wordlist_path)
+        encoded = encoding.encode_candidate_bitmap(
+            self.words, self.letters, self.required, self.words, tag
+        )
+        with self.assertRaises(ValueError):
+            encoding.decode_candidate_bitmap(
+                encoded, self.letters, self.required, self.words, b"\0\0\0\0"
+            )
+        with self.assertRaises(ValueError):
+            encoding.decode_candidate_bitmap(
+                encoded, self.letters, self.required, self.words[1:], tag
+            )
+
+
+def _encode_with_bit_writer(words, letters):
+    writer = encoding.BitWriter()
+    writer.write(len(words), 12)
+    for word in words:
+        for char in word:
+            writer.write(letters.index(char), 3)
+        writer.write(7, 3)
+    return encoding._b64encode(writer.finish())
+
+
+class TestBulkCodec(unittest.TestCase):
+    def test_matches_bit_writer_output(self) -> None:
+        random.seed(23)
+        alphabet = "abcdefghijklmnopqrstuvwxyz"
+        for _ in range(20):
+            letters = "".join(random.sample(alphabet, 7))
+            words, _, _, _ = solver.solve_spelling_bee(letters, ROOT / "nytbee_dict.txt")
+            self.assertEqual(
+                encoding.encode_terminated(words, letters, letters[0]),
+                _encode_with_bit_writer(words, letters),
+            )
+        self.assertEqual(
+            encoding.encode_terminated([], "abcdefg", "a"), _encode_with_bit_writer([], "abcdefg")
+        )
+
+    def test_archive_round_trips_byte_identically(self) -> None:
+        entries = []
+        for path in sorted((ROOT / "results").glob("????-??-??.encoded.txt")):
+            day = path.name[:10]
+            hint_path = ROOT / "results" / f"{day}.txt"
+            if not hint_path.exists():
+                continue
+            puzzle = archive.parse_results_file(
+                hint_path.read_text(encoding="utf-8"), date.fromisoformat(day)
+            )
+            entries.append(
+                (path.read_text(encoding="utf-8").strip(), puzzle.letters, puzzle.required)
+            )
+        self.assertTrue(entries)
+        decoded = encoding.decode_many(entries)
+        reencoded = encoding.encode_many(
+            (words, letters, required) for words, (_, letters, required) in zip(decoded, entries)
+        )
+        self.assertEqual(reencoded, [payload for payload, _, _ in entries])
+
+    def test_batch_matches_single_payloads(self) -> None:
+        puzzles = [
+            (["face", "cafe"], "abgcfed", "a"),
+            ([], "abcdefg", "a"),
+            (["abed", "bead", "bade"], "abcdefg", "a"),
+            (["gage"], "abgcfed", "g"),
+        ]
+        payloads = encoding.encode_many(puzzles)
+        self.assertEqual(payloads, [encoding.encode_terminated(*puzzle) for puzzle in puzzles])
+        self.assertEqual(
+            encoding.decode_many(
+                (payload, letters, required)
+                for payload, (_, letters, required) in zip(payloads, puzzles)
+            ),
+            [words for words, _, _ in puzzles],
+        )
+        self.assertEqual(encoding.encode_many([]), [])
+
+    def test_only_words_using_letters_past_the_seventh_are_rejected(self) -> None:
+        encoded = encoding.encode_terminated(["face", "cafe"], "abgcfedh", "a")
+        self.assertEqual(encoded, encoding.encode_terminated(["face", "cafe"], "abgcfed", "a"))
+        with self.assertRaises(ValueError):
+            encoding.encode_terminated(["head"], "abgcfedh", "a")
+        with self.assertRaises(ValueError):
+            encoding.encode_many([(["head"], "abgcfedh", "a")])
+
+    def test_truncated_payload_raises(self) -> None:
+        encoded = encoding.encode_terminated(["face", "cafe"], "abgcfed", "a")
+        with self.assertRaises(EOFError):
+            encoding.decode_terminated(encoded[:3], "abgcfed", "a")
+
 
 if __name__ == "__main__":
     unittest.main()
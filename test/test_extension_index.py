@@ -0,0 +1,70 @@
+import json
+import random
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from nytbee_solver import extension_index, solver
+from nytbee_solver.compiled import wordlist_digest
+
+WORDLIST = ROOT / "nytbee_dict.txt"
+
+
+class TestExtensionIndex(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls._tmpdir = tempfile.TemporaryDirectory()
+        cls.index_dir = Path(cls._tmpdir.name) / "index"
+        cls.changed = extension_index.build_extension_index(WORDLIST, cls.index_dir)
+        cls.index = extension_index.ExtensionIndex(cls.index_dir)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls._tmpdir.cleanup()
+
+    def test_round_trip_matches_solver(self) -> None:
+        rng = random.Random(3)
+        letter_sets = ["mafirng", "aregntp"]
+        letter_sets += ["".join(rng.sample("abcdefghijklmnopqrstuvwxyz", 7)) for _ in range(150)]
+        for letters in letter_sets:
+            self.assertEqual(
+                self.index.solve(letters),
+                solver.solve_spelling_bee(letters, WORDLIST),
+                letters,
+            )
+
+    def test_solve_reads_only_the_required_letter_shard(self) -> None:
+        index = extension_index.ExtensionIndex(self.index_dir)
+        index.solve("mafirng")
+        self.assertEqual(list(index._shards), ["m"])
+
+    def test_rebuild_is_a_no_op_and_manifest_tracks_wordlist(self) -> None:
+        self.assertTrue(self.changed)
+        self.assertFalse(extension_index.build_extension_index(WORDLIST, self.index_dir))
+        manifest = json.loads((self.index_dir / "index.json").read_text(encoding="utf-8"))
+        self.assertEqual(manifest["wordlist_sha256"], wordlist_digest(WORDLIST).hex())
+        self.assertEqual(sorted(manifest["shards"]), list("abcdefghijklmnopqrstuvwxyz"))
+
+    def test_rejects_puzzles_outside_the_index(self) -> None:
+        with self.assertRaises(ValueError):
+            self.index.solve("abcdefgh")
+
+
+class TestCommittedExtensionIndex(unittest.TestCase):
+    def test_bundled_index_matches_bundled_wordlist(self) -> None:
+        self.assertTrue(
+            extension_index.extension_index_is_current(
+                WORDLIST, ROOT / "safari-extension" / "wordlist" / "index"
+            ),
+            "Run python -m nytbee_solver.extension_index to rebuild the extension index.",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
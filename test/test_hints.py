@@ -0,0 +1,57 @@
+import io
+import json
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from nytbee_solver import hints, solver
+
+
+class TestHintSummary(unittest.TestCase):
+    def setUp(self) -> None:
+        self.words, self.pangrams, self.letters, self.required = solver.solve_spelling_bee(
+            "mafirng", wordlist_path=ROOT / "nytbee_dict.txt"
+        )
+        self.summary = hints.HintSummary.from_solution(
+            self.words, self.pangrams, self.letters, self.required
+        )
+
+    def test_text_matches_published_hint_page(self) -> None:
+        published = (ROOT / "results" / "2026-03-01.txt").read_text(encoding="utf-8")
+        self.assertTrue(published.endswith("\n\n" + self.summary.to_text()))
+
+    def test_text_matches_print_hint_page(self) -> None:
+        buffer = io.StringIO()
+        with patch("sys.stdout", new=buffer):
+            solver.print_hint_page(self.words, self.pangrams, self.letters, self.required)
+        self.assertEqual(buffer.getvalue(), self.summary.to_text())
+
+    def test_json_and_markdown(self) -> None:
+        data = json.loads(self.summary.to_json())
+        self.assertEqual(data["total_words"], len(self.words))
+        self.assertEqual(data["pangrams"], ["affirming", "farming", "framing"])
+        self.assertEqual(data["perfect_pangrams"], 2)
+        self.assertTrue(data["bingo"])
+        self.assertEqual(data["grid"]["M"]["4"], 7)
+        self.assertEqual(sum(len(group) for group in data["by_length"].values()), 58)
+
+        markdown = self.summary.to_markdown()
+        self.assertIn("| M | 7 | 8 | 6 | 4 | 2 | 1 | 0 | 0 | 28 |", markdown)
+        self.assertIn("- **11 letters (1):** anagramming", markdown)
+
+    def test_empty_solution(self) -> None:
+        summary = hints.HintSummary.from_solution([], [], "abcdefg", "a")
+        text = summary.to_text()
+        self.assertIn("Total words: 0\nPangrams: 0\n", text)
+        self.assertTrue(text.endswith("\nBy length:\n\nAlphabetical:\n"))
+        self.assertFalse(summary.bingo)
+
+
+if __name__ == "__main__":
+    unittest.main()
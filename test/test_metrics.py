@@ -0,0 +1,142 @@
+import io
+import json
+import pickle
+import sys
+import tempfile
+import unittest
+from datetime import date
+from pathlib import Path
+from unittest.mock import patch
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from nytbee_scrapper import scraper
+from nytbee_scrapper.metrics import (
+    BYTES_BUCKETS,
+    NULL_METRICS,
+    Histogram,
+    Metrics,
+    get_metrics,
+    use_metrics,
+)
+
+PAGE = """
+<div id="main-answer-list">
+  <ul>
+    <li>Apple</li>
+    <li>banana</li>
+  </ul>
+</div>
+"""
+
+
+class TestHistogram(unittest.TestCase):
+    def test_buckets_are_cumulative(self) -> None:
+        histogram = Histogram((1, 10))
+        for value in (0.5, 5, 5, 50):
+            histogram.observe(value)
+
+        data = histogram.as_dict()
+
+        self.assertEqual(data["buckets"], {"1": 1, "10": 3, "+Inf": 4})
+        self.assertEqual(data["count"], 4)
+        self.assertEqual(data["max"], 50)
+
+    def test_merge_rejects_different_buckets(self) -> None:
+        with self.assertRaises(ValueError):
+            Histogram((1,)).merge(Histogram((2,)))
+
+
+class TestMetrics(unittest.TestCase):
+    def test_record_fetch_separates_cache_hits(self) -> None:
+        metrics = Metrics()
+        metrics.record_fetch("https://example.com/a", 0.2, 2048, 200, False)
+        metrics.record_fetch("https://example.com/a", 0.0, 2048, None, True)
+
+        self.assertEqual(metrics.counters["fetch_requests_total"], 1)
+        self.assertEqual(metrics.counters["fetch_cache_hits_total"], 1)
+        self.assertEqual(metrics.counters["fetch_bytes_total"], 2048)
+        self.assertEqual(metrics.histograms["fetch_seconds"].count, 1)
+        self.assertEqual(len(metrics.fetches), 2)
+
+    def test_merge_survives_pickling(self) -> None:
+        worker = Metrics()
+        worker.increment("pages_scraped_total")
+        worker.observe("solve_seconds", 0.01)
+        parent = Metrics()
+        parent.increment("pages_scraped_total")
+
+        parent.merge(pickle.loads(pickle.dumps(worker)))
+
+        self.assertEqual(parent.counters["pages_scraped_total"], 2)
+        self.assertEqual(parent.histograms["solve_seconds"].count, 1)
+
+    def test_write_prometheus_and_json(self) -> None:
+        metrics = Metrics()
+        metrics.increment("pages_scraped_total", 3)
+        metrics.observe("parse_seconds", 0.002)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            prom_path = Path(tmpdir) / "nytbee.prom"
+            json_path = Path(tmpdir) / "metrics.json"
+            metrics.write(prom_path)
+            metrics.write(json_path)
+            prom = prom_path.read_text(encoding="utf-8")
+            data = json.loads(json_path.read_text(encoding="utf-8"))
+
+        self.assertIn("# TYPE nytbee_pages_scraped_total counter\n", prom)
+        self.assertIn("nytbee_pages_scraped_total 3\n", prom)
+        self.assertIn('nytbee_parse_seconds_bucket{le="+Inf"} 1\n', prom)
+        self.assertIn("nytbee_parse_seconds_count 1\n", prom)
+        self.assertEqual(data["counters"], {"pages_scraped_total": 3})
+
+    def test_prometheus_values_keep_full_precision(self) -> None:
+        metrics = Metrics()
+        metrics.increment("fetch_bytes_total", 36358024)
+        metrics.observe("fetch_seconds", 1.2345678)
+        metrics.observe("fetch_bytes", 2000000, BYTES_BUCKETS)
+        stream = io.StringIO()
+
+        metrics.write_prometheus(stream)
+
+        self.assertIn('nytbee_fetch_bytes_bucket{le="1048576"} 0\n', stream.getvalue())
+        self.assertIn('nytbee_fetch_bytes_bucket{le="4194304"} 1\n', stream.getvalue())
+        self.assertIn('nytbee_fetch_seconds_bucket{le="0.0005"} 0\n', stream.getvalue())
+
+        self.assertIn("nytbee_fetch_bytes_total 36358024\n", stream.getvalue())
+        self.assertIn("nytbee_fetch_seconds_sum 1.2345678\n", stream.getvalue())
+
+    def test_write_summary_lists_stages(self) -> None:
+        metrics = Metrics()
+        metrics.observe("render_seconds", 0.004)
+        stream = io.StringIO()
+
+        metrics.write_summary(stream)
+
+        self.assertIn("render_seconds", stream.getvalue())
+
+
+class TestCollectWordCountsMetrics(unittest.TestCase):
+    def test_records_parse_and_page_counts(self) -> None:
+        with use_metrics(Metrics()) as metrics:
+            with patch.object(scraper, "fetch_html", return_value=PAGE):
+                scraper.collect_word_counts(date(2024, 1, 2), 2)
+
+        self.assertEqual(metrics.counters["pages_scraped_total"], 2)
+        self.assertEqual(metrics.histograms["parse_seconds"].count, 2)
+        self.assertEqual(metrics.histograms["normalize_seconds"].count, 2)
+
+    def test_disabled_by_default(self) -> None:
+        self.assertIs(get_metrics(), NULL_METRICS)
+        with patch.object(scraper, "fetch_html", return_value=PAGE):
+            scraper.collect_word_counts(date(2024, 1, 2), 1)
+
+        self.assertEqual(NULL_METRICS.counters, {})
+        self.assertEqual(NULL_METRICS.histograms, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
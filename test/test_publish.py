@@ -0,0 +1,146 @@
+import sys
+import tempfile
+import unittest
+from datetime import date
+from pathlib import Path
+from unittest.mock import patch
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from nytbee_scrapper import scraper
+from nytbee_scrapper.metrics import Metrics, use_metrics
+from nytbee_solver import publish, solver
+
+PAGE = """
+<div id="main-answer-list">
+  <ul>
+    <li>bag</li>
+    <li>cafe</li>
+    <li>dad</li>
+  </ul>
+</div>
+"""
+
+
+class TestBackfillResults(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmpdir = tempfile.TemporaryDirectory()
+        tmp = Path(self._tmpdir.name)
+        self.output_dir = tmp / "results"
+        self.wordlist = tmp / "words.txt"
+        self.wordlist.write_text("bag\ncafe\ndad\nabed\nface\n")
+        self.fetched: list[str] = []
+
+        def fake_fetch(url: str) -> str:
+            self.fetched.append(url)
+            if url.endswith("20260303.html"):
+                raise OSError("not archived")
+            return PAGE
+
+        self._patch = patch.object(solver, "fetch_html", side_effect=fake_fetch)
+        self._patch.start()
+
+    def tearDown(self) -> None:
+        self._patch.stop()
+        self._tmpdir.cleanup()
+
+    def _generate(self, puzzle_date: date) -> tuple[Path, Path]:
+        return publish.generate_daily_results(
+            self.output_dir, puzzle_date, wordlist_path=self.wordlist
+        )
+
+    def _backfill(self, output_dir: Path, start: date, end: date, **kwargs) -> list:
+        return publish.backfill_results(
+            output_dir, start, end, wordlist_path=self.wordlist, **kwargs
+        )
+
+    def test_generate_daily_results_uses_requested_date(self) -> None:
+        output_path, encoded_path = self._generate(date(2026, 3, 1))
+        self.assertEqual(output_path.name, "2026-03-01.txt")
+        self.assertEqual(encoded_path.name, "2026-03-01.encoded.txt")
+        self.assertIn("Date: 2026-03-01", output_path.read_text(encoding="utf-8"))
+        self.assertEqual(self.fetched, [scraper.BASE_URL.format(date="20260301")])
+
+    def test_backfill_skips_existing_days_and_reports_failures(self) -> None:
+        self._generate(date(2026, 3, 1))
+        self.fetched.clear()
+
+        outcomes = self._backfill(
+            self.output_dir, date(2026, 3, 1), date(2026, 3, 3), max_workers=1
+        )
+
+        self.assertEqual(outcomes[0], (date(2026, 3, 1), "skipped"))
+        self.assertEqual(outcomes[1], (date(2026, 3, 2), "written"))
+        self.assertEqual(outcomes[2][0], date(2026, 3, 3))
+        self.assertTrue(outcomes[2][1].startswith("failed:"))
+        self.assertEqual(len(self.fetched), 2)
+        self.assertTrue((self.output_dir / "2026-03-02.encoded.txt").exists())
+        self.assertFalse((self.output_dir / "2026-03-03.txt").exists())
+
+    def test_forced_backfill_leaves_unchanged_files_alone(self) -> None:
+        output_path, _ = self._generate(date(2026, 3, 1))
+        mtime = output_path.stat().st_mtime_ns
+
+        outcomes = self._backfill(
+            self.output_dir, date(2026, 3, 1), date(2026, 3, 1), max_workers=1, force=True
+        )
+
+        self.assertEqual(outcomes, [(date(2026, 3, 1), "unchanged")])
+        self.assertEqual(output_path.stat().st_mtime_ns, mtime)
+
+    def test_parallel_backfill_matches_serial(self) -> None:
+        parallel_dir = self.output_dir / "parallel"
+        serial = self._backfill(
+            self.output_dir, date(2026, 3, 1), date(2026, 3, 3), max_workers=1
+        )
+
+        self.fetched.clear()
+        parallel = self._backfill(
+            parallel_dir, date(2026, 3, 1), date(2026, 3, 3), max_workers=2
+        )
+
+        self.assertEqual(parallel, serial)
+        # Pages are fetched by the parent; workers only solve and render.
+        self.assertEqual(len(self.fetched), 3)
+        for name in ("2026-03-01.txt", "2026-03-02.encoded.txt"):
+            self.assertEqual(
+                (parallel_dir / name).read_text(encoding="utf-8"),
+                (self.output_dir / name).read_text(encoding="utf-8"),
+            )
+
+    def test_backfill_fetches_are_rate_limited(self) -> None:
+        with use_metrics(Metrics()) as metrics:
+            self._backfill(
+                self.output_dir,
+                date(2026, 3, 1),
+                date(2026, 3, 3),
+                max_workers=2,
+                max_requests_per_second=1000,
+            )
+
+        self.assertEqual(metrics.histograms["rate_limit_wait_seconds"].count, 3)
+
+    def test_backfill_records_stage_timings(self) -> None:
+        with use_metrics(Metrics()) as metrics:
+            self._backfill(
+                self.output_dir, date(2026, 3, 1), date(2026, 3, 2), max_workers=1
+            )
+
+        for stage in ("parse_seconds", "solve_seconds", "render_seconds", "encode_seconds"):
+            self.assertEqual(metrics.histograms[stage].count, 2, stage)
+
+
+class TestPublishCli(unittest.TestCase):
+    def test_end_date_requires_start_date(self) -> None:
+        argv = ["publish", "--end-date", "2026-03-01"]
+        with patch.object(sys, "argv", argv), patch("sys.stderr"):
+            with self.assertRaises(SystemExit) as raised:
+                publish.main()
+        self.assertEqual(raised.exception.code, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
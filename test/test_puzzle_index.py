@@ -0,0 +1,96 @@
+import random
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+from pathlib import Path
+from unittest.mock import patch
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from nytbee_solver import puzzle_index, solver
+
+
+class TestPuzzleIndex(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.wordlist_path = ROOT / "nytbee_dict.txt"
+        cls._tmpdir = tempfile.TemporaryDirectory()
+        cls.index_path = puzzle_index.build_puzzle_index(
+            cls.wordlist_path, Path(cls._tmpdir.name) / "dict.puzzles", max_workers=1
+        )
+        cls.index = puzzle_index.PuzzleIndex.open(cls.index_path)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls._tmpdir.cleanup()
+
+    def test_stats_match_solver(self) -> None:
+        random.seed(3)
+        for stats in random.sample(list(self.index), 40):
+            words, pangrams, _, _ = solver.solve_spelling_bee(
+                stats.letters, wordlist_path=self.wordlist_path
+            )
+            self.assertEqual(stats.word_count, len(words))
+            self.assertEqual(stats.pangram_count, len(pangrams))
+            self.assertEqual(
+                stats.perfect_pangram_count, sum(1 for word in pangrams if len(word) == 7)
+            )
+            self.assertEqual(stats.longest_word, min(words, key=lambda word: (-len(word), word)))
+
+    def test_lookup_uses_required_letter(self) -> None:
+        stats = self.index.lookup("mafirng")
+        self.assertIsNotNone(stats)
+        self.assertEqual(stats.required, "m")
+        self.assertEqual(stats.word_count, 58)
+        self.assertEqual(stats.pangram_count, 3)
+        self.assertEqual(stats.perfect_pangram_count, 2)
+        self.assertEqual(self.index.lookup("gafirnm").required, "g")
+        self.assertIn("mafirng", self.index)
+
+    def test_lookup_without_pangram_returns_none(self) -> None:
+        self.assertIsNone(self.index.lookup("zqxjkvw"))
+
+    def test_every_puzzle_has_seven_required_letters(self) -> None:
+        self.assertEqual(len(list(self.index)), 7 * len(self.index))
+
+    def test_open_rejects_index_of_another_wordlist_version(self) -> None:
+        self.assertEqual(
+            len(puzzle_index.PuzzleIndex.open(self.index_path, self.wordlist_path)),
+            len(self.index),
+        )
+        other = Path(self._tmpdir.name) / "other.txt"
+        other.write_text("mafirng\nfarming\n")
+        with self.assertRaisesRegex(ValueError, "out of date"):
+            puzzle_index.PuzzleIndex.open(self.index_path, other)
+
+    def test_records_hold_counts_above_65535(self) -> None:
+        fields = (0,) + (70000,) * (4 * puzzle_index.PUZZLE_SIZE)
+        record = puzzle_index._RECORD.pack(*fields)
+        self.assertEqual(puzzle_index._RECORD.unpack(record), fields)
+
+    def test_cli_lookup_reports_invalid_letters(self) -> None:
+        argv = [
+            "puzzle_index",
+            "--wordlist",
+            str(self.wordlist_path),
+            "--index",
+            str(self.index_path),
+            "--lookup",
+            "abc",
+            "mafirng",
+        ]
+        output = StringIO()
+        with patch.object(sys, "argv", argv), redirect_stdout(output):
+            puzzle_index.main()
+        lines = output.getvalue().splitlines()
+        self.assertEqual(lines[0], "abc: not a valid puzzle")
+        self.assertIn(": 58 words, 3 pangrams", lines[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,4 +1,9 @@
+import io
+import plistlib
+import random
 import sys
+import threading
+import time
 import unittest
 from datetime import date
 from pathlib import Path
@@ -9,7 +14,7 @@ SRC = ROOT / "src"
 if str(SRC) not in sys.path:
     sys.path.insert(0, str(SRC))
 
-from nytbee_scrapper import scraper
+from nytbee_scrapper import cli, scraper
 
 
 class TestScraperParsing(unittest.TestCase):
@@ -33,6 +38,40 @@ class TestScraperParsing(unittest.TestCase):
         items = scraper.extract_answer_list(html)
         self.assertEqual(items, ["Apple", "Banana"])
 
+    def test_scanner_matches_html_parser_on_fixtures(self) -> None:
+        with (ROOT / "Spelling Bee Answers.webarchive").open("rb") as handle:
+            archive = plistlib.load(handle)
+        fixtures = [
+            archive["WebMainResource"]["WebResourceData"].decode("utf-8"),
+            '<div id="main-answer-list"><ul><li>bag</li><li>cafe</li></ul></div>',
+            "<script>var s = \"<div id='main-answer-list'>\";</script>"
+            "<DIV ID='main-answer-list'><ul><li>Apple &amp; <b>pie</b><script>x</script></li>"
+            "<li/><div><li>skip</li></div><ul><li>Outer<li>Inner</li></li></ul></ul>"
+            "<!-- <li>hidden</li> --><li>outside ul</li></DIV><p>after</p>",
+            "<div id=main-answer-list><ul><li>x &lt; y</li><li>r\r\nq</li></ul>",
+        ]
+        for html in fixtures:
+            parser = scraper.MainAnswerListParser()
+            parser.feed(html)
+            expected = [item.replace("\r", "") for item in parser.items]
+            self.assertEqual(scraper.extract_answer_list(html), expected)
+
+            data = html.encode("utf-8")
+            random.seed(len(data))
+            cuts = sorted(random.sample(range(len(data) + 1), min(len(data), 25)))
+            chunks = [data[start:end] for start, end in zip([0, *cuts], [*cuts, len(data)])]
+            self.assertEqual(scraper.extract_answer_list_from_stream(chunks), expected)
+
+    def test_stream_extraction_stops_after_list(self) -> None:
+        html = (
+            b'<div id="main-answer-list"><ul><li>Alpha</li></ul></div>'
+            + b"<p>filler</p>" * 10000
+        )
+        stream = io.BytesIO(html)
+        items = scraper.extract_answer_list_from_stream(stream, chunk_size=64)
+        self.assertEqual(items, ["Alpha"])
+        self.assertLess(stream.tell(), 1024)
+
     def test_normalize_answer_handles_pangram_suffix(self) -> None:
         self.assertEqual(scraper.normalize_answer("Mango Perfect Pangram"), "mango")
         self.assertEqual(scraper.normalize_answer("Berry pangram"), "berry")
@@ -73,10 +112,96 @@ class TestScraperCollectCounts(unittest.TestCase):
         self.assertEqual(len(failures), 1)
         self.assertIn("No answers extracted", failures[0][1])
 
+    def test_collect_word_counts_parallel_matches_serial(self) -> None:
+        starting_date = date(2024, 1, 10)
+        base_url = "https://example.com/Bee_{date}.html"
+        random.seed(5)
+        delays = {day: random.random() / 200 for day in range(10)}
+
+        def fake_fetch(url: str, timeout: int = 20) -> str:
+            day = int(url[-7:-5])
+            time.sleep(delays[day % 10])
+            if day % 4 == 0:
+                return "<div id=\"main-answer-list\"></div>"
+            return (
+                "<div id=\"main-answer-list\"><ul>"
+                f"<li>Word{chr(ord('a') + day)}</li><li>Shared</li>"
+                "</ul></div>"
+            )
+
+        progress: list[int] = []
+        lock = threading.Lock()
+
+        def record_progress(target_date: date, current: int, total: int) -> None:
+            with lock:
+                progress.append(current)
+
+        with patch.object(scraper, "fetch_html", side_effect=fake_fetch):
+            serial = scraper.collect_word_counts(starting_date, 10, base_url=base_url)
+            parallel = scraper.collect_word_counts(
+                starting_date,
+                10,
+                base_url=base_url,
+                max_workers=4,
+                progress_callback=record_progress,
+            )
+
+        self.assertEqual(parallel, serial)
+        self.assertEqual(list(parallel[0]), list(serial[0]))
+        self.assertEqual(parallel[0]["shared"], 8)
+        self.assertEqual(progress, list(range(1, 11)))
+
+    def test_collect_word_counts_skips_existing_urls_in_parallel(self) -> None:
+        base_url = "https://example.com/Bee_{date}.html"
+        fetched: list[str] = []
+
+        def fake_fetch(url: str, timeout: int = 20) -> str:
+            fetched.append(url)
+            return "<div id=\"main-answer-list\"><ul><li>Alpha</li></ul></div>"
+
+        existing = {base_url.format(date="20240102")}
+        with patch.object(scraper, "fetch_html", side_effect=fake_fetch):
+            counts, scraped, failures = scraper.collect_word_counts(
+                date(2024, 1, 3),
+                3,
+                base_url=base_url,
+                existing_scraped_urls=existing,
+                max_workers=2,
+            )
+
+        self.assertEqual(counts, {"alpha": 2})
+        self.assertEqual(len(scraped), 3)
+        self.assertNotIn(base_url.format(date="20240102"), fetched)
+        self.assertEqual(failures, [])
+
+    def test_rate_limiter_spaces_requests(self) -> None:
+        limiter = scraper.RateLimiter(50)
+        start = time.monotonic()
+        for _ in range(5):
+            limiter.wait()
+        self.assertGreaterEqual(time.monotonic() - start, 0.07)
+
     def test_collect_word_counts_rejects_negative_days(self) -> None:
         with self.assertRaises(ValueError):
             scraper.collect_word_counts(date(2024, 1, 1), -1)
 
 
+class TestScraperCli(unittest.TestCase):
+    def test_rejects_non_positive_workers_and_cache_size(self) -> None:
+        parser = cli.build_parser()
+        for argv in (
+            ["--workers", "0"],
+            ["--workers", "-2"],
+            ["--cache-size", "0"],
+            ["--cache-size", "-1"],
+            ["--rate-limit", "0"],
+        ):
+            with patch("sys.stderr"), self.assertRaises(SystemExit) as raised:
+                parser.parse_args(argv)
+            self.assertEqual(raised.exception.code, 2, argv)
+        args = parser.parse_args(["--workers", "3", "--cache-size", "0.5"])
+        self.assertEqual((args.workers, args.cache_size), (3, 0.5))
+
+
 if __name__ == "__main__":
     unittest.main()
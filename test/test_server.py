@@ -0,0 +1,115 @@
+import http.client
+import json
+import socket
+import sys
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from nytbee_solver import encoding, server, solver
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, path: str) -> None:
+        super().__init__("localhost")
+        self._path = path
+
+    def connect(self) -> None:
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.connect(self._path)
+
+
+class TestSolverServer(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.service = server.SolverService(ROOT / "nytbee_dict.txt")
+
+    def _serve(self, unix_socket=None):
+        httpd = server.create_server(self.service, port=0, unix_socket=unix_socket)
+        thread = threading.Thread(
+            target=httpd.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+        )
+        thread.start()
+        self.addCleanup(httpd.server_close)
+        self.addCleanup(httpd.shutdown)
+        return httpd
+
+    def _get(self, connection, path):
+        connection.request("GET", path)
+        response = connection.getresponse()
+        return response.status, response.read().decode("utf-8")
+
+    def test_endpoints_over_tcp(self) -> None:
+        httpd = self._serve()
+        connection = http.client.HTTPConnection("127.0.0.1", httpd.server_address[1])
+        self.addCleanup(connection.close)
+
+        status, body = self._get(connection, "/solve?letters=mafirng")
+        expected = solver.solve_spelling_bee("mafirng", ROOT / "nytbee_dict.txt")
+        self.assertEqual(status, 200)
+        self.assertEqual(json.loads(body)["words"], expected[0])
+
+        status, body = self._get(connection, "/hint?letters=mafirng")
+        self.assertEqual(status, 200)
+        self.assertTrue(body.startswith("NYT Spelling Bee Hint Page"))
+
+        status, body = self._get(connection, "/encode?letters=mafirng&format=front-coded")
+        self.assertEqual(status, 200)
+        self.assertEqual(encoding.decode_front_coded(body, "mafirng", "m"), expected[0])
+
+        status, _ = self._get(connection, "/encode?letters=mafirng&format=bitmap")
+        self.assertEqual(status, 400)
+
+        status, body = self._get(connection, "/solve?letters=abc")
+        self.assertEqual(status, 400)
+        self.assertIn("error", json.loads(body))
+
+        status, body = self._get(connection, "/metrics")
+        endpoints = json.loads(body)["endpoints"]
+        self.assertGreaterEqual(endpoints["solve"]["count"], 2)
+        self.assertGreaterEqual(endpoints["solve"]["errors"], 1)
+        self.assertEqual(endpoints["hint"]["count"], 1)
+
+    def test_unexpected_errors_return_500(self) -> None:
+        httpd = self._serve()
+        connection = http.client.HTTPConnection("127.0.0.1", httpd.server_address[1])
+        self.addCleanup(connection.close)
+        errors = self.service.stats["encode"].errors
+
+        with patch.object(self.service, "encode", side_effect=RuntimeError("boom")):
+            status, body = self._get(connection, "/encode?letters=mafirng")
+
+        self.assertEqual(status, 500)
+        self.assertIn("boom", json.loads(body)["error"])
+        self.assertEqual(self.service.stats["encode"].errors, errors + 1)
+
+    @unittest.skipUnless(hasattr(socket, "AF_UNIX"), "Unix sockets are not available")
+    def test_unix_socket(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "solver.sock"
+            self._serve(unix_socket=path)
+            connection = _UnixHTTPConnection(str(path))
+            self.addCleanup(connection.close)
+            status, body = self._get(connection, "/hint?letters=mafirng&format=json")
+        self.assertEqual(status, 200)
+        self.assertEqual(json.loads(body)["total_words"], 58)
+
+    @unittest.skipUnless(hasattr(socket, "AF_UNIX"), "Unix sockets are not available")
+    def test_unix_socket_refuses_to_replace_regular_file(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "notes.txt"
+            path.write_text("keep me")
+            with self.assertRaises(FileExistsError):
+                server.create_server(self.service, unix_socket=path)
+            self.assertEqual(path.read_text(), "keep me")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+import random
+import sys
+import tempfile
+import unittest
+from datetime import date, timedelta
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from nytbee_scrapper import shards, store
+
+PAGE = """
+<div id="main-answer-list">
+  <ul>
+    <li>Apple</li>
+    <li>banana</li>
+  </ul>
+</div>
+"""
+
+
+def _shard(start: date, days: int, words: list[str]) -> shards.WordCountShard:
+    return shards.WordCountShard.from_days(
+        {start + timedelta(days=offset): words for offset in range(days)}
+    )
+
+
+class TestWordCountShard(unittest.TestCase):
+    def test_merge_is_associative_and_commutative(self) -> None:
+        a = _shard(date(2024, 1, 1), 3, ["alpha", "beta"])
+        b = _shard(date(2024, 2, 1), 2, ["beta"])
+        c = _shard(date(2024, 3, 1), 1, ["gamma", "alpha"])
+
+        left = a.merge(b).merge(c)
+        right = a.merge(b.merge(c))
+
+        self.assertEqual(left, right)
+        self.assertEqual(c.merge(a).merge(b), left)
+        self.assertEqual(left.counts, {"alpha": 4, "beta": 5, "gamma": 1})
+        self.assertEqual(len(left.days), 6)
+
+    def test_merge_rejects_overlapping_days(self) -> None:
+        a = _shard(date(2024, 1, 1), 3, ["alpha"])
+        with self.assertRaises(ValueError):
+            a.merge(_shard(date(2024, 1, 3), 1, ["alpha"]))
+
+    def test_round_trip_is_deterministic(self) -> None:
+        shard = _shard(date(2024, 1, 30), 5, ["alpha", "beta"]).merge(
+            _shard(date(2024, 3, 1), 1, ["café"])
+        )
+        data = shards.dumps_shard(shard)
+
+        self.assertEqual(shards.loads_shard(data), shard)
+        self.assertEqual(shards.dumps_shard(shards.loads_shard(data)), data)
+        with self.assertRaises(ValueError):
+            shards.loads_shard(b"not a shard")
+
+    def test_from_html_parses_pages(self) -> None:
+        shard = shards.WordCountShard.from_html({date(2024, 1, 1): PAGE})
+        self.assertEqual(shard.counts, {"apple": 1, "banana": 1})
+
+    def test_shard_periods(self) -> None:
+        self.assertEqual(
+            shards.shard_periods(date(2023, 12, 15), date(2024, 2, 10)),
+            [
+                ("2023-12", date(2023, 12, 15), date(2023, 12, 31)),
+                ("2024-01", date(2024, 1, 1), date(2024, 1, 31)),
+                ("2024-02", date(2024, 2, 1), date(2024, 2, 10)),
+            ],
+        )
+        self.assertEqual(
+            [key for key, _, _ in shards.shard_periods(date(2023, 6, 1), date(2024, 2, 1), "year")],
+            ["2023", "2024"],
+        )
+
+
+class TestBuildShards(unittest.TestCase):
+    def test_parallel_shards_total_the_store(self) -> None:
+        random.seed(5)
+        vocabulary = ["alpha", "beta", "gamma", "delta", "epsilon", "zeta"]
+        start = date(2023, 11, 20)
+        end = date(2024, 2, 10)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmp = Path(tmpdir)
+            store_path = tmp / "scrape.sqlite3"
+            with store.ScrapeStore(store_path) as scrape_store:
+                day = start
+                while day <= end:
+                    words = random.sample(vocabulary, 3)
+                    scrape_store.record_day(day, f"https://example.com/{day}", words)
+                    day += timedelta(days=1)
+                expected = scrape_store.word_counts(start, end)
+
+            outcomes = shards.build_shards(store_path, tmp / "shards", start, end, max_workers=2)
+            totals = shards.load_totals(sorted((tmp / "shards").glob("*.counts.gz")))
+            rebuilt = shards.build_shards(
+                store_path, tmp / "shards", start, end, granularity="month", max_workers=1
+            )
+
+        self.assertEqual(
+            [name for name, _ in outcomes],
+            ["2023-11.counts.gz", "2023-12.counts.gz", "2024-01.counts.gz", "2024-02.counts.gz"],
+        )
+        self.assertEqual(totals.counts, expected)
+        self.assertEqual(len(totals.days), (end - start).days + 1)
+        self.assertEqual({outcome for _, outcome in rebuilt}, {"unchanged"})
+
+
+if __name__ == "__main__":
+    unittest.main()
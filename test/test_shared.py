@@ -0,0 +1,81 @@
+import multiprocessing
+import sys
+import tempfile
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from unittest.mock import patch
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from nytbee_solver import compiled, shared, solver
+
+LETTER_SETS = ["mafirng", "aregntp", "lobcekt"]
+
+
+def _solve_in_worker(wordlist_path: Path, letters: str) -> tuple[bool, tuple]:
+    attached = wordlist_path.resolve() in solver._WORD_STORES
+    return attached, solver.solve_spelling_bee(letters, wordlist_path)
+
+
+class TestSharedWordlist(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.wordlist = Path(self._tmpdir.name) / "words.txt"
+        self.wordlist.write_bytes((ROOT / "nytbee_dict.txt").read_bytes())
+        solver._WORD_STORES.pop(self.wordlist.resolve(), None)
+
+    def tearDown(self) -> None:
+        solver._WORD_STORES.pop(self.wordlist.resolve(), None)
+        self._tmpdir.cleanup()
+
+    def _solve_in_pool(self, handle: shared.SharedWordlist) -> list[tuple[bool, tuple]]:
+        # Spawned workers inherit nothing, so they only have the wordlist if the
+        # initializer attached it.
+        with ProcessPoolExecutor(
+            max_workers=2,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=shared.attach_wordlist,
+            initargs=(handle,),
+        ) as executor:
+            wordlists = [self.wordlist] * len(LETTER_SETS)
+            return list(executor.map(_solve_in_worker, wordlists, LETTER_SETS))
+
+    def _expected(self) -> list[tuple[bool, tuple]]:
+        return [
+            (True, solver.solve_spelling_bee(letters, self.wordlist)) for letters in LETTER_SETS
+        ]
+
+    def test_workers_attach_the_compiled_file(self) -> None:
+        with shared.share_wordlist(self.wordlist) as handle:
+            compiled_path = compiled.get_compiled_wordlist_path(self.wordlist.resolve())
+            self.assertEqual(handle.compiled_path, compiled_path)
+            results = self._solve_in_pool(handle)
+        self.assertEqual(results, self._expected())
+
+    def test_workers_attach_a_temporary_file_when_compiled_file_is_unwritable(self) -> None:
+        with patch.object(compiled, "_write_atomic", side_effect=PermissionError):
+            with shared.share_wordlist(self.wordlist) as handle:
+                self.assertNotEqual(handle.compiled_path.parent, self.wordlist.parent)
+                results = self._solve_in_pool(handle)
+        self.assertFalse(handle.compiled_path.exists())
+        self.assertEqual(results, self._expected())
+
+    def test_attach_registers_the_store_for_get_word_store(self) -> None:
+        with shared.share_wordlist(self.wordlist) as handle:
+            store = shared.attach_wordlist(handle)
+        self.assertIs(solver.get_word_store(self.wordlist), store)
+        self.assertIs(shared.attach_wordlist(handle), store)
+
+    def test_attach_rejects_a_recompiled_wordlist(self) -> None:
+        with shared.share_wordlist(self.wordlist) as handle:
+            stale = handle._replace(digest=b"\0" * 32, signature=(0, 0))
+            with self.assertRaises(ValueError):
+                shared.attach_wordlist(stale)
+
+
+if __name__ == "__main__":
+    unittest.main()
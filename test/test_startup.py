@@ -0,0 +1,85 @@
+import os
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+
+# Generous enough for slow CI machines; override with NYTBEE_IMPORT_BUDGET_MS.
+IMPORT_BUDGET_MS = float(os.environ.get("NYTBEE_IMPORT_BUDGET_MS", "250"))
+
+NETWORK_MODULES = {
+    "base64",
+    "html.parser",
+    "http.client",
+    "sqlite3",
+    "urllib.request",
+    "nytbee_scrapper.client",
+    "nytbee_scrapper.scraper",
+}
+# Optional accelerators that only batch paths load on demand.
+HEAVY_MODULES = {"numpy"}
+
+
+def _run(*args: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *args],
+        capture_output=True,
+        text=True,
+        env=dict(os.environ, PYTHONPATH=str(SRC)),
+        check=True,
+    )
+
+
+def _loaded_modules(statement: str) -> set[str]:
+    result = _run("-c", f"{statement}\nimport sys\nprint(' '.join(sys.modules))")
+    return set(result.stdout.split())
+
+
+def _import_times(statement: str) -> dict[str, int]:
+    """Return ``{module: cumulative microseconds}`` from ``python -X importtime``."""
+    result = _run("-X", "importtime", "-c", statement)
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+class TestStartup(unittest.TestCase):
+    def test_solver_cli_does_not_import_network_stack(self) -> None:
+        modules = _loaded_modules("import nytbee_solver.cli")
+        self.assertIn("nytbee_solver.solver", modules)
+        self.assertEqual(NETWORK_MODULES & modules, set())
+        self.assertEqual(HEAVY_MODULES & modules, set())
+
+    def test_scraper_cli_defers_cache_and_metrics(self) -> None:
+        modules = _loaded_modules("import nytbee_scrapper.cli")
+        self.assertEqual(
+            {"sqlite3", "nytbee_scrapper.cache", "nytbee_scrapper.metrics"} & modules, set()
+        )
+
+    def test_encoding_does_not_import_compiled_wordlists(self) -> None:
+        modules = _loaded_modules("import nytbee_solver.encoding")
+        self.assertNotIn("nytbee_solver.compiled", modules)
+
+    def test_solver_cli_import_budget(self) -> None:
+        times = _import_times("import nytbee_solver.cli")
+        self.assertLess(times["nytbee_solver.cli"] / 1000, IMPORT_BUDGET_MS)
+
+    def test_package_exports_resolve_lazily(self) -> None:
+        modules = _loaded_modules(
+            "import nytbee_scrapper, nytbee_solver; nytbee_solver.solve_spelling_bee"
+        )
+        self.assertNotIn("nytbee_scrapper.scraper", modules)
+        self.assertIn("nytbee_solver.solver", modules)
+        self.assertNotIn("nytbee_solver.encoding", modules)
+
+
+if __name__ == "__main__":
+    unittest.main()
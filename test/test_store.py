@@ -0,0 +1,99 @@
+import random
+import sys
+import tempfile
+import unittest
+from collections import Counter
+from datetime import date, timedelta
+from pathlib import Path
+from unittest.mock import patch
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from nytbee_scrapper import scraper, store
+
+
+class TestScrapeStore(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.path = Path(self._tmpdir.name) / "scrape.sqlite3"
+
+    def tearDown(self) -> None:
+        self._tmpdir.cleanup()
+
+    def test_window_counts_match_per_day_totals(self) -> None:
+        random.seed(11)
+        vocabulary = ["alpha", "beta", "gamma", "delta", "epsilon"]
+        start = date(2023, 12, 20)
+        recorded = {}
+        with store.ScrapeStore(self.path) as scrape_store:
+            for offset in range(90):
+                day = start + timedelta(days=offset)
+                words = random.sample(vocabulary, 3)
+                recorded[day] = words
+                scrape_store.record_day(day, f"https://example.com/{day}", words)
+            windows = [
+                (date(2024, 1, 1), date(2024, 1, 31)),
+                (date(2023, 12, 25), date(2024, 2, 10)),
+                (date(2024, 1, 5), date(2024, 1, 9)),
+                (date(2023, 12, 1), date(2024, 3, 31)),
+            ]
+            for window_start, window_end in windows:
+                expected = Counter()
+                for day, words in recorded.items():
+                    if window_start <= day <= window_end:
+                        expected.update(words)
+                self.assertEqual(
+                    scrape_store.word_counts(window_start, window_end), dict(expected)
+                )
+
+    def test_recording_a_day_twice_replaces_it(self) -> None:
+        day = date(2024, 1, 2)
+        with store.ScrapeStore(self.path) as scrape_store:
+            scrape_store.record_day(day, "https://example.com/a", ["alpha", "beta"])
+            scrape_store.record_day(day, "https://example.com/a", ["alpha"])
+            self.assertEqual(scrape_store.answers(day), ["alpha"])
+            self.assertEqual(
+                scrape_store.word_counts(date(2024, 1, 1), date(2024, 1, 31)), {"alpha": 1}
+            )
+            self.assertIn(day, scrape_store)
+            self.assertEqual(len(scrape_store), 1)
+
+    def test_collect_word_counts_resumes_from_store(self) -> None:
+        base_url = "https://example.com/Bee_{date}.html"
+        fetched: list[str] = []
+        crash = [True]
+
+        def flaky_fetch(url: str, timeout: int = 20) -> str:
+            fetched.append(url)
+            if url.endswith("20240103.html") and crash[0]:
+                raise RuntimeError("crash mid-backfill")
+            return "<div id=\"main-answer-list\"><ul><li>Alpha</li><li>Beta</li></ul></div>"
+
+        with store.ScrapeStore(self.path) as scrape_store:
+            with patch.object(scraper, "fetch_html", side_effect=flaky_fetch):
+                with self.assertRaises(RuntimeError):
+                    scraper.collect_word_counts(
+                        date(2024, 1, 5), 5, base_url=base_url, store=scrape_store
+                    )
+                self.assertEqual(len(scrape_store), 2)
+                fetched.clear()
+                crash[0] = False
+                counts, scraped, failures = scraper.collect_word_counts(
+                    date(2024, 1, 5), 5, base_url=base_url, store=scrape_store
+                )
+
+            self.assertEqual(len(fetched), 3)
+            self.assertEqual(counts, {"alpha": 5, "beta": 5})
+            self.assertEqual(len(scraped), 5)
+            self.assertEqual(failures, [])
+            self.assertEqual(
+                scrape_store.word_counts(date(2024, 1, 1), date(2024, 1, 5)),
+                {"alpha": 5, "beta": 5},
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+import io
+import random
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from nytbee_solver import solver, streaming
+
+WORDLIST = ROOT / "nytbee_dict.txt"
+
+
+class TestStreamingSolve(unittest.TestCase):
+    def test_matches_solver_across_chunk_boundaries(self) -> None:
+        rng = random.Random(9)
+        letter_sets = ["mafirng", "aregntp"]
+        letter_sets += ["".join(rng.sample("abcdefghijklmnopqrstuvwxyz", 7)) for _ in range(60)]
+        for letters in letter_sets:
+            self.assertEqual(
+                streaming.solve_streaming(letters, WORDLIST, chunk_size=1000),
+                solver.solve_spelling_bee(letters, WORDLIST),
+                letters,
+            )
+
+    def test_handles_padding_case_and_line_endings(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "words.txt"
+            path.write_bytes(b"Faming\r\n  gamin \nmirage\nfarming\nmam\nmargarin")
+            stats = streaming.StreamStats()
+
+            result = streaming.solve_streaming("mafirng", path, chunk_size=8, stats=stats)
+
+            self.assertEqual(result, solver.solve_spelling_bee("mafirng", path))
+        self.assertEqual(result[0], ["faming", "farming", "gamin", "margarin"])
+        self.assertEqual(stats.bytes_read, 44)
+        self.assertEqual(stats.matches, 4)
+        self.assertGreater(stats.megabytes_per_second, 0)
+
+    def test_iter_chunks_keeps_lines_whole(self) -> None:
+        data = b"alpha\nbeta\ngamma\ndelta"
+        chunks = list(streaming.iter_chunks(io.BytesIO(data), chunk_size=7))
+        self.assertTrue(all(chunk.endswith(b"\n") for chunk in chunks[:-1]))
+        self.assertEqual(chunks[-1], b"delta")
+        self.assertEqual(b"".join(chunks), data)
+
+    def test_rejects_dict_literal_wordlists(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "words.txt"
+            path.write_text("  {'Faming': 1, 'farming': 2}")
+            with self.assertRaisesRegex(ValueError, "dict-literal"):
+                streaming.solve_streaming("mafirng", path)
+
+    def test_iter_chunks_rejects_overlong_lines(self) -> None:
+        chunks = streaming.iter_chunks(io.BytesIO(b"alpha\n" + b"x" * 20 + b"\nbeta"), 8)
+        self.assertEqual(next(chunks), b"alpha\n")
+        with self.assertRaises(ValueError):
+            list(chunks)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+import hashlib
+import sys
+import tempfile
+import unittest
+from datetime import date
+from pathlib import Path
+from unittest.mock import patch
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from nytbee_scrapper.store import ScrapeStore
+from nytbee_solver import extension_index, wordlist
+from nytbee_solver.compiled import wordlist_digest
+
+
+class TestUpdateWordlist(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmpdir = tempfile.TemporaryDirectory()
+        tmp = Path(self._tmpdir.name)
+        self.path = tmp / "nytbee_dict.txt"
+        self.copy = tmp / "extension" / "wordlist" / "nytbee_dict.txt"
+        self.path.write_text("abaci\nbagel\nfaded\n", encoding="utf-8")
+
+    def tearDown(self) -> None:
+        self._tmpdir.cleanup()
+
+    def test_merges_new_words_into_both_copies(self) -> None:
+        update = wordlist.update_wordlist(
+            self.path, ["Cabbage", "bagel", "zigzag", "aardvark", "not a word"], [self.copy]
+        )
+
+        expected = "aardvark\nabaci\nbagel\ncabbage\nfaded\nzigzag\n"
+        self.assertEqual(update.added, ["aardvark", "cabbage", "zigzag"])
+        self.assertEqual(update.word_count, 6)
+        self.assertEqual(self.path.read_text(encoding="utf-8"), expected)
+        self.assertEqual(self.copy.read_text(encoding="utf-8"), expected)
+        self.assertEqual(update.version, wordlist_digest(self.path).hex())
+        self.assertEqual(wordlist.read_wordlist_version(self.copy)["sha256"], update.version)
+        for directory in (self.path.parent, self.copy.parent):
+            self.assertEqual(list(directory.glob(".nytbee_dict.txt.*")), [])
+        self.assertEqual(self.path.stat().st_mode & 0o777, 0o644)
+
+    def test_failed_write_removes_temporary_files(self) -> None:
+        with patch.object(wordlist.shutil, "copyfile", side_effect=OSError("disk full")):
+            with self.assertRaises(OSError):
+                wordlist.update_wordlist(self.path, ["aardvark"], [self.copy])
+        self.assertEqual(self.path.read_text(encoding="utf-8"), "abaci\nbagel\nfaded\n")
+        names = sorted(path.name for path in self.path.parent.iterdir())
+        self.assertEqual(names, ["extension", "nytbee_dict.txt"])
+        self.assertEqual(list(self.copy.parent.iterdir()), [])
+
+    def test_known_words_leave_files_untouched(self) -> None:
+        wordlist.update_wordlist(self.path, [], [self.copy])
+        mtimes = (self.path.stat().st_mtime_ns, self.copy.stat().st_mtime_ns)
+
+        update = wordlist.update_wordlist(self.path, ["faded", "abaci"], [self.copy])
+
+        self.assertEqual(update.added, [])
+        self.assertEqual(update.written, [])
+        self.assertEqual((self.path.stat().st_mtime_ns, self.copy.stat().st_mtime_ns), mtimes)
+        self.assertEqual(update.version, hashlib.sha256(self.path.read_bytes()).hexdigest())
+
+    def test_unsorted_wordlist_is_rebuilt_sorted(self) -> None:
+        self.path.write_text("faded\nabaci\n", encoding="utf-8")
+
+        update = wordlist.update_wordlist(self.path, ["bagel"])
+
+        self.assertEqual(self.path.read_text(encoding="utf-8"), "abaci\nbagel\nfaded\n")
+        self.assertEqual(update.added, ["bagel"])
+
+    def test_cli_reads_only_days_scraped_since_last_build(self) -> None:
+        store_path = self.path.parent / "scrape.sqlite3"
+        with ScrapeStore(store_path) as store:
+            store.record_day(date(2024, 1, 1), "https://example.com/1", ["cabbage"])
+        args = ["--wordlist", str(self.path), "--copy", str(self.copy), "--store", str(store_path)]
+
+        wordlist.main(args)
+        first = wordlist.read_wordlist_version(self.path)
+        with ScrapeStore(store_path) as store:
+            store.record_day(date(2024, 1, 2), "https://example.com/2", ["zigzag"])
+            self.assertEqual(len(store.days_scraped_after(first["store_scraped_through"])), 1)
+        wordlist.main(args)
+
+        self.assertEqual(
+            self.copy.read_text(encoding="utf-8"), "abaci\nbagel\ncabbage\nfaded\nzigzag\n"
+        )
+        self.assertGreater(
+            wordlist.read_wordlist_version(self.path)["store_scraped_through"],
+            first["store_scraped_through"],
+        )
+
+    def test_cli_rebuilds_stale_extension_index(self) -> None:
+        words_path = self.path.parent / "new.txt"
+        words_path.write_text("zigzag\n", encoding="utf-8")
+        index_dir = self.copy.parent / "index"
+        args = ["--wordlist", str(self.path), "--copy", str(self.copy)]
+        args += ["--extension-index", str(index_dir), "--words", str(words_path)]
+
+        wordlist.main(args)
+
+        self.assertTrue(extension_index.extension_index_is_current(self.path, index_dir))
+        index = extension_index.ExtensionIndex(index_dir)
+        self.assertIn("zigzag", [word for _, words in index.shard("z") for word in words])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+import random
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from nytbee_solver import compiled, solver, wordstore
+
+
+def _solve_with_sets(words, letters, required):
+    allowed = set(letters)
+    matches = [
+        word for word in words if len(word) >= 4 and required in word and set(word) <= allowed
+    ]
+    pangrams = [word for word in matches if allowed <= set(word)]
+    return sorted(matches), sorted(pangrams)
+
+
+class TestLetterMask(unittest.TestCase):
+    def test_letter_mask_sets_one_bit_per_letter(self) -> None:
+        self.assertEqual(wordstore.letter_mask("abba"), 0b11)
+        self.assertEqual(wordstore.letter_mask("z"), 1 << 25)
+        self.assertTrue(wordstore.letter_mask("café") & wordstore.IRREGULAR_BIT)
+
+
+class TestWordArray(unittest.TestCase):
+    def test_packs_words_with_masks_and_lengths(self) -> None:
+        words = ["face", "café", "bead", "decafbag"]
+        packed = wordstore.WordArray.from_words(words)
+
+        self.assertEqual(list(packed), words)
+        self.assertEqual(packed[1], "café")
+        self.assertEqual(packed[-1], "decafbag")
+        self.assertEqual(packed[1:3], ["café", "bead"])
+        self.assertEqual(list(packed.lengths), [4, 4, 4, 8])
+        self.assertEqual(list(packed.masks), [wordstore.letter_mask(word) for word in words])
+        with self.assertRaises(IndexError):
+            packed[4]
+
+    def test_selects_by_length_and_mask_without_decoding(self) -> None:
+        packed = wordstore.WordArray.from_words(["face", "bead", "decafbag", "fad"])
+        allowed = wordstore.letter_mask("abcdefg")
+
+        self.assertEqual(list(packed.indices_of_length(5)), [2])
+        within = packed.indices_within(allowed, wordstore.LETTER_BITS["f"], min_length=4)
+        self.assertEqual(packed.select(within), ["face", "decafbag"])
+
+    def test_word_store_views_compiled_wordlist_in_place(self) -> None:
+        store = solver.get_word_store(ROOT / "nytbee_dict.txt")
+        self.assertIsInstance(store.words._owner, compiled.CompiledWordlist)
+        self.assertLess(store.words.nbytes, 20 * len(store))
+
+
+class TestWordStore(unittest.TestCase):
+    def test_matching_agrees_with_set_filtering(self) -> None:
+        words = solver.load_words(ROOT / "nytbee_dict.txt")
+        store = wordstore.WordStore(words)
+        self.assertEqual(len(store), len(words))
+        random.seed(7)
+        alphabet = "abcdefghijklmnopqrstuvwxyz"
+        for _ in range(25):
+            letters = "".join(random.sample(alphabet, 7))
+            self.assertEqual(
+                store.matching(letters, letters[0]),
+                _solve_with_sets(words, letters, letters[0]),
+            )
+
+    def test_matching_handles_non_ascii_words(self) -> None:
+        store = wordstore.WordStore(["café", "face", "decafbag"])
+        self.assertEqual(store.matching("éacfbge", "a"), (["café", "face"], []))
+        self.assertEqual(store.matching("abgcfed", "a"), (["decafbag", "face"], ["decafbag"]))
+
+    def test_get_word_store_reloads_changed_file(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "words.txt"
+            path.write_text("face\n")
+            first = solver.get_word_store(path)
+            self.assertIs(solver.get_word_store(path), first)
+            path.write_text("face\nbead\n")
+            second = solver.get_word_store(path)
+        self.assertEqual(len(second), 2)
+        # The replaced store's memory map is released rather than leaked.
+        self.assertTrue(first.words._owner._buffer.closed)
+
+
+class TestSolveMany(unittest.TestCase):
+    def setUp(self) -> None:
+        random.seed(13)
+        alphabet = "abcdefghijklmnopqrstuvwxyz"
+        self.letter_sets = ["".join(random.sample(alphabet, 7)) for _ in range(40)]
+        self.letter_sets.append("éacfbge")
+        self.path = ROOT / "nytbee_dict.txt"
+
+    def test_solve_many_matches_solve_spelling_bee(self) -> None:
+        expected = [solver.solve_spelling_bee(letters, self.path) for letters in self.letter_sets]
+        self.assertEqual(solver.solve_many(self.letter_sets, self.path), expected)
+        with patch.object(wordstore, "_numpy", return_value=None):
+            self.assertEqual(solver.solve_many(self.letter_sets, self.path), expected)
+
+    @unittest.skipIf(wordstore._numpy() is None, "numpy is not installed")
+    def test_vectorized_matching_handles_non_ascii_words(self) -> None:
+        store = wordstore.WordStore(["café", "face", "decafbag"])
+        self.assertEqual(
+            store.matching_many([("éacfbge", "a"), ("abgcfed", "a")], chunk_size=1),
+            [(["café", "face"], []), (["decafbag", "face"], ["decafbag"])],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()